@@ -6,49 +6,80 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
-import aiohttp  # Add this import
 from homeassistant.const import Platform
+from homeassistant.helpers import config_validation as cv
 
 # Updated import name
 from .aux_cloud import AuxCloudAPI
 from .const import CONF_EMAIL, CONF_PASSWORD, CONF_REGION, DOMAIN
+from .coordinator import AuxCloudDataUpdateCoordinator
+from .services import async_setup_services
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
-
-PLATFORMS: list[Platform] = [Platform.CLIMATE, Platform.SENSOR, Platform.NUMBER, Platform.SELECT]
+    from homeassistant.helpers.typing import ConfigType
+
+PLATFORMS: list[Platform] = [
+    Platform.CLIMATE,
+    Platform.SENSOR,
+    Platform.NUMBER,
+    Platform.SELECT,
+]
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa: ARG001
+    """Set up the Tornado AC services."""
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up AUX AC from a config entry."""
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN].setdefault(entry.entry_id, {})
 
-    # Create a shared session for the entry
-    session = aiohttp.ClientSession()
-    hass.data[DOMAIN][entry.entry_id]["session"] = session
-
     client = AuxCloudAPI(
         email=entry.data[CONF_EMAIL],
         password=entry.data[CONF_PASSWORD],
         region=entry.data[CONF_REGION],
-        session=session,
     )
+    # All entries share one pooled session, closed with the last entry
+    client.retain_shared_resources()
+    coordinator = AuxCloudDataUpdateCoordinator(hass, client)
 
     try:
-        await client.login()
-        await client.refresh()
+        if await coordinator.async_load_devices():
+            # Entities restore their last state, so the first poll (which
+            # also logs in) does not have to block setup.
+            entry.async_create_background_task(
+                hass, coordinator.async_refresh(), f"{DOMAIN} first refresh"
+            )
+        else:
+            try:
+                await client.login()
+                await client.refresh()
+            except Exception:
+                _LOGGER.exception("Failed to connect to AUX AC")
+                await client.cleanup()
+                return False
+
+            await coordinator.async_config_entry_first_refresh()
+
+        hass.data[DOMAIN][entry.entry_id]["client"] = client
+        hass.data[DOMAIN][entry.entry_id]["coordinator"] = coordinator
+
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     except Exception:
+        # Stop the coordinator's timers and release the shared session, or
+        # they outlive every entry
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+        await coordinator.async_shutdown()
         await client.cleanup()
-        await session.close()
-        _LOGGER.exception("Failed to connect to AUX AC")
-        return False
-
-    hass.data[DOMAIN][entry.entry_id]["client"] = client
-
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        raise
     return True
 
 
@@ -58,12 +89,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok:
         entry_data = hass.data[DOMAIN].get(entry.entry_id, {})
         client = entry_data.get("client")
-        session = entry_data.get("session")
 
         if client:
             await client.cleanup()
-        if session and not session.closed:
-            await session.close()
 
         hass.data[DOMAIN].pop(entry.entry_id, None)
     return unload_ok
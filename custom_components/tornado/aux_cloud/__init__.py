@@ -4,25 +4,40 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import functools
 import hashlib
 import json
 import logging
 import socket
 import time
+from collections import Counter
 from typing import TYPE_CHECKING, Any, ClassVar
 
 import aiohttp
-from async_lru import alru_cache
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
-
+    from collections.abc import Callable, Collection, Mapping, Sequence
+
+from .cache import cached_method
+from .endpoints import EndpointIndex
+from .health import (
+    DEVICE_ERROR,
+    DEVICE_OK,
+    DEVICE_PARTIAL,
+    DEVICE_TIMEOUT,
+    DeviceHealth,
+)
+from .pool import PoolStats
+from .responses import (
+    ControlResponse,
+    DeviceListResponse,
+    EventResponse,
+    FamilyListResponse,
+    LoginResponse,
+)
+from .templates import RequestTemplate, slot
+from .topology import topology_fingerprint
+from .tracing import TRACER
 from .util import encrypt_aes_cbc_zero_padding
 
 _LOGGER = logging.getLogger(__name__)
@@ -67,6 +82,36 @@ SPOOF_SYSTEM = "android"
 SPOOF_APP_PLATFORM = "android"
 API_SERVER_URL_EU = "https://app-service-deu-f0e9ebbb.smarthomecs.de"
 API_SERVER_URL_USA = "https://app-service-usa-fd7cc04c.smarthomecs.com"
+# Seconds one device may take per poll, retries included
+DEVICE_POLL_DEADLINE = 10.0
+# Room temperature, read with a dedicated query instead of by name
+AMBIENT_PARAM = "envtemp"
+# Queries that can read the room temperature, probed per product
+AMBIENT_ROUTE_SENSOR = "temperaturesensor"
+AMBIENT_ROUTE_SDKCONTROL = "sdkcontrol"
+AMBIENT_ROUTES = (AMBIENT_ROUTE_SENSOR, AMBIENT_ROUTE_SDKCONTROL)
+# Room temperatures in °C the sensor route may plausibly report
+AMBIENT_TEMPERATURE_RANGE = (-40.0, 60.0)
+# Bulk writes in flight at once, leaving connections free for polling
+BULK_SET_CONCURRENCY = 8
+# Seconds the family list and shared-device checks are cached per client
+DISCOVERY_CACHE_TTL = 3600
+# Pre-serialized request bodies, one per operation and device
+OP_QUERY_STATE = "querystate"
+OP_QUERY_TEMPERATURE = "temperaturesensor"
+OP_CONTROL = "sdkcontrol"
+OP_CONTROL_AMBIENT = "sdkcontrol_ambient"
+# Device keys the KeyValueControl template is built from
+CONTROL_IDENTITY_KEYS = (
+    "endpointId",
+    "productId",
+    "mac",
+    "devicetypeFlag",
+    "devSession",
+    "cookie",
+)
+# Listing keys kept per device; the rest of the cloud payload is dropped
+LISTING_KEYS = (*CONTROL_IDENTITY_KEYS, "friendlyName")
 
 
 class AuxCloudError(Exception):
@@ -89,7 +134,37 @@ class AuxCloudConnectionError(AuxCloudError):
 def create_retry_decorator(
     max_attempts: int = 3,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
-    """Create a retry decorator with specified parameters."""
+    """
+    Create a retry decorator with specified parameters.
+
+    tenacity is only imported, and the retrying wrapper only built, on the
+    first call of the decorated coroutine, so loading the client stays cheap.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        retrying: Callable[..., Any] | None = None
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            nonlocal retrying
+            if retrying is None:
+                retrying = _build_retry(max_attempts)(func)
+            return await retrying(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _build_retry(max_attempts: int) -> Callable[[Callable[..., Any]], Any]:
+    """Return the tenacity decorator used by ``create_retry_decorator``."""
+    from tenacity import (
+        retry,
+        retry_if_exception_type,
+        stop_after_attempt,
+        wait_exponential,
+    )
+
     return retry(
         retry=retry_if_exception_type(
             (
@@ -117,6 +192,8 @@ class AuxCloudAPI:
     _shared_connector_lock: ClassVar[asyncio.Lock] = asyncio.Lock()
     _shared_session: ClassVar[aiohttp.ClientSession | None] = None
     _shared_session_lock: ClassVar[asyncio.Lock] = asyncio.Lock()
+    # Clients holding on to the shared session, see retain_shared_resources
+    _shared_users: ClassVar[int] = 0
 
     @classmethod
     async def get_shared_connector(cls) -> aiohttp.TCPConnector:
@@ -153,6 +230,7 @@ class AuxCloudAPI:
                         total=30, connect=10, sock_connect=10, sock_read=10
                     ),
                     raise_for_status=True,
+                    trace_configs=[PoolStats.trace_config()],
                 )
                 _LOGGER.info(
                     "Created new shared aiohttp session: %s", id(cls._shared_session)
@@ -173,36 +251,80 @@ class AuxCloudAPI:
         self.session = session
         # If session is provided externally, we don't own it
         self._session_owner = session is None
+        self._retains_shared = False
         self.data: dict[str, Any] = {}
+        # Devices of the last listing, once per endpointId across families
+        self.endpoints = EndpointIndex()
         self.timeout = aiohttp.ClientTimeout(
             total=30, connect=10, sock_connect=10, sock_read=10
         )
+        self.device_deadline = DEVICE_POLL_DEADLINE
+        self.health = DeviceHealth()
+        # productId -> fastest working room temperature route
+        self.ambient_routes: dict[str | None, str] = {}
+        # (operation, endpointId) -> request body template
+        self._templates: dict[tuple[str, str], RequestTemplate] = {}
+        # Fingerprint of the families and devices last listed
+        self.topology: str | None = None
+        # Whether the last listing got an answer for every family and share
+        self.listing_complete = False
+        # Requests this client sent, tagged so the shared session counts
+        # them apart from those of other config entries
+        self.pool_stats = PoolStats()
         _LOGGER.info(
             "Initialized AuxCloudAPI with email: %s, region: %s", email, region
         )
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get aiohttp client session."""
-        if self._session_owner:
-            if self.session is None or self.session.closed:
-                if getattr(self, "_cleaned_up", False):
-                    msg = "Cannot create new session after cleanup"
-                    raise RuntimeError(msg)
-                self.session = await self.get_shared_session()
-                _LOGGER.debug("Using shared session: %s", id(self.session))
+        """Get the session given at construction, else the shared one."""
+        if not self._session_owner and self.session is not None:
             return self.session
-
-        return await self.get_shared_session()
+        if self.session is None or self.session.closed:
+            if getattr(self, "_cleaned_up", False):
+                msg = "Cannot create new session after cleanup"
+                raise RuntimeError(msg)
+            self.session = await self.get_shared_session()
+            _LOGGER.debug("Using shared session: %s", id(self.session))
+        return self.session
 
     async def cleanup(self) -> None:
         """Clean up resources."""
         # We never close the session in instance cleanup
         # External sessions are managed by their owners
-        # Shared sessions are managed by cleanup_shared_resources
+        # Shared sessions are closed with the last client retaining them
 
         # Just clear the reference and mark as cleaned up
         self.session = None
         self._cleaned_up = True
+        if self._retains_shared:
+            self._retains_shared = False
+            info = self.pool_stats.info()
+            _LOGGER.debug(
+                "Releasing shared session after %d requests on %d connections, "
+                "%d reused",
+                info.requests,
+                info.created,
+                info.reused,
+            )
+            await self._release_shared_resources()
+
+    def retain_shared_resources(self) -> None:
+        """
+        Keep the shared session open until this client is cleaned up.
+
+        Long-lived clients, one per config entry, retain it; the last one
+        cleaned up closes it, so all entries share one connection pool.
+        """
+        if not self._retains_shared:
+            self._retains_shared = True
+            type(self)._shared_users += 1
+
+    @classmethod
+    async def _release_shared_resources(cls) -> None:
+        """Count one retaining client less; close the session after the last."""
+        cls._shared_users -= 1
+        if cls._shared_users == 0:
+            await cls.cleanup_shared_resources()
 
     @classmethod
     async def cleanup_shared_resources(cls) -> None:
@@ -258,7 +380,8 @@ class AuxCloudAPI:
             "userid": getattr(self, "userid", ""),
             **kwargs,
         }
-        _LOGGER.debug("Generated headers: %s", headers)
+        if TRACER.enabled:
+            TRACER.event("headers", extra=tuple(kwargs))
         return headers
 
     def _get_directive_header(
@@ -286,7 +409,39 @@ class AuxCloudAPI:
             "messageId": f"{message_id_prefix}-{timestamp}",
             **kwargs,
         }
-        _LOGGER.debug("Generated directive header: %s", header)
+        if TRACER.enabled:
+            TRACER.event("directive_header", namespace=namespace, name=name)
+        return header
+
+    def _request_template(
+        self,
+        operation: str,
+        endpoint_id: str,
+        key: tuple[Any, ...],
+        build: Callable[[], dict[str, Any]],
+    ) -> RequestTemplate:
+        """
+        Return the body template of an operation on a device.
+
+        The template is built once and reused while ``key``, the values its
+        invariant parts were built from, stays the same.
+        """
+        template = self._templates.get((operation, endpoint_id))
+        if template is None or template.key != key:
+            template = RequestTemplate(build(), key)
+            self._templates[operation, endpoint_id] = template
+            if TRACER.enabled:
+                TRACER.event("request_template", op=operation, endpoint=endpoint_id)
+        return template
+
+    def _message_header(
+        self, namespace: str, name: str, **kwargs: str
+    ) -> dict[str, str]:
+        """Return a directive header with a slot for its message id."""
+        header = self._get_directive_header(
+            namespace=namespace, name=name, message_id_prefix="", **kwargs
+        )
+        header["messageId"] = slot("messageId")
         return header
 
     async def login(
@@ -351,59 +506,143 @@ class AuxCloudAPI:
                 AES_INITIAL_VECTOR, md5_hash, json_payload.encode()
             ),
             headers=self._get_headers(timestamp=f"{current_time}", token=token),
+            trace_request_ctx=self.pool_stats,
         ) as resp:
-            data = await resp.text()
-            json_data = json.loads(data)
-
-            if "status" in json_data and json_data["status"] == 0:
-                self.loginsession = json_data["loginsession"]
-                self.userid = json_data["userid"]
+            response = LoginResponse.decode(await resp.read())
+
+            if response.ok:
+                if response.userid != getattr(self, "userid", None):
+                    # Another account: its families are not the cached ones
+                    self.invalidate_discovery()
+                self.loginsession = response.loginsession
+                self.userid = response.userid
                 _LOGGER.info("Login successful for email: %s", email)
                 return True
 
-            error_msg = f"Login failed: {json_data.get('msg', data)}"
+            error_msg = f"Login failed: {response.msg or response.text}"
             raise AuxCloudAuthError(error_msg)
 
-    async def get_devices(self) -> list[dict[str, Any]]:
-        """Get all devices across all families."""
+    def invalidate_discovery(self) -> None:
+        """Drop the cached family list and shared-device checks."""
+        self.list_families.cache_clear()
+        self._has_shared_devices.cache_clear()
+
+    async def get_devices(
+        self, wanted_params: Mapping[str, Collection[str]] | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Get all devices across all families.
+
+        Args:
+            wanted_params: Parameters to read per endpoint id; devices not
+                listed, or all devices when None, get every parameter
+
+        Returns:
+            List of device dictionaries, one per endpointId: a unit both
+            owned and shared, or listed in several families, is returned
+            once, preferring the owned listing. ``listing_complete`` tells
+            whether every family's shares could be checked; when not, the
+            shares of the families that failed are missing
+
+        """
         _LOGGER.debug("Fetching all devices")
-        all_devices = []
+        listed: dict[str, list[dict[str, Any]]] = {}
+        complete = True
         try:
             # First get all families
             families = await self.list_families()
-            _LOGGER.debug("Fetched families: %s", families)
+            if TRACER.enabled:
+                TRACER.event("families", count=len(families))
 
-            # Then get devices for each family
+            # Owned devices of every family first, so they win over shares
             for family in families:
                 family_id = family["familyid"]
-                # Get regular devices
-                devices = await self.list_devices(family_id)
-                _LOGGER.debug("Fetched devices for family %s: %s", family_id, devices)
-                if devices:
-                    all_devices.extend(devices)
+                devices = await self.list_devices(
+                    family_id, wanted_params=wanted_params
+                )
+                if TRACER.enabled:
+                    TRACER.event("family_devices", family=family_id, count=len(devices))
+                listed[family_id] = list(devices)
 
+            for family in families:
+                family_id = family["familyid"]
                 # Check for shared devices using cached method
-                if await self._has_shared_devices(family_id):
-                    shared_devices = await self.list_devices(family_id, shared=True)
-                    _LOGGER.debug(
-                        "Fetched shared devices for family %s: %s",
+                try:
+                    has_shared = await self._has_shared_devices(family_id)
+                except (AuxCloudError, aiohttp.ClientError, TimeoutError) as ex:
+                    # Keep the last shared listing, and let nobody take the
+                    # shares missing from this poll for gone
+                    _LOGGER.warning(
+                        "Error checking shared devices of family %s: %s",
                         family_id,
-                        shared_devices,
+                        ex,
                     )
-                    if shared_devices:
-                        all_devices.extend(shared_devices)
+                    complete = False
+                    continue
+                if has_shared:
+                    shared_devices = await self.list_devices(
+                        family_id, shared=True, wanted_params=wanted_params
+                    )
+                    if TRACER.enabled:
+                        TRACER.event(
+                            "family_devices",
+                            family=family_id,
+                            count=len(shared_devices),
+                            shared=True,
+                        )
+                    listed[family_id].extend(shared_devices)
                 else:
+                    self.endpoints.update(family_id, [], shared=True)
                     _LOGGER.debug(
                         "No shared devices found for family %s (cached)", family_id
                     )
 
+        except AuxCloudApiError:
+            _LOGGER.exception("Error getting devices")
+            # A family may be gone: list them again on the next poll
+            self.invalidate_discovery()
+            raise
         except Exception:
             _LOGGER.exception("Error getting devices")
             raise
 
-        return all_devices
+        self.endpoints.retain_families(listed)
+        self.listing_complete = complete
+        if complete:
+            self._update_topology(listed)
+        if TRACER.enabled:
+            TRACER.event("pool", **self.pool_stats.info()._asdict())
+        return [device for devices in listed.values() for device in devices]
+
+    def _update_topology(self, listed: Mapping[str, Sequence[dict[str, Any]]]) -> None:
+        """
+        Fingerprint the devices listed per family and act on changes.
+
+        State kept for devices that are gone is dropped. After a change,
+        the cached family list and shared-device checks are dropped as
+        well, so new families and shares show up on the next poll instead
+        of after the cache TTL.
+        """
+        topology = topology_fingerprint(listed)
+        if topology == self.topology:
+            return
+        previous, self.topology = self.topology, topology
+
+        for key in [key for key in self._templates if key[1] not in self.endpoints]:
+            del self._templates[key]
+        self.health.retain(self.endpoints)
+        if previous is not None:
+            _LOGGER.info("Devices or families changed, refreshing discovery")
+            self.invalidate_discovery()
+        if TRACER.enabled:
+            TRACER.event(
+                "topology",
+                families=len(listed),
+                devices=len(self.endpoints),
+                duplicates=sum(map(len, listed.values())) - len(self.endpoints),
+            )
 
-    @alru_cache(maxsize=1, ttl=3600)  # Cache 1 result for 1 hour
+    @cached_method(ttl=DISCOVERY_CACHE_TTL)
     @create_retry_decorator()
     async def list_families(self, retry_count: int = 0) -> list[dict[str, Any]]:
         """Get list of all families with retry."""
@@ -419,30 +658,30 @@ class AuxCloudAPI:
         async with session.post(
             f"{self.url}/appsync/group/member/getfamilylist",
             headers=self._get_headers(),
+            trace_request_ctx=self.pool_stats,
         ) as response:
-            data = await response.text()
+            raw = await response.read()
             try:
-                json_data = json.loads(data)
-            except json.JSONDecodeError as ex:
+                families = FamilyListResponse.decode(raw)
+            except ValueError as ex:
                 msg = f"Failed to decode JSON: {ex}"
                 _LOGGER.exception(msg)
-                json_data = {"status": -1, "msg": data}
+                families = FamilyListResponse(raw, {"status": -1})
 
-            if "status" in json_data:
-                if json_data["status"] == 0:
+            if families.status is not None:
+                if families.ok:
                     self.data = {}
-                    for family in json_data["data"]["familyList"]:
+                    for family in families.families:
                         self.data[family["familyid"]] = {
                             "id": family["familyid"],
                             "name": family["name"],
                             "rooms": [],
                             "devices": [],
                         }
-                    _LOGGER.debug(
-                        "Fetched family list: %s", json_data["data"]["familyList"]
-                    )
-                    return json_data["data"]["familyList"]
-                if json_data["status"] == self.LOGIN_VALIDATION_FAILED:
+                    if TRACER.enabled:
+                        TRACER.event("family_list", count=len(self.data))
+                    return families.families
+                if families.status == self.LOGIN_VALIDATION_FAILED:
                     if retry_count >= max_retries:
                         msg = "Login validation failed after retries"
                         _LOGGER.error(msg)
@@ -453,40 +692,41 @@ class AuxCloudAPI:
                     # Retry the request after re-login
                     return await self.list_families(retry_count + 1)
 
-            msg = f"Failed to get families list: {data}"
+            msg = f"Failed to get families list: {families.text}"
             _LOGGER.error(msg)
             raise AuxCloudApiError(msg)
 
-    @alru_cache(maxsize=1, ttl=3600)  # Cache 1 result for 1 hour
+    @cached_method(ttl=DISCOVERY_CACHE_TTL)
     async def _has_shared_devices(self, family_id: str) -> bool:
-        """Check if family has any shared devices with 1-hour cache."""
+        """
+        Check if family has any shared devices, cached per family.
+
+        Errors are raised, not cached, so a failed check is not mistaken
+        for a family without shares.
+        """
         _LOGGER.debug("Checking for shared devices in family: %s", family_id)
-        try:
-            shared_devices = await self.list_devices(family_id, shared=True)
-            _LOGGER.debug(
-                "Shared devices for family %s: %s",
-                family_id,
-                shared_devices,
-            )
-            return len(shared_devices) > 0
-        except AuxCloudApiError as ex:
-            _LOGGER.warning("API error checking shared devices: %s", ex)
-            return False
-        except AuxCloudAuthError as ex:
-            _LOGGER.warning("Authentication error checking shared devices: %s", ex)
-            return False
-        except aiohttp.ClientError as ex:
-            _LOGGER.warning("Network error checking shared devices: %s", ex)
-            return False
+        shared_devices = await self.list_devices(family_id, shared=True)
+        return len(shared_devices) > 0
 
     @create_retry_decorator()
     async def list_devices(
-        self, family_id: str, *, shared: bool = False
+        self,
+        family_id: str,
+        *,
+        shared: bool = False,
+        wanted_params: Mapping[str, Collection[str]] | None = None,
     ) -> list[dict[str, Any]]:
-        """Get devices for a specific family with retry."""
-        _LOGGER.debug(
-            "Fetching devices for family_id: %s, shared: %s", family_id, shared
-        )
+        """
+        List and poll the owned or shared devices of a family.
+
+        The listing is fed to the endpoint index first; units another
+        listing already holds (an owned copy of a shared unit, or the same
+        unit in an earlier family) are neither polled nor returned. Only the
+        ``LISTING_KEYS`` of each device are kept from the cloud payload; the
+        polled state and params go into the returned copies.
+        """
+        if TRACER.enabled:
+            TRACER.event("list_devices", family=family_id, shared=shared)
         session = await self._get_session()
         device_endpoint = (
             "dev/query?action=select"
@@ -497,17 +737,21 @@ class AuxCloudAPI:
             f"{self.url}/appsync/group/{device_endpoint}",
             data='{"pids":[]}' if not shared else '{"endpointId":""}',
             headers=self._get_headers(familyid=family_id),
+            trace_request_ctx=self.pool_stats,
         ) as response:
-            data = await response.text()
-            json_data = json.loads(data)
-
-            if "status" in json_data and json_data["status"] == 0:
-                if "endpoints" in json_data["data"]:
-                    devices = json_data["data"]["endpoints"]
-                elif "shareFromOther" in json_data["data"]:
-                    devices = [
-                        dev["devinfo"] for dev in json_data["data"]["shareFromOther"]
-                    ]
+            listing = await DeviceListResponse.decode_async(await response.read())
+
+            if listing.ok:
+                listed = [
+                    {key: dev[key] for key in LISTING_KEYS if key in dev}
+                    for dev in listing.endpoints
+                ]
+                self.endpoints.update(family_id, listed, shared=shared)
+                devices = [
+                    dev
+                    for dev in listed
+                    if self.endpoints.get(dev["endpointId"]).device is dev
+                ]
 
                 # Initialize family data structure if needed
                 if family_id not in self.data:
@@ -518,52 +762,109 @@ class AuxCloudAPI:
                         "devices": [],
                     }
 
-                # Process devices and update internal cache
-                processed_devices = []
-                for dev in devices:
-                    # Create tasks for all API calls for each device
-                    state_task = self.query_device_state(
-                        dev["endpointId"], dev["devSession"]
+                # Poll the devices concurrently, each within its own deadline
+                polled = await asyncio.gather(
+                    *(
+                        self._poll_device(
+                            dev,
+                            None
+                            if wanted_params is None
+                            else wanted_params.get(dev["endpointId"]),
+                        )
+                        for dev in devices
                     )
-                    params_task = self.get_device_params(dev)
-                    ambient_task = self.get_device_params(dev, ["mode"])
-                    results = await asyncio.gather(
-                        state_task, params_task, ambient_task, return_exceptions=True
+                )
+                if TRACER.enabled:
+                    TRACER.event(
+                        "device_health",
+                        family=family_id,
+                        **Counter(
+                            self.health.status[dev["endpointId"]] for dev in devices
+                        ),
                     )
 
-                    state_result, params_result, ambient_result = results
-
-                    # Handle results, checking for exceptions
-                    if not isinstance(state_result, Exception):
-                        dev["state"] = state_result["data"][0]["state"]
-
-                    if not isinstance(params_result, Exception):
-                        dev["params"] = params_result
+                self.data[family_id]["devices"] = self.endpoints.family_devices(
+                    family_id
+                )
+                return polled
 
-                    if not isinstance(ambient_result, Exception) and "params" in dev:
-                        dev["params"]["envtemp"] = ambient_result["envtemp"]
-                    _LOGGER.debug("Processed device: %s", dev)
-                    processed_devices.append(dev)
+            msg = f"Failed to get devices: {listing.text}"
+            raise AuxCloudApiError(msg)
 
-                # Update internal cache - replace existing devices for this family
-                if not shared:
-                    self.data[family_id]["devices"] = processed_devices
-                else:
-                    # For shared devices, append to existing devices
-                    existing_ids = {
-                        d["endpointId"] for d in self.data[family_id]["devices"]
-                    }
-                    new_devices = [
-                        d
-                        for d in processed_devices
-                        if d["endpointId"] not in existing_ids
-                    ]
-                    self.data[family_id]["devices"].extend(new_devices)
+    async def _poll_device(
+        self, dev: dict[str, Any], wanted: Collection[str] | None = None
+    ) -> dict[str, Any]:
+        """
+        Read the state and params of one device within the poll deadline.
 
-                return processed_devices
+        Only the ``wanted`` params are requested, all of them when None; the
+        ambient temperature is queried only when ``envtemp`` is wanted.
+        Quarantined devices are skipped until their re-probe time.
 
-            msg = f"Failed to get devices: {data}"
-            raise AuxCloudApiError(msg)
+        Returns a copy of the listed device with ``state`` and ``params``
+        added; the listing itself is left as is. A device whose params
+        could not be read is returned without ``params``.
+        """
+        endpoint_id = dev["endpointId"]
+        if not self.health.should_poll(endpoint_id, time.monotonic()):
+            return dev
+
+        if wanted is None:
+            names: list[str] = []
+            read_params = read_ambient = True
+        else:
+            names = sorted(name for name in wanted if name != AMBIENT_PARAM)
+            read_params = bool(names)
+            read_ambient = AMBIENT_PARAM in wanted
+        try:
+            async with asyncio.timeout(self.device_deadline):
+                results = await asyncio.gather(
+                    self.query_device_state(endpoint_id, dev["devSession"]),
+                    self.get_device_params(dev, names)
+                    if read_params
+                    else asyncio.sleep(0, {}),
+                    self.query_ambient_temperature(dev)
+                    if read_ambient
+                    else asyncio.sleep(0, {}),
+                    return_exceptions=True,
+                )
+        except TimeoutError:
+            self.health.record(endpoint_id, DEVICE_TIMEOUT, time.monotonic())
+            return dev
+
+        state_result, params_result, ambient_result = results
+        dev = dict(dev)
+
+        # Handle results, checking for exceptions
+        if not isinstance(state_result, Exception):
+            dev["state"] = state_result["data"][0]["state"]
+
+        if not isinstance(params_result, Exception):
+            dev["params"] = params_result
+
+        if (
+            not isinstance(ambient_result, Exception)
+            and AMBIENT_PARAM in ambient_result
+            and "params" in dev
+        ):
+            dev["params"][AMBIENT_PARAM] = ambient_result[AMBIENT_PARAM]
+
+        if "params" not in dev:
+            status = DEVICE_ERROR
+        elif any(isinstance(result, Exception) for result in results):
+            status = DEVICE_PARTIAL
+        else:
+            status = DEVICE_OK
+        self.health.record(endpoint_id, status, time.monotonic())
+        if TRACER.enabled:
+            TRACER.event(
+                "device",
+                endpoint=endpoint_id,
+                state=dev.get("state"),
+                params=len(dev.get("params", ())),
+                status=status,
+            )
+        return dev
 
     async def get_device_params(
         self, device: dict[str, Any], params: list[str] | None = None
@@ -581,14 +882,11 @@ class AuxCloudAPI:
         """
         if params is None:
             params = []
-        _LOGGER.debug(
-            "Fetching device parameters for device: %s, params = %s", device, params
-        )
-        return await self._act_device_params(device, "get", params)
+        return dict(await self._act_device_params(device, "get", params))
 
     async def set_device_params(
         self, device: dict[str, Any], values: dict[str, Any]
-    ) -> dict[str, Any]:
+    ) -> Mapping[str, Any]:
         """
         Set device parameters.
 
@@ -597,114 +895,246 @@ class AuxCloudAPI:
             values: Dictionary of parameter names and values to set
 
         Returns:
-            Dictionary of updated parameter values
+            Mapping of updated parameter values, decoded on first access
 
         """
         _LOGGER.info(
-            "Setting device parameters for device: %s with values: %s", device, values
+            "Setting device parameters for device %s: %s", device["endpointId"], values
         )
         params = list(values.keys())
         vals = [[{"val": val, "idx": 1}] for val in values.values()]
         return await self._act_device_params(device, "set", params, vals)
 
+    async def bulk_set_device_params(
+        self,
+        devices: Sequence[Any],
+        values: dict[str, Any],
+        *,
+        concurrency: int = BULK_SET_CONCURRENCY,
+    ) -> list[Mapping[str, Any] | BaseException]:
+        """
+        Set the same parameters on many devices.
+
+        The params and vals lists are built once and shared by all writes,
+        of which at most ``concurrency`` are in flight at a time.
+
+        Args:
+            devices: Device information dictionaries
+            values: Dictionary of parameter names and values to set
+            concurrency: Maximum number of writes in flight
+
+        Returns:
+            Per device, in the order given, the updated parameter values or
+            the exception that failed its write
+
+        """
+        _LOGGER.info(
+            "Setting device parameters for %d devices: %s", len(devices), values
+        )
+        params = list(values.keys())
+        vals = [[{"val": val, "idx": 1}] for val in values.values()]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def set_params(device: Any) -> Mapping[str, Any]:
+            async with semaphore:
+                return await self._act_device_params(device, "set", params, vals)
+
+        return await asyncio.gather(
+            *(set_params(device) for device in devices), return_exceptions=True
+        )
+
     @create_retry_decorator()
     async def query_device_state(
         self, device_id: str, dev_session: str
     ) -> dict[str, Any]:
         """Query device state with retry."""
-        _LOGGER.debug("Querying device state for device_id: %s", device_id)
         session = await self._get_session()
         timestamp = int(time.time())
-        data = {
-            "directive": {
-                "header": self._get_directive_header(
-                    namespace="DNA.QueryState",
-                    name="queryState",
-                    messageType="controlgw.batch",
-                    message_id_prefix=self.userid,
-                    timestamp=f"{timestamp}",
-                ),
-                "payload": {
-                    "studata": [{"did": device_id, "devSession": dev_session}],
-                    "msgtype": "batch",
-                },
-            }
-        }
-
-        _LOGGER.debug("Sending query state request with data: %s", data)
+        template = self._request_template(
+            OP_QUERY_STATE,
+            device_id,
+            (dev_session,),
+            lambda: {
+                "directive": {
+                    "header": self._message_header(
+                        namespace="DNA.QueryState",
+                        name="queryState",
+                        messageType="controlgw.batch",
+                        timestamp=slot("timestamp"),
+                    ),
+                    "payload": {
+                        "studata": [{"did": device_id, "devSession": dev_session}],
+                        "msgtype": "batch",
+                    },
+                }
+            },
+        )
 
         async with session.post(
             f"{self.url}/device/control/v2/querystate",
-            data=json.dumps(data, separators=(",", ":")),
+            data=template.render(
+                messageId=f"{self.userid}-{timestamp}", timestamp=f"{timestamp}"
+            ),
             headers=self._get_headers(),
+            trace_request_ctx=self.pool_stats,
         ) as response:
-            data = await response.text()
-            _LOGGER.debug("Received response: %s", data)
-            json_data = json.loads(data)
+            state = EventResponse.decode(await response.read())
 
-            if (
-                "event" in json_data
-                and "payload" in json_data["event"]
-                and json_data["event"]["payload"]["status"] == 0
-            ):
-                _LOGGER.debug(
-                    "Queried device state for device_id %s: %s",
-                    device_id,
-                    json_data["event"]["payload"],
-                )
-                return json_data["event"]["payload"]
+            if state.ok:
+                if TRACER.enabled:
+                    TRACER.event("query_state", endpoint=device_id, size=len(state.raw))
+                return state.payload
 
-            _LOGGER.error("Failed to query device state: %s", data)
-            msg = f"Failed to query device state: {data}"
+            _LOGGER.error("Failed to query device state: %s", state.text)
+            msg = f"Failed to query device state: {state.text}"
             raise AuxCloudApiError(msg)
 
+    async def query_ambient_temperature(self, dev: dict[str, Any]) -> dict[str, Any]:
+        """
+        Read the room temperature of a device as ``{"envtemp": tenths}``.
+
+        The first read for a product races every route and remembers the
+        first one to answer; later reads use that route only. If it fails,
+        the route is forgotten so the next read probes again.
+
+        Args:
+            dev: Device information dictionary
+
+        Returns:
+            Dictionary with the room temperature in tenths of a degree
+
+        """
+        product_id = dev.get("productId")
+        if (route := self.ambient_routes.get(product_id)) is None:
+            return await self._probe_ambient_route(dev)
+        try:
+            return await self._read_ambient(dev, route)
+        except Exception:
+            self.ambient_routes.pop(product_id, None)
+            raise
+
+    async def _probe_ambient_route(self, dev: dict[str, Any]) -> dict[str, Any]:
+        """Query all ambient routes at once and keep the first that answers."""
+        pending = {
+            asyncio.create_task(self._read_ambient(dev, route)): route
+            for route in AMBIENT_ROUTES
+        }
+        start = time.perf_counter()
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    route = pending.pop(task)
+                    if (error := task.exception()) is not None:
+                        _LOGGER.debug(
+                            "Ambient route %s failed for product %s: %s",
+                            route,
+                            dev.get("productId"),
+                            error,
+                        )
+                        continue
+                    elapsed = time.perf_counter() - start
+                    # A route that fell back while probing already set its own
+                    route = self.ambient_routes.setdefault(dev.get("productId"), route)
+                    _LOGGER.debug(
+                        "Using ambient route %s for product %s (%.3f s)",
+                        route,
+                        dev.get("productId"),
+                        elapsed,
+                    )
+                    if TRACER.enabled:
+                        TRACER.event(
+                            "ambient_route",
+                            product=dev.get("productId"),
+                            route=route,
+                            elapsed=elapsed,
+                        )
+                    return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        msg = f"No ambient temperature route works for {dev['endpointId']}"
+        raise AuxCloudApiError(msg)
+
+    async def _read_ambient(self, dev: dict[str, Any], route: str) -> dict[str, Any]:
+        """
+        Read the room temperature through one route.
+
+        A sensor reading that is not a number in a plausible range is
+        dropped; the state query route is read and used for the product
+        instead.
+        """
+        if route == AMBIENT_ROUTE_SENSOR:
+            payload = await self.query_device_temperature(
+                dev["endpointId"], dev["devSession"]
+            )
+            temperature = payload.get("temperature")
+            low, high = AMBIENT_TEMPERATURE_RANGE
+            if (
+                isinstance(temperature, int | float)
+                and not isinstance(temperature, bool)
+                and low <= temperature <= high
+            ):
+                return {AMBIENT_PARAM: round(temperature * 10)}
+            _LOGGER.warning(
+                "Implausible room temperature %r for %s, using route %s",
+                temperature,
+                dev["endpointId"],
+                AMBIENT_ROUTE_SDKCONTROL,
+            )
+            self.ambient_routes[dev.get("productId")] = AMBIENT_ROUTE_SDKCONTROL
+        return await self.get_device_params(dev, ["mode"])
+
     @create_retry_decorator()
     async def query_device_temperature(
         self, device_id: str, dev_session: str
     ) -> dict[str, Any]:
         """Query device temperature with retry."""
-        _LOGGER.debug("Querying device temperature for device_id: %s", device_id)
         session = await self._get_session()
+        timestamp = int(time.time())
+        template = self._request_template(
+            OP_QUERY_TEMPERATURE,
+            device_id,
+            (dev_session,),
+            lambda: self._build_temperature_query_data(device_id, dev_session),
+        )
         async with session.post(
             f"{self.url}/device/control/v2/temperaturesensor",
-            data=json.dumps(
-                self._build_temperature_query_data(device_id, dev_session),
-                separators=(",", ":"),
+            data=template.render(
+                messageId=f"{self.userid}-{timestamp}", timestamp=f"{timestamp}"
             ),
             headers=self._get_headers(),
+            trace_request_ctx=self.pool_stats,
         ) as resp:
-            data = await resp.text()
-            _LOGGER.debug("Received response: %s", data)
-            json_data = json.loads(data)
-
-            if (
-                "event" in json_data
-                and "payload" in json_data["event"]
-                and json_data["event"]["payload"]["status"] == 0
-            ):
-                _LOGGER.debug(
-                    "Queried device temperature for device_id %s: %s",
-                    device_id,
-                    json_data["event"]["payload"],
-                )
-                return json_data["event"]["payload"]
+            temperature = EventResponse.decode(await resp.read())
+
+            if temperature.ok:
+                if TRACER.enabled:
+                    TRACER.event(
+                        "query_temperature",
+                        endpoint=device_id,
+                        size=len(temperature.raw),
+                    )
+                return temperature.payload
 
-            error_msg = f"Failed to query device temperature: {data}"
+            error_msg = f"Failed to query device temperature: {temperature.text}"
             _LOGGER.error(error_msg)
             raise AuxCloudApiError(error_msg)
 
     def _build_temperature_query_data(
         self, device_id: str, dev_session: str
     ) -> dict[str, Any]:
-        """Build the data payload for temperature query."""
-        timestamp = int(time.time())
+        """Build the body template of the temperature query."""
         return {
             "directive": {
-                "header": self._get_directive_header(
+                "header": self._message_header(
                     namespace="DNA.TemperatureSensor",
                     name="ReportState",
-                    message_id_prefix=self.userid,
-                    timestamp=f"{timestamp}",
+                    timestamp=slot("timestamp"),
                 ),
                 "endpoint": {
                     "endpointId": device_id,
@@ -722,19 +1152,55 @@ class AuxCloudAPI:
         act: str,
         params: list[str] | None = None,
         vals: list[list[dict[str, Any]]] | None = None,
-    ) -> dict[str, Any]:
+    ) -> ControlResponse:
         """Act on device parameters with retry."""
         params = params or []
         vals = vals or []
-        _LOGGER.debug(
-            "Acting on device parameters for device: %s, action: %s", device, act
-        )
 
         if act == "set" and len(params) != len(vals):
             msg = "Params and Vals must have the same length"
             raise ValueError(msg)
 
         session = await self._get_session()
+        ambient = self._is_ambient_mode(params)
+        template = self._request_template(
+            OP_CONTROL_AMBIENT if ambient else OP_CONTROL,
+            device["endpointId"],
+            tuple(device[key] for key in CONTROL_IDENTITY_KEYS),
+            lambda: self._build_control_data(device, ambient=ambient),
+        )
+
+        async with session.post(
+            f"{self.url}/device/control/v2/sdkcontrol",
+            params={"license": LICENSE},
+            data=template.render(
+                messageId=f"{device['endpointId']}-{int(time.time())}",
+                act=act,
+                params=params,
+                vals=vals,
+            ),
+            headers=self._get_headers(),
+            trace_request_ctx=self.pool_stats,
+        ) as resp:
+            response = ControlResponse.decode(await resp.read())
+
+            if response.ok:
+                if TRACER.enabled:
+                    TRACER.event(
+                        "device_params",
+                        endpoint=device["endpointId"],
+                        act=act,
+                        size=len(response.raw),
+                    )
+                return response
+
+            msg = f"Failed to {act} device parameters: {response.text}"
+            raise ValueError(msg)
+
+    def _build_control_data(
+        self, device: dict[str, Any], *, ambient: bool
+    ) -> dict[str, Any]:
+        """Build the body template of a KeyValueControl request."""
         cookie = json.loads(base64.b64decode(device["cookie"].encode()))
         mapped_cookie = base64.b64encode(
             json.dumps(
@@ -755,10 +1221,8 @@ class AuxCloudAPI:
 
         data = {
             "directive": {
-                "header": self._get_directive_header(
-                    namespace="DNA.KeyValueControl",
-                    name="KeyValueControl",
-                    message_id_prefix=device["endpointId"],
+                "header": self._message_header(
+                    namespace="DNA.KeyValueControl", name="KeyValueControl"
                 ),
                 "endpoint": {
                     "devicePairedInfo": {
@@ -773,41 +1237,17 @@ class AuxCloudAPI:
                     "devSession": device["devSession"],
                 },
                 "payload": {
-                    "act": act,
-                    "params": params,
-                    "vals": vals,
+                    "act": slot("act"),
+                    "params": slot("params"),
+                    "vals": slot("vals"),
                 },
             }
         }
 
-        if self._is_ambient_mode(params):
+        if ambient:
             data["directive"]["payload"]["did"] = device["endpointId"]
             data["directive"]["payload"]["vals"] = [[{"val": 0, "idx": 1}]]
-
-        async with session.post(
-            f"{self.url}/device/control/v2/sdkcontrol",
-            params={"license": LICENSE},
-            data=json.dumps(data, separators=(",", ":")),
-            headers=self._get_headers(),
-        ) as resp:
-            response_text = await resp.text()
-            json_data = json.loads(response_text)
-
-            if all(
-                key in json_data.get("event", {}).get("payload", {})
-                for key in ("data",)
-            ):
-                response = json.loads(json_data["event"]["payload"]["data"])
-                _LOGGER.debug(
-                    "Acted on device parameters for device %s: %s", device, response
-                )
-                return {
-                    response["params"][i]: response["vals"][i][0]["val"]
-                    for i in range(len(response["params"]))
-                }
-
-            msg = f"Failed to {act} device parameters: {response_text}"
-            raise ValueError(msg)
+        return data
 
     def _is_ambient_mode(self, params: list[str]) -> bool:
         """
@@ -833,13 +1273,14 @@ class AuxCloudAPI:
         _LOGGER.debug("Refreshing all data")
         try:
             family_data = await self.list_families()
-            tasks = [
-                self.list_devices(family["familyid"]) for family in family_data
-            ] + [
-                self.list_devices(family["familyid"], shared=True)
-                for family in family_data
-            ]
-            await asyncio.gather(*tasks)
+            # Owned listings first, so units also shared are polled as owned
+            for shared in (False, True):
+                await asyncio.gather(
+                    *(
+                        self.list_devices(family["familyid"], shared=shared)
+                        for family in family_data
+                    )
+                )
         except Exception:
             _LOGGER.exception("Error refreshing data")
             raise
@@ -0,0 +1,146 @@
+"""Per-instance TTL caches for the results of async client methods."""
+
+from __future__ import annotations
+
+import functools
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
+
+
+class CacheInfo(NamedTuple):
+    """Hit and miss counters and current size of a cache."""
+
+    hits: int
+    misses: int
+    size: int
+
+
+class TTLCache:
+    """
+    Results by key, each valid for ``ttl`` seconds.
+
+    Once ``maxsize`` entries are held, adding one evicts the oldest.
+    """
+
+    __slots__ = ("_entries", "hits", "maxsize", "misses", "ttl")
+
+    def __init__(self, ttl: float, maxsize: int = 32) -> None:
+        """Initialize an empty cache."""
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        # Key -> (expiry time, value), oldest first
+        self._entries: dict[Any, tuple[float, Any]] = {}
+
+    def get(self, key: Any, now: float) -> tuple[bool, Any]:
+        """Return ``(True, value)`` on a hit, ``(False, None)`` on a miss."""
+        entry = self._entries.get(key)
+        if entry is not None and now < entry[0]:
+            self.hits += 1
+            return True, entry[1]
+        if entry is not None:
+            del self._entries[key]
+        self.misses += 1
+        return False, None
+
+    def set(self, key: Any, value: Any, now: float) -> None:
+        """Store a value, evicting the oldest entry if the cache is full."""
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (now + self.ttl, value)
+
+    def invalidate(self, key: Any) -> None:
+        """Drop one entry."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries; the counters are kept."""
+        self._entries.clear()
+
+    def info(self) -> CacheInfo:
+        """Return the counters and size."""
+        return CacheInfo(self.hits, self.misses, len(self._entries))
+
+
+def _key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+    """Return the cache key of a call."""
+    return (args, tuple(sorted(kwargs.items()))) if kwargs else args
+
+
+class _BoundCachedMethod:
+    """A cached method bound to one instance, which owns its cache."""
+
+    __slots__ = ("__wrapped__", "_instance", "cache")
+
+    def __init__(
+        self, func: Callable[..., Any], instance: Any, ttl: float, maxsize: int
+    ) -> None:
+        self.__wrapped__ = func
+        self._instance = instance
+        self.cache = TTLCache(ttl, maxsize)
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Return the cached result, calling the method on a miss."""
+        key = _key(args, kwargs)
+        hit, value = self.cache.get(key, time.monotonic())
+        if hit:
+            return value
+        value = await self.__wrapped__(self._instance, *args, **kwargs)
+        self.cache.set(key, value, time.monotonic())
+        return value
+
+    def cache_invalidate(self, *args: Any, **kwargs: Any) -> None:
+        """Drop the cached result of the call with these arguments."""
+        self.cache.invalidate(_key(args, kwargs))
+
+    def cache_clear(self) -> None:
+        """Drop all cached results."""
+        self.cache.clear()
+
+    def cache_info(self) -> CacheInfo:
+        """Return the hit and miss counters and size of the cache."""
+        return self.cache.info()
+
+
+class _CachedMethod:
+    """Descriptor giving every instance its own cache of a method."""
+
+    def __init__(self, func: Callable[..., Any], ttl: float, maxsize: int) -> None:
+        functools.update_wrapper(self, func)
+        self._func = func
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._name = func.__name__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        bound = _BoundCachedMethod(self._func, instance, self._ttl, self._maxsize)
+        # Later lookups find the bound method on the instance directly
+        instance.__dict__[self._name] = bound
+        return bound
+
+
+def cached_method(
+    ttl: float, maxsize: int = 32
+) -> Callable[[Callable[..., Coroutine[Any, Any, Any]]], Any]:
+    """
+    Cache the results of an async method per instance for ``ttl`` seconds.
+
+    Results are keyed by the call arguments; exceptions are not cached.
+    The bound method offers ``cache_clear()``, ``cache_invalidate(*args)``
+    and ``cache_info()``.
+    """
+
+    def decorator(func: Callable[..., Coroutine[Any, Any, Any]]) -> Any:
+        return _CachedMethod(func, ttl, maxsize)
+
+    return decorator
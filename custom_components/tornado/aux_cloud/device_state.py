@@ -0,0 +1,190 @@
+"""Compact per-device state parsed from AuxCloud payloads."""
+
+from __future__ import annotations
+
+import sys
+from types import MappingProxyType
+from typing import Any, NoReturn
+
+# Parameters the integration reads; each gets its own slot on DeviceState
+PARAM_KEYS: tuple[str, ...] = tuple(
+    sys.intern(key)
+    for key in (
+        "pwr",
+        "ac_mode",
+        "ac_mark",
+        "temp",
+        "envtemp",
+        "ac_vdir",
+        "ac_hdir",
+        "ac_slp",
+        "ac_astheat",
+        "ecomode",
+        "ac_clean",
+        "ac_health",
+        "scrdisp",
+        "mldprf",
+        "pwrlimitswitch",
+        "pwrlimit",
+        "comfwind",
+    )
+)
+_PARAM_SET = frozenset(PARAM_KEYS)
+# Parameters the unit reports but that cannot be written
+READ_ONLY_KEYS = frozenset({"envtemp"})
+CONTROL_KEYS: tuple[str, ...] = tuple(
+    key for key in PARAM_KEYS if key not in READ_ONLY_KEYS
+)
+
+# Raw endpoint keys the client needs to address a device, by slot name
+IDENTITY_KEYS: dict[str, str] = {
+    "endpointId": "endpoint_id",
+    "productId": "product_id",
+    "mac": "mac",
+    "devicetypeFlag": "devicetype_flag",
+    "devSession": "dev_session",
+    "cookie": "cookie",
+}
+
+
+class DeviceState:
+    """
+    Parsed state of a single device.
+
+    Only the fields the integration uses are kept: the endpoint identity
+    needed to send commands, the online state and one slot per known
+    parameter. Unknown parameters land in ``extra`` under interned keys;
+    everything else in the cloud payload is dropped.
+
+    States are immutable: changes are made with ``with_params``, which
+    returns a new state, or the same one when nothing changes. Readers can
+    hold on to a state without copying it.
+    """
+
+    __slots__ = (
+        "endpoint_id",
+        "friendly_name",
+        "product_id",
+        "mac",
+        "devicetype_flag",
+        "dev_session",
+        "cookie",
+        "state",
+        "extra",
+        *PARAM_KEYS,
+    )
+
+    endpoint_id: str
+    friendly_name: str | None
+    product_id: str | None
+    mac: str | None
+    devicetype_flag: Any
+    dev_session: str | None
+    cookie: str | None
+    state: Any
+    extra: MappingProxyType[str, Any]
+
+    def __init__(self, endpoint_id: str, **fields: Any) -> None:
+        """Initialize the state; parameters not given are None."""
+        init = object.__setattr__
+        init(self, "endpoint_id", endpoint_id)
+        init(self, "extra", MappingProxyType(dict(fields.pop("extra", None) or {})))
+        for slot in self.__slots__[1:]:
+            if slot != "extra":
+                init(self, slot, fields.pop(slot, None))
+        if fields:
+            msg = f"Unknown DeviceState fields: {', '.join(fields)}"
+            raise TypeError(msg)
+
+    def __setattr__(self, name: str, value: Any) -> NoReturn:
+        """Refuse changes; use ``with_params``."""
+        msg = f"DeviceState is immutable, cannot set {name}"
+        raise AttributeError(msg)
+
+    def __delattr__(self, name: str) -> NoReturn:
+        """Refuse changes."""
+        msg = f"DeviceState is immutable, cannot delete {name}"
+        raise AttributeError(msg)
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> DeviceState:
+        """Parse a raw device dict as returned by the client."""
+        state = cls(
+            payload["endpointId"],
+            friendly_name=payload.get("friendlyName"),
+            product_id=payload.get("productId"),
+            mac=payload.get("mac"),
+            devicetype_flag=payload.get("devicetypeFlag"),
+            dev_session=payload.get("devSession"),
+            cookie=payload.get("cookie"),
+            state=payload.get("state"),
+        )
+        if params := payload.get("params"):
+            state._merge(params)
+        return state
+
+    def _merge(self, params: dict[str, Any]) -> None:
+        """Store parameter values in their slots or in ``extra``; build only."""
+        extra = None
+        for key, value in params.items():
+            if key in _PARAM_SET:
+                object.__setattr__(self, key, value)
+            else:
+                if extra is None:
+                    extra = dict(self.extra)
+                extra[sys.intern(key)] = value
+        if extra is not None:
+            object.__setattr__(self, "extra", MappingProxyType(extra))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a parameter value, or ``default`` when it is unknown."""
+        value = getattr(self, key) if key in _PARAM_SET else self.extra.get(key)
+        return default if value is None else value
+
+    @property
+    def params(self) -> dict[str, Any]:
+        """Return all known parameter values as a new dict."""
+        params = {
+            key: value
+            for key in PARAM_KEYS
+            if (value := getattr(self, key)) is not None
+        }
+        params.update(self.extra)
+        return params
+
+    @property
+    def controllable_params(self) -> dict[str, Any]:
+        """Return the known values of all writable parameters."""
+        return {
+            key: value
+            for key in CONTROL_KEYS
+            if (value := getattr(self, key)) is not None
+        }
+
+    def with_params(self, params: dict[str, Any]) -> DeviceState:
+        """Return this state with ``params`` applied; itself if none change."""
+        if all(self.get(key) == value for key, value in params.items()):
+            return self
+        state = object.__new__(DeviceState)
+        for slot in self.__slots__:
+            object.__setattr__(state, slot, getattr(self, slot))
+        state._merge(params)
+        return state
+
+    def __getitem__(self, key: str) -> Any:
+        """Look up an endpoint identity field by its raw payload key."""
+        return getattr(self, IDENTITY_KEYS[key])
+
+    def __eq__(self, other: object) -> bool:
+        """Compare all fields."""
+        if not isinstance(other, DeviceState):
+            return NotImplemented
+        return all(
+            getattr(self, slot) == getattr(other, slot) for slot in self.__slots__
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return a compact representation without secrets."""
+        return f"DeviceState({self.endpoint_id!r}, params={self.params!r})"
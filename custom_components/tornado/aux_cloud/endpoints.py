@@ -0,0 +1,108 @@
+"""Index of the devices listed across families, one entry per endpoint."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterator, Sequence
+
+
+class Endpoint(NamedTuple):
+    """A listed device and where it was listed."""
+
+    device: dict[str, Any]
+    family_id: str
+    shared: bool
+
+
+class EndpointIndex:
+    """
+    The devices of every family listing, deduplicated by ``endpointId``.
+
+    Each family has an owned and a shared listing. A unit that appears in
+    several listings is indexed once: an owned listing wins over a shared
+    one, otherwise the listing that first had it keeps it. When that
+    listing drops it, the next listing still holding it takes over.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        # (family id, shared) -> devices, as last listed
+        self._listings: dict[tuple[str, bool], list[dict[str, Any]]] = {}
+        self._endpoints: dict[str, Endpoint] = {}
+
+    def __contains__(self, endpoint_id: object) -> bool:
+        """Return True if the endpoint is listed anywhere."""
+        return endpoint_id in self._endpoints
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the endpoint ids, in the order first listed."""
+        return iter(self._endpoints)
+
+    def __len__(self) -> int:
+        """Return the number of distinct endpoints."""
+        return len(self._endpoints)
+
+    def get(self, endpoint_id: str) -> Endpoint | None:
+        """Return the entry of an endpoint, or None if it is not listed."""
+        return self._endpoints.get(endpoint_id)
+
+    def family_devices(self, family_id: str) -> list[dict[str, Any]]:
+        """Return the devices a family's listings hold the index entry of."""
+        return [
+            device
+            for shared in (False, True)
+            for device in self._listings.get((family_id, shared), ())
+            if self._endpoints[device["endpointId"]].device is device
+        ]
+
+    def update(
+        self,
+        family_id: str,
+        devices: Sequence[dict[str, Any]],
+        *,
+        shared: bool = False,
+    ) -> None:
+        """Replace the owned or shared listing of a family."""
+        key = (family_id, shared)
+        previous = self._listings.get(key, [])
+        self._listings[key] = list(devices)
+        for device in devices:
+            self._offer(Endpoint(device, family_id, shared))
+        if previous:
+            listed = {device["endpointId"] for device in devices}
+            self._drop(
+                key,
+                [device for device in previous if device["endpointId"] not in listed],
+            )
+
+    def retain_families(self, family_ids: Collection[str]) -> None:
+        """Forget the listings of every family not in ``family_ids``."""
+        for key in [key for key in self._listings if key[0] not in family_ids]:
+            self._drop(key, self._listings.pop(key))
+
+    def _offer(self, endpoint: Endpoint) -> None:
+        """Index a listed device unless a preferred listing already has it."""
+        endpoint_id = endpoint.device["endpointId"]
+        current = self._endpoints.get(endpoint_id)
+        if (
+            current is None
+            or (current.family_id, current.shared)
+            == (endpoint.family_id, endpoint.shared)
+            or (current.shared and not endpoint.shared)
+        ):
+            self._endpoints[endpoint_id] = endpoint
+
+    def _drop(self, key: tuple[str, bool], devices: Sequence[dict[str, Any]]) -> None:
+        """Unindex devices a listing dropped, or hand them to another listing."""
+        for device in devices:
+            endpoint_id = device["endpointId"]
+            endpoint = self._endpoints.get(endpoint_id)
+            if endpoint is None or (endpoint.family_id, endpoint.shared) != key:
+                continue
+            del self._endpoints[endpoint_id]
+            for (family_id, shared), others in self._listings.items():
+                for other in others:
+                    if other["endpointId"] == endpoint_id:
+                        self._offer(Endpoint(other, family_id, shared))
@@ -0,0 +1,79 @@
+"""Per-device poll outcomes and quarantine of unresponsive devices."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+_LOGGER = logging.getLogger(__name__)
+
+# Poll outcome of a device
+DEVICE_OK = "ok"
+DEVICE_PARTIAL = "partial"  # params read, state or ambient temperature failed
+DEVICE_ERROR = "error"
+DEVICE_TIMEOUT = "timeout"
+DEVICE_QUARANTINED = "quarantined"
+
+# Re-probe delay after the first failure, doubled per consecutive failure
+QUARANTINE_BASE_DELAY = 30.0
+QUARANTINE_MAX_DELAY = 900.0
+
+
+class DeviceHealth:
+    """
+    Poll outcome of every device and quarantine of failing ones.
+
+    A device whose params could not be read within its deadline is
+    quarantined: the following polls skip it until its re-probe time, which
+    doubles with every consecutive failure up to ``max_delay``. One good
+    read releases it.
+    """
+
+    def __init__(
+        self,
+        base_delay: float = QUARANTINE_BASE_DELAY,
+        max_delay: float = QUARANTINE_MAX_DELAY,
+    ) -> None:
+        """Initialize with nothing quarantined."""
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.status: dict[str, str] = {}
+        self._failures: dict[str, int] = {}
+        self._probe_at: dict[str, float] = {}
+
+    def should_poll(self, endpoint_id: str, now: float) -> bool:
+        """Return True unless the device is quarantined until after ``now``."""
+        probe_at = self._probe_at.get(endpoint_id)
+        if probe_at is None or now >= probe_at:
+            return True
+        self.status[endpoint_id] = DEVICE_QUARANTINED
+        return False
+
+    def retain(self, endpoint_ids: Collection[str]) -> None:
+        """Forget every device not in ``endpoint_ids``."""
+        for records in (self.status, self._failures, self._probe_at):
+            for endpoint_id in records.keys() - endpoint_ids:
+                del records[endpoint_id]
+
+    def record(self, endpoint_id: str, status: str, now: float) -> None:
+        """Record a poll outcome, quarantining the device if it failed."""
+        self.status[endpoint_id] = status
+        if status in (DEVICE_OK, DEVICE_PARTIAL):
+            self._probe_at.pop(endpoint_id, None)
+            if self._failures.pop(endpoint_id, None):
+                _LOGGER.info("Device %s is responding again", endpoint_id)
+            return
+
+        failures = self._failures.get(endpoint_id, 0) + 1
+        self._failures[endpoint_id] = failures
+        delay = min(self.base_delay * 2 ** (failures - 1), self.max_delay)
+        self._probe_at[endpoint_id] = now + delay
+        _LOGGER.warning(
+            "Device %s poll failed (%s), re-probing in %.0f seconds",
+            endpoint_id,
+            status,
+            delay,
+        )
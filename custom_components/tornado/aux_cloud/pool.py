@@ -0,0 +1,72 @@
+"""Per-client request and connection counters of the shared HTTP pool."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import aiohttp
+
+if TYPE_CHECKING:
+    from types import SimpleNamespace
+
+
+class PoolInfo(NamedTuple):
+    """Requests sent and connections opened or reused by the pool."""
+
+    requests: int
+    created: int
+    reused: int
+
+
+class PoolStats:
+    """
+    Counters of the requests one client sends through a traced session.
+
+    A pool that keeps its connections alive opens a few connections once
+    and reuses them on every later poll, so ``reused`` grows with
+    ``requests`` while ``created`` stays flat. The session is shared by
+    every client, so its trace config counts each request into the stats
+    passed as its ``trace_request_ctx``; untagged requests are not counted.
+    """
+
+    __slots__ = ("created", "requests", "reused")
+
+    def __init__(self) -> None:
+        """Initialize the counters at zero."""
+        self.requests = 0
+        self.created = 0
+        self.reused = 0
+
+    @classmethod
+    def trace_config(cls) -> aiohttp.TraceConfig:
+        """Return a trace config counting into the stats each request carries."""
+        config = aiohttp.TraceConfig()
+        config.on_request_start.append(_on_request_start)
+        config.on_connection_create_end.append(_on_connection_create_end)
+        config.on_connection_reuseconn.append(_on_connection_reuseconn)
+        return config
+
+    def info(self) -> PoolInfo:
+        """Return the counters."""
+        return PoolInfo(self.requests, self.created, self.reused)
+
+
+def _stats(ctx: SimpleNamespace) -> PoolStats | None:
+    """Return the stats a request was tagged with, if any."""
+    stats = ctx.trace_request_ctx
+    return stats if isinstance(stats, PoolStats) else None
+
+
+async def _on_request_start(_: Any, ctx: SimpleNamespace, __: Any) -> None:
+    if stats := _stats(ctx):
+        stats.requests += 1
+
+
+async def _on_connection_create_end(_: Any, ctx: SimpleNamespace, __: Any) -> None:
+    if stats := _stats(ctx):
+        stats.created += 1
+
+
+async def _on_connection_reuseconn(_: Any, ctx: SimpleNamespace, __: Any) -> None:
+    if stats := _stats(ctx):
+        stats.reused += 1
@@ -0,0 +1,274 @@
+"""Typed decoding of AuxCloud responses straight from the raw body."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import time
+from collections.abc import Iterator, Mapping
+from typing import Any, Self
+
+try:  # Shipped with Home Assistant; decodes bytes without a str copy
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - stdlib fallback
+    from json import loads as json_loads
+
+# Status of a successful cloud call
+STATUS_OK = 0
+# Bodies from this size on are decoded element by element, yielding to the
+# event loop; orjson holds the GIL for a whole decode, so a worker thread
+# would not keep the loop responsive
+INCREMENTAL_MIN_SIZE = 256 * 1024
+# Seconds of decoding between yields to the event loop
+INCREMENTAL_SLICE = 0.005
+# Container levels walked element by element; deeper values, such as a
+# single device, are decoded in one call
+_INCREMENTAL_DEPTH = 3
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def _skip(text: str, pos: int) -> int:
+    """Return the position of the next non-whitespace character."""
+    return _WHITESPACE.match(text, pos).end()
+
+
+class _IncrementalDecoder:
+    """
+    Decode a JSON text in short slices, yielding to the event loop between.
+
+    The outer container levels are walked here, one short decoder call per
+    element; after each element past the time slice the loop gets a turn.
+    """
+
+    def __init__(self, text: str) -> None:
+        """Initialize the decoder for ``text``."""
+        self._text = text
+        self._yield_at = time.perf_counter() + INCREMENTAL_SLICE
+
+    async def decode(self) -> Any:
+        """Decode the whole text."""
+        text = self._text
+        value, end = await self._decode_element(0, _INCREMENTAL_DEPTH)
+        if (end := _skip(text, end)) != len(text):
+            msg = "Extra data"
+            raise json.JSONDecodeError(msg, text, end)
+        return value
+
+    async def _decode_element(self, pos: int, depth: int) -> tuple[Any, int]:
+        """Decode the JSON value at ``pos``, returning it and the end position."""
+        text = self._text
+        pos = _skip(text, pos)
+        opening = text[pos : pos + 1]
+        if depth <= 0 or opening not in ("{", "["):
+            return _DECODER.raw_decode(text, pos)
+
+        closing = "}" if opening == "{" else "]"
+        items: list[Any] = []
+        pos = _skip(text, pos + 1)
+        if text[pos : pos + 1] == closing:
+            return ({} if opening == "{" else []), pos + 1
+        while True:
+            if opening == "{":
+                if text[pos : pos + 1] != '"':
+                    msg = "Expecting property name enclosed in double quotes"
+                    raise json.JSONDecodeError(msg, text, pos)
+                key, pos = _DECODER.raw_decode(text, pos)
+                pos = _skip(text, pos)
+                if text[pos : pos + 1] != ":":
+                    msg = "Expecting ':' delimiter"
+                    raise json.JSONDecodeError(msg, text, pos)
+                value, pos = await self._decode_element(pos + 1, depth - 1)
+                items.append((key, value))
+            else:
+                value, pos = await self._decode_element(pos, depth - 1)
+                items.append(value)
+            if time.perf_counter() >= self._yield_at:
+                await asyncio.sleep(0)
+                self._yield_at = time.perf_counter() + INCREMENTAL_SLICE
+            pos = _skip(text, pos)
+            delimiter = text[pos : pos + 1]
+            if delimiter == closing:
+                return (dict(items) if opening == "{" else items), pos + 1
+            if delimiter != ",":
+                msg = "Expecting ',' delimiter"
+                raise json.JSONDecodeError(msg, text, pos)
+            pos = _skip(text, pos + 1)
+
+
+async def loads_incremental(raw: bytes) -> Any:
+    """Decode a JSON body in slices; see ``_IncrementalDecoder``."""
+    return await _IncrementalDecoder(raw.decode()).decode()
+
+
+def _as_dict(value: Any) -> dict[str, Any]:
+    """Return ``value`` if it is a JSON object, else an empty dict."""
+    return value if isinstance(value, dict) else {}
+
+
+class ApiResponse:
+    """
+    Base of the typed responses.
+
+    Subclasses pick the few fields they need out of the decoded body in
+    ``_parse``; the raw body is kept for error messages and trace sizes
+    and only turned into text when one is formatted.
+    """
+
+    __slots__ = ("msg", "raw", "status")
+
+    status: int | None
+    msg: str | None
+    raw: bytes
+
+    def __init__(self, raw: bytes, body: dict[str, Any]) -> None:
+        """Initialize from the raw and decoded body."""
+        self.raw = raw
+        self.status = body.get("status")
+        self.msg = body.get("msg")
+        self._parse(body)
+
+    @classmethod
+    def decode(cls, raw: bytes) -> Self:
+        """Decode a raw response body; raises ``ValueError`` if it is not JSON."""
+        return cls(raw, _as_dict(json_loads(raw)))
+
+    @classmethod
+    async def decode_async(cls, raw: bytes) -> Self:
+        """
+        Decode a raw response body without stalling the event loop.
+
+        Bodies of ``INCREMENTAL_MIN_SIZE`` or more, such as the device lists
+        of large accounts, are decoded in slices that yield to the loop;
+        small ones are decoded with orjson in one go.
+        """
+        if len(raw) < INCREMENTAL_MIN_SIZE:
+            return cls.decode(raw)
+        return cls(raw, _as_dict(await loads_incremental(raw)))
+
+    def _parse(self, body: dict[str, Any]) -> None:
+        """Extract the fields of this response type."""
+
+    @property
+    def ok(self) -> bool:
+        """Return True if the cloud reported success."""
+        return self.status == STATUS_OK
+
+    @property
+    def text(self) -> str:
+        """Return the raw body as text."""
+        return self.raw.decode(errors="replace")
+
+
+class LoginResponse(ApiResponse):
+    """Response of ``account/login``."""
+
+    __slots__ = ("loginsession", "userid")
+
+    loginsession: str | None
+    userid: str | None
+
+    def _parse(self, body: dict[str, Any]) -> None:
+        self.loginsession = body.get("loginsession")
+        self.userid = body.get("userid")
+
+
+class FamilyListResponse(ApiResponse):
+    """Response of ``getfamilylist``."""
+
+    __slots__ = ("families",)
+
+    families: list[dict[str, Any]]
+
+    def _parse(self, body: dict[str, Any]) -> None:
+        self.families = _as_dict(body.get("data")).get("familyList") or []
+
+
+class DeviceListResponse(ApiResponse):
+    """Response of the own and shared device queries."""
+
+    __slots__ = ("endpoints",)
+
+    endpoints: list[dict[str, Any]]
+
+    def _parse(self, body: dict[str, Any]) -> None:
+        data = _as_dict(body.get("data"))
+        if "endpoints" in data:
+            self.endpoints = data["endpoints"] or []
+        else:
+            self.endpoints = [
+                shared["devinfo"] for shared in data.get("shareFromOther") or ()
+            ]
+
+
+class EventResponse(ApiResponse):
+    """
+    Response of the directive endpoints (``querystate``, ``temperaturesensor``).
+
+    The interesting part is ``event.payload``; its status replaces the
+    top-level one.
+    """
+
+    __slots__ = ("payload",)
+
+    payload: dict[str, Any]
+
+    def _parse(self, body: dict[str, Any]) -> None:
+        self.payload = _as_dict(_as_dict(body.get("event")).get("payload"))
+        self.status = self.payload.get("status")
+
+
+class ControlResponse(EventResponse, Mapping[str, Any]):
+    """
+    Response of ``sdkcontrol``, read as a mapping of param name to value.
+
+    The params come as a JSON string nested in ``event.payload.data``; it
+    is decoded on first access, so writes whose result nobody reads never
+    pay for it.
+    """
+
+    __slots__ = ("_params", "data")
+
+    data: str | None
+
+    def _parse(self, body: dict[str, Any]) -> None:
+        super()._parse(body)
+        self.data = self.payload.get("data")
+        self._params: dict[str, Any] | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Return True if the response carries params."""
+        return self.data is not None
+
+    @property
+    def params(self) -> dict[str, Any]:
+        """Return the params, decoding them on first access."""
+        if self._params is None:
+            nested = json_loads(self.data) if self.data is not None else {}
+            self._params = dict(
+                zip(
+                    nested.get("params") or (),
+                    (val[0]["val"] for val in nested.get("vals") or ()),
+                    strict=False,
+                )
+            )
+        return self._params
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the value of a param."""
+        return self.params[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the param names."""
+        return iter(self.params)
+
+    def __len__(self) -> int:
+        """Return the number of params."""
+        return len(self.params)
+
+    def __repr__(self) -> str:
+        """Return the params."""
+        return f"ControlResponse({self.params!r})"
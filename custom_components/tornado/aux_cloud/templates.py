@@ -0,0 +1,59 @@
+"""Pre-serialized request bodies with slots for the values that vary."""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+# Slot marker as it appears in the serialized body, quotes included
+_SLOT = re.compile(rb'"\{\{(\w+)\}\}"')
+
+
+def slot(name: str) -> str:
+    """Return the marker to put in a body where the value of ``name`` goes."""
+    return f"{{{{{name}}}}}"
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a value compactly, as the cloud expects."""
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+class RequestTemplate:
+    """
+    A JSON request body serialized once, up to a few varying values.
+
+    The body is built with ``slot(name)`` markers where the varying values
+    go. It is serialized and split at the markers once; rendering only
+    serializes the slot values and joins the static parts around them.
+    """
+
+    __slots__ = ("_parts", "key", "slots")
+
+    key: Any
+    slots: tuple[str, ...]
+    _parts: tuple[bytes, ...]
+
+    def __init__(self, body: dict[str, Any], key: Any = None) -> None:
+        """
+        Serialize ``body``.
+
+        Args:
+            body: Request body with slot markers for the varying values
+            key: What the invariant parts were built from, for reuse checks
+
+        """
+        self.key = key
+        # re.split alternates static parts and slot names
+        split = _SLOT.split(_dumps(body))
+        self._parts = tuple(split[::2])
+        self.slots = tuple(name.decode() for name in split[1::2])
+
+    def render(self, **values: Any) -> bytes:
+        """Return the body with each slot filled with its serialized value."""
+        parts = [self._parts[0]]
+        for name, part in zip(self.slots, self._parts[1:], strict=True):
+            parts.append(_dumps(values[name]))
+            parts.append(part)
+        return b"".join(parts)
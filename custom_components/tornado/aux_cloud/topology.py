@@ -0,0 +1,46 @@
+"""Fingerprint of an account's families and devices."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+# Separates the fields of a row and the rows of a fingerprint
+_FIELD = b"\x1f"
+_ROW = b"\x1e"
+
+
+def _cookie_hash(cookie: str | None) -> bytes:
+    """Return a short digest standing in for a device cookie."""
+    return hashlib.blake2b((cookie or "").encode(), digest_size=8).digest()
+
+
+def topology_fingerprint(families: Mapping[str, Sequence[Mapping[str, Any]]]) -> str:
+    """
+    Return a digest of the families and the devices listed in each.
+
+    It covers the family ids and, per device, the endpoint id, device
+    session, name and a hash of the cookie: everything that changes the
+    entities, the persisted device list or how a device is addressed.
+    Parameter values are left out, so polling does not change it.
+    """
+    rows = sorted(
+        (
+            family_id.encode(),
+            device["endpointId"].encode(),
+            str(device.get("devSession") or "").encode(),
+            str(device.get("friendlyName") or "").encode(),
+            _cookie_hash(device.get("cookie")),
+        )
+        for family_id, devices in families.items()
+        for device in devices
+    )
+    digest = hashlib.blake2b(digest_size=16)
+    for family_id in sorted(families):
+        digest.update(family_id.encode() + _ROW)
+    for row in rows:
+        digest.update(_FIELD.join(row) + _ROW)
+    return digest.hexdigest()
@@ -0,0 +1,116 @@
+"""Sampled, rate-limited tracing for AuxCloud hot paths."""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+from collections import deque
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Field names whose values must never reach the log
+REDACTED_FIELDS = frozenset(
+    {
+        "aeskey",
+        "cookie",
+        "devSession",
+        "dev_session",
+        "key",
+        "loginsession",
+        "password",
+        "token",
+        "userid",
+    }
+)
+REDACTED = "***"
+
+
+def _compact(name: str, value: Any) -> Any:
+    """Reduce a trace field to something cheap and safe to log."""
+    if name in REDACTED_FIELDS:
+        return REDACTED
+    if isinstance(value, dict):
+        return f"<dict:{len(value)}>"
+    if isinstance(value, list | tuple | set | frozenset):
+        return f"<{type(value).__name__}:{len(value)}>"
+    return value
+
+
+class Tracer:
+    """
+    Emit compact, redacted debug events.
+
+    Tracing is only active while the logger is enabled for DEBUG (or while
+    forced on), so call sites guard with ``if TRACER.enabled:`` and never
+    build their event fields when it is off. When on, events are sampled,
+    limited per event name and second, and kept in a small ring buffer.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        *,
+        sample_rate: float = 1.0,
+        max_events_per_second: int = 20,
+        buffer_size: int = 256,
+    ) -> None:
+        """Initialize the tracer."""
+        self._logger = logger
+        self._forced = False
+        self.sample_rate = sample_rate
+        self.max_events_per_second = max_events_per_second
+        self.events: deque[tuple[float, str, dict[str, Any]]] = deque(
+            maxlen=buffer_size
+        )
+        self.dropped = 0
+        self._windows: dict[str, list[int]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Return True when events should be recorded."""
+        return self._forced or self._logger.isEnabledFor(logging.DEBUG)
+
+    def configure(
+        self,
+        *,
+        enabled: bool | None = None,
+        sample_rate: float | None = None,
+        max_events_per_second: int | None = None,
+    ) -> None:
+        """Adjust tracing at runtime."""
+        if enabled is not None:
+            self._forced = enabled
+        if sample_rate is not None:
+            self.sample_rate = sample_rate
+        if max_events_per_second is not None:
+            self.max_events_per_second = max_events_per_second
+
+    def _admit(self, name: str) -> bool:
+        """Apply sampling and the per-event rate limit."""
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:  # noqa: S311
+            self.dropped += 1
+            return False
+
+        second = int(time.monotonic())
+        window = self._windows.get(name)
+        if window is None or window[0] != second:
+            self._windows[name] = [second, 1]
+            return True
+        if window[1] >= self.max_events_per_second:
+            self.dropped += 1
+            return False
+        window[1] += 1
+        return True
+
+    def event(self, name: str, **fields: Any) -> None:
+        """Record a trace event if tracing is enabled and admitted."""
+        if not self.enabled or not self._admit(name):
+            return
+        compact = {key: _compact(key, value) for key, value in fields.items()}
+        self.events.append((time.time(), name, compact))
+        self._logger.debug("%s %s", name, compact)
+
+
+TRACER = Tracer(_LOGGER)
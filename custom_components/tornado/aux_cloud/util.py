@@ -1,7 +1,5 @@
 """Utility functions for AUX cloud services."""
 
-from Cryptodome.Cipher import AES
-
 
 def encrypt_aes_cbc_zero_padding(iv: bytes, key: bytes, data: bytes) -> bytes | None:
     """
@@ -16,6 +14,10 @@ def encrypt_aes_cbc_zero_padding(iv: bytes, key: bytes, data: bytes) -> bytes |
         Encrypted data as bytes, or None if encryption fails
 
     """
+    # Imported here: the cipher is only needed to log in, and loading it
+    # costs more than the rest of the client together
+    from Cryptodome.Cipher import AES
+
     try:
         cipher = AES.new(key, AES.MODE_CBC, iv)
         padded_data = data
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 
+import voluptuous as vol
 from homeassistant.components.climate import (
+    ATTR_CURRENT_TEMPERATURE,
+    ATTR_FAN_MODE,
+    ATTR_HVAC_ACTION,
+    ATTR_PRESET_MODE,
+    ATTR_SWING_MODE,
     ClimateEntity,
     ClimateEntityDescription,
     ClimateEntityFeature,
@@ -18,10 +23,30 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_platform
 
-from .aux_cloud import AuxCloudAPI
+from .aux_cloud.tracing import TRACER
 from .const import DOMAIN
+from .coordinator import AuxCloudDataUpdateCoordinator  # noqa: TC001 - re-exported
+from .device_view import (
+    CURRENT_TEMPERATURE_PARAMS,
+    FAN_MODE_MAP,
+    FAN_MODE_MAP_REVERSE,
+    FAN_PARAMS,
+    HVAC_MODE_MAP,
+    HVAC_MODE_MAP_REVERSE,
+    HVAC_PARAMS,
+    POWER_LIMIT_PARAMS,
+    PRESET_MODE_NORMAL,
+    PRESET_MODE_PARAMS,
+    PRESET_MODES,
+    SWING_MODES,
+    SWING_PARAMS,
+    TARGET_TEMPERATURE_PARAMS,
+)
+from .entity import TornadoEntity
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -29,95 +54,9 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
-# Map Tornado modes to Home Assistant modes (updated to match remote)
-HVAC_MODE_MAP = {
-    0: HVACMode.COOL,
-    1: HVACMode.HEAT,
-    2: HVACMode.DRY,
-    3: HVACMode.FAN_ONLY,
-    4: HVACMode.AUTO,
-}
-
-# Reverse mapping for setting device params
-HVAC_MODE_MAP_REVERSE = {v: k for k, v in HVAC_MODE_MAP.items()}
-
-# Map Tornado fan modes to Home Assistant fan modes
-FAN_MODE_MAP = {
-    0: "auto",
-    1: "low",
-    2: "medium",
-    3: "high",
-    4: "turbo",
-    5: "silent",
-}
-
-FAN_MODE_MAP_REVERSE = {v: k for k, v in FAN_MODE_MAP.items()}
-
-# Available swing modes
-SWING_MODES = ["off", "vertical", "horizontal", "both"]
-
-# Power-saving preset modes (power limit feature)
-# Expanded to cover 30-90% range in 10% increments
-PRESET_MODE_NORMAL = "normal"
-PRESET_MODE_ECO_30 = "eco_30"
-PRESET_MODE_ECO_40 = "eco_40"
-PRESET_MODE_ECO_50 = "eco_50"
-PRESET_MODE_ECO_60 = "eco_60"
-PRESET_MODE_ECO_70 = "eco_70"
-PRESET_MODE_ECO_80 = "eco_80"
-PRESET_MODE_ECO_90 = "eco_90"
-
-PRESET_MODES = [
-    PRESET_MODE_NORMAL,
-    PRESET_MODE_ECO_30,
-    PRESET_MODE_ECO_40,
-    PRESET_MODE_ECO_50,
-    PRESET_MODE_ECO_60,
-    PRESET_MODE_ECO_70,
-    PRESET_MODE_ECO_80,
-    PRESET_MODE_ECO_90,
-]
-
-# Map preset modes to power limit parameters
-PRESET_MODE_PARAMS = {
-    PRESET_MODE_NORMAL: {"pwrlimitswitch": 0},
-    PRESET_MODE_ECO_30: {"pwrlimitswitch": 1, "pwrlimit": 30},
-    PRESET_MODE_ECO_40: {"pwrlimitswitch": 1, "pwrlimit": 40},
-    PRESET_MODE_ECO_50: {"pwrlimitswitch": 1, "pwrlimit": 50},
-    PRESET_MODE_ECO_60: {"pwrlimitswitch": 1, "pwrlimit": 60},
-    PRESET_MODE_ECO_70: {"pwrlimitswitch": 1, "pwrlimit": 70},
-    PRESET_MODE_ECO_80: {"pwrlimitswitch": 1, "pwrlimit": 80},
-    PRESET_MODE_ECO_90: {"pwrlimitswitch": 1, "pwrlimit": 90},
-}
-
-# Helper function to determine preset mode from power limit value
-def get_preset_mode_from_power_limit(pwrlimitswitch: int, pwrlimit: int) -> str:
-    """Determine preset mode based on power limit value.
-    
-    Uses ranges: 30-35 -> eco_30, 36-45 -> eco_40, 46-55 -> eco_50, etc.
-    If slider value is within ±5 of a preset value, that preset is selected.
-    """
-    if not pwrlimitswitch:
-        return PRESET_MODE_NORMAL
-    
-    # Map ranges to preset modes (centered around preset values)
-    if 30 <= pwrlimit <= 35:
-        return PRESET_MODE_ECO_30
-    elif 36 <= pwrlimit <= 45:
-        return PRESET_MODE_ECO_40
-    elif 46 <= pwrlimit <= 55:
-        return PRESET_MODE_ECO_50
-    elif 56 <= pwrlimit <= 65:
-        return PRESET_MODE_ECO_60
-    elif 66 <= pwrlimit <= 75:
-        return PRESET_MODE_ECO_70
-    elif 76 <= pwrlimit <= 85:
-        return PRESET_MODE_ECO_80
-    elif 86 <= pwrlimit <= 100:
-        return PRESET_MODE_ECO_90
-    else:
-        # Default to normal for any value outside expected ranges
-        return PRESET_MODE_NORMAL
+SERVICE_SET_PARAMS = "set_params"
+ATTR_PARAMS = "params"
+ATTR_FORCE = "force"
 
 # Parameter validation
 PARAMETER_VALIDATION = {
@@ -136,88 +75,89 @@ PARAMETER_VALIDATION = {
     "pwrlimitswitch": {"type": int, "range": (0, 1), "required": False},
     "pwrlimit": {"type": int, "range": (0, 100), "required": False},
     "comfwind": {"type": int, "range": (0, 1), "required": True},
+    "temp": {"type": int, "range": (160, 320), "required": False},  # Tenths of °C
 }
 
 
+def validate_params(params: dict[str, Any]) -> None:
+    """Raise if a param is unknown or its value has the wrong type or range."""
+    for key, value in params.items():
+        if (rule := PARAMETER_VALIDATION.get(key)) is None:
+            msg = f"Unknown parameter {key}"
+            raise ServiceValidationError(msg)
+        low, high = rule["range"]
+        if not isinstance(value, rule["type"]) or not low <= value <= high:
+            msg = f"Parameter {key} must be between {low} and {high}, not {value!r}"
+            raise ServiceValidationError(msg)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Tornado climate platform."""
-    # Get the client from the domain data
     entry_data = hass.data[DOMAIN][config_entry.entry_id]
-    client = entry_data["client"]
-
-    # Ensure client is logged in before creating coordinator
-    if not hasattr(client, "loginsession") or not client.loginsession:
-        _LOGGER.info("Initial login for AuxCloud client")
-        await client.login()
-
-    # Get or create coordinator and store it in entry_data for other platforms
-    if "coordinator" not in entry_data:
-        coordinator = AuxCloudDataUpdateCoordinator(hass, client)
-        await coordinator.async_refresh()
-        entry_data["coordinator"] = coordinator
-    else:
-        coordinator = entry_data["coordinator"]
-
-    try:
-        devices = await client.get_devices()
-        entities = []
-
-        for device in devices:
-            try:
-                entities.append(
-                    TornadoClimateEntity(
-                        hass,
-                        coordinator,
-                        device,
-                    )
-                )
-            except Exception:
-                _LOGGER.exception(
-                    "Error setting up device %s", device.get("endpointId")
-                )
+    coordinator = entry_data["coordinator"]
 
-        async_add_entities(entities)
+    @callback
+    def async_add_devices(devices: list[dict[str, Any]]) -> None:
+        """Add the entities of ``devices``."""
+        try:
+            entities = []
+
+            for device in devices:
+                try:
+                    entities.append(
+                        TornadoClimateEntity(
+                            hass,
+                            coordinator,
+                            device,
+                        )
+                    )
+                except Exception:
+                    _LOGGER.exception(
+                        "Error setting up device %s", device.get("endpointId")
+                    )
 
-    except Exception:
-        _LOGGER.exception("Error setting up Tornado climate platform")
+            async_add_entities(entities)
 
+        except Exception:
+            _LOGGER.exception("Error setting up Tornado climate platform")
 
-class AuxCloudDataUpdateCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching AuxCloud data."""
+    config_entry.async_on_unload(
+        coordinator.async_add_device_callback(async_add_devices)
+    )
 
-    def __init__(self, hass: HomeAssistant, api: AuxCloudAPI) -> None:
-        """Initialize the coordinator."""
-        self.api = api
-        super().__init__(
-            hass,
-            _LOGGER,
-            name="AuxCloud",
-            update_interval=timedelta(seconds=1),  # Reduced from 1 minute to 10 seconds
-        )
+    entity_platform.async_get_current_platform().async_register_entity_service(
+        SERVICE_SET_PARAMS,
+        {
+            vol.Required(ATTR_PARAMS): vol.All(
+                {cv.string: vol.Coerce(int)}, vol.Length(min=1)
+            ),
+            vol.Optional(ATTR_FORCE, default=False): cv.boolean,
+        },
+        "async_set_params",
+    )
 
-    async def _async_update_data(self) -> dict:
-        """Fetch data from AuxCloud."""
-        try:
-            # First check if we need to re-authenticate
-            if not hasattr(self.api, "loginsession") or not self.api.loginsession:
-                _LOGGER.info("No valid login session, attempting to login")
-                await self.api.login()
 
-            devices = await self.api.get_devices()
-            _LOGGER.debug("Coordinator fetched data: %s", devices)
-            return {device["endpointId"]: device for device in devices}
-        except Exception as err:
-            _LOGGER.exception("Error fetching data")
-            error_msg = f"Error fetching data: {err}"
-            raise UpdateFailed(error_msg) from err
+class TornadoClimateEntity(TornadoEntity, ClimateEntity):
+    """
+    Representation of a Tornado AC Climate device.
 
+    The coordinator listener is registered in ``async_added_to_hass`` and
+    removed with the entity, so config entry reloads do not leave stale
+    entities subscribed to the coordinator.
+    """
 
-class TornadoClimateEntity(ClimateEntity):
-    """Representation of a Tornado AC Climate device."""
+    _required_params = (
+        *HVAC_PARAMS,
+        *FAN_PARAMS,
+        *SWING_PARAMS,
+        *TARGET_TEMPERATURE_PARAMS,
+        *CURRENT_TEMPERATURE_PARAMS,
+        *POWER_LIMIT_PARAMS,
+    )
 
     def __init__(
         self,
@@ -227,18 +167,9 @@ class TornadoClimateEntity(ClimateEntity):
         *_: Any,  # Using *_ to ignore additional arguments like config_entry
     ) -> None:
         """Initialize the climate device."""
-        super().__init__()
+        super().__init__(coordinator, device)
         self.hass = hass
-        self._coordinator = coordinator
-        self._client = coordinator.api
-        self._device_id = device["endpointId"]
         self._attr_unique_id = f"{device['endpointId']}_climate"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device["endpointId"])},
-            "name": f"Tornado AC {device.get('friendlyName')}",
-            "manufacturer": "Tornado",
-            "model": "AUX Cloud",
-        }
 
         self._attr_supported_features = (
             ClimateEntityFeature.TARGET_TEMPERATURE
@@ -266,132 +197,81 @@ class TornadoClimateEntity(ClimateEntity):
         self._attr_temperature_unit = UnitOfTemperature.CELSIUS
         self._attr_swing_mode = None
         self._attr_hvac_action = HVACAction.OFF
-        self._attr_available = False
         # Create entity description
         self.entity_description = ClimateEntityDescription(
             key=self._attr_unique_id,
             name=f"Tornado AC {device.get('friendlyName')}",
             translation_key=DOMAIN,
         )
-
-        # Add coordinator listener
-        coordinator.async_add_listener(self._handle_coordinator_update)
         _LOGGER.info("Entity initialized for device %s", self._device_id)
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self._coordinator.last_update_success and self._device is not None
-
-    @property
-    def _device(self) -> dict | None:
-        """Get current device data from coordinator."""
-        if not self._coordinator.data:
-            return None
-        return self._coordinator.data.get(self._device_id)
-
     @property
     def icon(self) -> str:
         """Return the icon to use in the frontend."""
         return "mdi:air-conditioner"
 
-    @property
-    def device_info(self) -> dict:
-        """Return device specific attributes."""
-        return self._attr_device_info
-
-    async def async_added_to_hass(self) -> None:
-        """When entity is added to hass."""
-        await super().async_added_to_hass()
-        self._handle_coordinator_update()
+    async def _async_restore_state(self) -> bool:
+        """Restore mode, fan, swing, preset and temperatures."""
+        last_state = await self.async_get_last_state()
+        if last_state is None or last_state.state not in self._attr_hvac_modes:
+            return False
+
+        attributes = last_state.attributes
+        self._attr_hvac_mode = HVACMode(last_state.state)
+        self._attr_hvac_action = attributes.get(ATTR_HVAC_ACTION)
+        self._attr_fan_mode = attributes.get(ATTR_FAN_MODE)
+        self._attr_swing_mode = attributes.get(ATTR_SWING_MODE)
+        self._attr_preset_mode = attributes.get(ATTR_PRESET_MODE)
+        self._attr_target_temperature = attributes.get(ATTR_TEMPERATURE)
+        self._attr_current_temperature = attributes.get(ATTR_CURRENT_TEMPERATURE)
+        return True
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from coordinator."""
-        _LOGGER.debug(
-            "Handling coordinator update for device %s with data: %s",
-            self._device_id,
-            self._device,
-        )
-
-        if not self._device:
-            self._attr_available = False
-            self.async_write_ha_state()
+        if (view := self._view) is None:
+            self._async_write_ha_state_if_changed()
             return
 
         try:
-            device_params = self._device.get("params", {})
-
-            # Update power and HVAC mode/action
-            if not device_params.get("pwr", 0):
-                self._attr_hvac_mode = HVACMode.OFF
-                self._attr_hvac_action = HVACAction.OFF
-            else:
-                self._attr_hvac_mode = HVAC_MODE_MAP.get(
-                    device_params.get("ac_mode", 0), HVACMode.OFF
+            self._attr_hvac_mode = view.hvac_mode
+            self._attr_hvac_action = view.hvac_action
+            self._attr_fan_mode = view.fan_mode
+            self._attr_swing_mode = view.swing_mode
+            self._attr_preset_mode = view.preset_mode
+            self._attr_target_temperature = view.target_temperature
+            self._attr_current_temperature = view.current_temperature
+
+            if TRACER.enabled:
+                TRACER.event(
+                    "climate_state",
+                    endpoint=self._device_id,
+                    mode=self._attr_hvac_mode,
+                    preset=self._attr_preset_mode,
                 )
-                self._attr_hvac_action = {
-                    HVACMode.COOL: HVACAction.COOLING,
-                    HVACMode.HEAT: HVACAction.HEATING,
-                    HVACMode.DRY: HVACAction.DRYING,
-                    HVACMode.FAN_ONLY: HVACAction.FAN,
-                    HVACMode.AUTO: HVACAction.IDLE,
-                }.get(self._attr_hvac_mode, HVACAction.IDLE)
-
-            # Update other attributes
-            self._attr_fan_mode = FAN_MODE_MAP.get(
-                device_params.get("ac_mark", 0), "auto"
-            )
-            self._attr_target_temperature = device_params.get("temp", 0) / 10
-            self._attr_current_temperature = device_params.get("envtemp", 0) / 10
-            # Update swing mode based on vertical and horizontal direction
-            v_dir = device_params.get("ac_vdir", 0)
-            h_dir = device_params.get("ac_hdir", 0)
-            self._attr_swing_mode = {
-                (0, 0): "off",
-                (1, 0): "vertical",
-                (0, 1): "horizontal",
-                (1, 1): "both",
-            }.get((v_dir, h_dir), "off")
-
-            # Update preset mode based on power limit parameters
-            pwrlimitswitch = device_params.get("pwrlimitswitch", 0)
-            pwrlimit = device_params.get("pwrlimit", 0)
-            self._attr_preset_mode = get_preset_mode_from_power_limit(
-                pwrlimitswitch, pwrlimit
-            )
-
-            self._attr_available = True
-
-            _LOGGER.debug(
-                "Updated state for %s: mode=%s, action=%s, fan=%s, temp=%s, envtemp=%s, preset=%s",
-                self._device_id,
-                self._attr_hvac_mode,
-                self._attr_hvac_action,
-                self._attr_fan_mode,
-                self._attr_target_temperature,
-                self._attr_current_temperature,
-                self._attr_preset_mode,
-            )
 
         except Exception:
             _LOGGER.exception("Error updating state for %s", self._device_id)
-            self._attr_available = False
-
-        self.async_write_ha_state()
+            return
 
-    async def async_update(self) -> None:
-        """Update the entity."""
-        await self._coordinator.async_request_refresh()
+        self._async_write_ha_state_if_changed(
+            self._attr_hvac_mode,
+            self._attr_hvac_action,
+            self._attr_fan_mode,
+            self._attr_swing_mode,
+            self._attr_preset_mode,
+            self._attr_target_temperature,
+            self._attr_current_temperature,
+        )
 
     async def _set_device_params(self, params: dict) -> None:
         """Set device parameters and handle any errors."""
         try:
-            await self._client.set_device_params(self._device, params)
+            await self.coordinator.async_set_device_params(self._device_id, params)
         except Exception:
             _LOGGER.exception(
                 "Error setting parameters for %s",
-                self._device.get("endpointId", "Unknown"),
+                self._device_id,
             )
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
@@ -399,14 +279,12 @@ class TornadoClimateEntity(ClimateEntity):
         if (temp := kwargs.get(ATTR_TEMPERATURE)) is None:
             _LOGGER.info(
                 "No temperature provided for %s %s",
-                self._device.get("endpointId"),
+                self._device_id,
                 kwargs,
             )
             return
 
-        _LOGGER.info(
-            "Setting temperature to %s for %s", temp, self._device.get("endpointId")
-        )
+        _LOGGER.info("Setting temperature to %s for %s", temp, self._device_id)
         await self._set_device_params({"temp": int(temp * 10)})
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
@@ -414,7 +292,7 @@ class TornadoClimateEntity(ClimateEntity):
         _LOGGER.info(
             "Setting HVAC mode to %s for %s",
             hvac_mode,
-            self._device.get("endpointId", "Unknown"),
+            self._device_id,
         )
         params = (
             {"pwr": 0}
@@ -428,7 +306,7 @@ class TornadoClimateEntity(ClimateEntity):
         _LOGGER.info(
             "Setting fan mode (ac_mark) to %s for %s",
             fan_mode,
-            self._device.get("endpointId", "Unknown"),
+            self._device_id,
         )
         await self._set_device_params(
             {"ac_mark": FAN_MODE_MAP_REVERSE.get(fan_mode, 1)}
@@ -436,8 +314,7 @@ class TornadoClimateEntity(ClimateEntity):
 
     async def async_set_swing_mode(self, swing_mode: str) -> None:
         """Set new target swing mode."""
-        device_id = self._device.get("endpointId", "Unknown")
-        _LOGGER.info("Setting swing mode to %s for %s", swing_mode, device_id)
+        _LOGGER.info("Setting swing mode to %s for %s", swing_mode, self._device_id)
         params = {
             "ac_vdir": 1 if swing_mode in ["vertical", "both"] else 0,
             "ac_hdir": 1 if swing_mode in ["horizontal", "both"] else 0,
@@ -446,42 +323,26 @@ class TornadoClimateEntity(ClimateEntity):
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new target preset mode."""
-        device_id = self._device.get("endpointId", "Unknown")
-        _LOGGER.info("Setting preset mode to %s for %s", preset_mode, device_id)
+        _LOGGER.info("Setting preset mode to %s for %s", preset_mode, self._device_id)
         params = PRESET_MODE_PARAMS.get(preset_mode, PRESET_MODE_PARAMS[PRESET_MODE_NORMAL])
         await self._set_device_params(params)
 
     async def async_turn_on(self) -> None:
         """Turn the device on."""
-        _LOGGER.info("Turning on %s", self._device.get("endpointId", "Unknown"))
-        try:
-            await self._client.set_device_params(self._device, {"pwr": 1})
-        except Exception:
-            _LOGGER.exception(
-                "Error turning on %s", self._device.get("endpointId", "Unknown")
-            )
+        _LOGGER.info("Turning on %s", self._device_id)
+        await self._set_device_params({"pwr": 1})
 
     async def async_turn_off(self) -> None:
         """Turn the device off."""
-        _LOGGER.info("Turning off %s", self._device.get("endpointId", "Unknown"))
-        try:
-            await self._client.set_device_params(self._device, {"pwr": 0})
-        except Exception:
-            _LOGGER.exception(
-                "Error turning off %s", self._device.get("endpointId", "Unknown")
-            )
-
+        _LOGGER.info("Turning off %s", self._device_id)
+        await self._set_device_params({"pwr": 0})
 
-async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
-    """Unload Tornado climate platform."""
-    entry_data = hass.data[DOMAIN].get(config_entry.entry_id, {})
-    client = entry_data.get("client")
-
-    if client:
-        await client.cleanup()
-        # Cleanup shared resources when the last client is removed
-        if len(hass.data[DOMAIN]) == 1:
-            await AuxCloudAPI.cleanup_shared_resources()
-        _LOGGER.info("Cleaned up AuxCloud client and resources")
-
-    return True
+    async def async_set_params(
+        self, params: dict[str, Any], *, force: bool = False
+    ) -> None:
+        """Write raw device params, all of them when ``force`` is set."""
+        validate_params(params)
+        _LOGGER.info("Setting params %s for %s", params, self._device_id)
+        await self.coordinator.async_set_device_params(
+            self._device_id, params, force=force
+        )
@@ -11,7 +11,15 @@ from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
 from homeassistant.core import callback
 
 from .aux_cloud import AuxCloudAPI
-from .const import CONF_REGION, DOMAIN, REGIONS
+from .const import (
+    CONF_AMBIENT_INTERVAL,
+    CONF_REGION,
+    CONF_STALE_AFTER,
+    DEFAULT_AMBIENT_INTERVAL,
+    DEFAULT_STALE_AFTER,
+    DOMAIN,
+    REGIONS,
+)
 
 if TYPE_CHECKING:
     from homeassistant.data_entry_flow import FlowResult
@@ -111,6 +119,18 @@ class TornadoOptionsFlow(config_entries.OptionsFlow):
                         CONF_REGION,
                         default=self.config_entry.data.get(CONF_REGION, "eu"),
                     ): vol.In(REGIONS),
+                    vol.Optional(
+                        CONF_STALE_AFTER,
+                        default=self.config_entry.options.get(
+                            CONF_STALE_AFTER, DEFAULT_STALE_AFTER
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                    vol.Optional(
+                        CONF_AMBIENT_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_AMBIENT_INTERVAL, DEFAULT_AMBIENT_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
                 }
             ),
             errors=errors,
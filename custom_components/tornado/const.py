@@ -7,5 +7,21 @@ CONF_EMAIL = "email"
 CONF_PASSWORD = "password"  # noqa: S105
 CONF_REGION = "region"
 
+# Seconds a device keeps serving its last polled state while polls fail
+CONF_STALE_AFTER = "stale_after"
+DEFAULT_STALE_AFTER = 60
+
+# Seconds a device must be missing from complete listings before it is
+# removed with its entities; far longer than the staleness budget, so a
+# cloud fault only makes devices unavailable
+RETIRE_AFTER = 24 * 60 * 60
+
+# Seconds between reads of the room temperature, which changes slowly
+CONF_AMBIENT_INTERVAL = "ambient_interval"
+DEFAULT_AMBIENT_INTERVAL = 120
+
 # Supported regions
 REGIONS = ["eu", "usa"]
+
+# State attribute set while an entity shows state restored from before a restart
+ATTR_RESTORED = "restored"
@@ -0,0 +1,491 @@
+"""Data update coordinator for the Tornado AC integration."""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from datetime import timedelta
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .aux_cloud import AMBIENT_PARAM
+from .aux_cloud.device_state import CONTROL_KEYS, DeviceState
+from .aux_cloud.tracing import TRACER
+from .const import (
+    CONF_AMBIENT_INTERVAL,
+    CONF_STALE_AFTER,
+    DEFAULT_AMBIENT_INTERVAL,
+    DEFAULT_STALE_AFTER,
+    DOMAIN,
+    RETIRE_AFTER,
+)
+from .device_view import DeviceView
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from .aux_cloud import AuxCloudAPI
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+
+def _shared[T](new: T, previous: T | None) -> T:
+    """Return ``previous`` when it equals ``new``, so unchanged data is kept."""
+    return previous if previous is not None and previous == new else new
+
+
+class AuxCloudDataUpdateCoordinator(DataUpdateCoordinator[dict[str, DeviceState]]):
+    """
+    Class to manage fetching AuxCloud data.
+
+    Entities subscribe with their device's ``endpointId`` as listener
+    context. After each poll only the listeners of devices whose state or
+    freshness changed are called; listeners without a context are always
+    called.
+
+    ``data`` and the states in it are never changed in place. A device
+    whose state is unchanged keeps the same ``DeviceState`` object from
+    poll to poll, and an unchanged poll keeps the same ``data`` mapping,
+    so changes are detected by identity.
+
+    A device is fresh while it was last seen by a successful poll less
+    than the staleness budget ago. Failed polls, and devices listed without
+    params because the client could not read them, keep the cached state;
+    devices stay available until their budget runs out. A timer set for
+    the earliest expiry wakes their listeners then, since Home Assistant
+    does not update listeners after repeated failed polls.
+
+    The endpoint ids and names of the devices seen are persisted, so the
+    entities can be set up again after a restart before the cloud answers.
+    Devices that show up later are handed to the platforms' device
+    callbacks. A persisted device is removed from the device registry,
+    together with its entities, once complete listings have missed it for
+    ``RETIRE_AFTER``, a threshold far longer than the staleness budget.
+    Listings the client could not complete neither start nor finish that
+    count.
+
+    Entities register the params they read while they are added, and each
+    poll requests only those; a device without enabled entities costs no
+    params read. Until the first entity registers, everything is read.
+    A device whose params are read at all has every writable param read
+    in the same request, so snapshots can be taken from the cache.
+
+    The room temperature is read on its own, slower cadence: between
+    reads the cached value is merged into the polled params.
+    """
+
+    def __init__(self, hass: HomeAssistant, api: AuxCloudAPI) -> None:
+        """Initialize the coordinator."""
+        self.api = api
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="AuxCloud",
+            update_interval=timedelta(seconds=1),  # Reduced from 1 minute to 10 seconds
+        )
+        self._notified: dict[str, DeviceState] = {}
+        self._notified_fresh: set[str] = set()
+        self._unsub_expiry: CALLBACK_TYPE | None = None
+        self._last_seen: dict[str, float] = {}
+        # Device id -> state as last read by a poll, without optimistic writes
+        self._confirmed: dict[str, DeviceState] = {}
+        self._views: dict[str, DeviceView] = {}
+        self._required: dict[str, Counter[str]] = {}
+        # Device id -> (time read, value) of the last room temperature read
+        self._ambient: dict[str, tuple[float, Any]] = {}
+        # Client topology and device ids the persisted device list was built from
+        self._saved_topology: str | None = None
+        self._saved_ids: frozenset[str] = frozenset()
+        # Device id -> time a complete listing first missed a persisted device
+        self._missing_since: dict[str, float] = {}
+        self._store: Store[dict[str, Any]] | None = None
+        if self.config_entry is not None:
+            self._store = Store(
+                hass, STORAGE_VERSION, f"{DOMAIN}.{self.config_entry.entry_id}"
+            )
+        self.devices: list[dict[str, Any]] = []
+        self._device_callbacks: list[Callable[[list[dict[str, Any]]], None]] = []
+
+    async def async_load_devices(self) -> list[dict[str, Any]]:
+        """Load the devices known from the previous run."""
+        if self._store is not None and (stored := await self._store.async_load()):
+            self.devices = stored["devices"]
+        return self.devices
+
+    @callback
+    def async_add_device_callback(
+        self, add_devices: Callable[[list[dict[str, Any]]], None]
+    ) -> CALLBACK_TYPE:
+        """
+        Call ``add_devices`` with the known devices and every new one.
+
+        It is called right away with the current device list, then with
+        the devices each poll discovers, until the returned callback is
+        called.
+        """
+        self._device_callbacks.append(add_devices)
+        if self.devices:
+            add_devices(self.devices)
+
+        @callback
+        def remove_callback() -> None:
+            self._device_callbacks.remove(add_devices)
+
+        return remove_callback
+
+    @callback
+    def _async_devices_changed(
+        self, added: list[dict[str, Any]], removed: Iterable[str]
+    ) -> None:
+        """Hand new devices to the platforms and retire removed ones."""
+        if added:
+            _LOGGER.info(
+                "New devices found: %s", ", ".join(d["endpointId"] for d in added)
+            )
+            for add_devices in list(self._device_callbacks):
+                add_devices(added)
+
+        registry = dr.async_get(self.hass)
+        for device_id in removed:
+            _LOGGER.info("Device %s is gone, removing it", device_id)
+            self._required.pop(device_id, None)
+            device = registry.async_get_device(identifiers={(DOMAIN, device_id)})
+            if device is not None and self.config_entry is not None:
+                # Removes the device's entities from this entry as well
+                registry.async_update_device(
+                    device.id, remove_config_entry_id=self.config_entry.entry_id
+                )
+
+    async def _async_save_devices(
+        self, data: dict[str, DeviceState], now: float, *, complete: bool
+    ) -> None:
+        """Persist the device list when devices were added, removed or renamed."""
+        topology = self.api.topology
+        if (
+            topology is not None
+            and not self._missing_since
+            and (topology == self._saved_topology and data.keys() == self._saved_ids)
+        ):
+            # Same devices and names as last time: nothing to compare
+            return
+        self._saved_topology = topology
+        self._saved_ids = frozenset(data)
+
+        devices = [
+            {"endpointId": device_id, "friendlyName": device.friendly_name}
+            for device_id, device in data.items()
+        ]
+        known = {device["endpointId"]: device for device in self.devices}
+        missing_since, self._missing_since = self._missing_since, {}
+        removed = []
+        for device_id, device in known.items():
+            if device_id in data:
+                continue
+            since = missing_since.get(device_id, now if complete else None)
+            if complete and now - since > RETIRE_AFTER:
+                removed.append(device_id)
+                continue
+            if since is not None:
+                self._missing_since[device_id] = since
+            devices.append(device)
+        if devices == self.devices:
+            return
+        self.devices = devices
+        if self._store is not None:
+            await self._store.async_save({"devices": devices})
+        self._async_devices_changed(
+            [device for device in devices if device["endpointId"] not in known],
+            removed,
+        )
+
+    async def _async_update_data(self) -> dict[str, DeviceState]:
+        """Fetch data from AuxCloud."""
+        try:
+            # First check if we need to re-authenticate
+            if not hasattr(self.api, "loginsession") or not self.api.loginsession:
+                _LOGGER.info("No valid login session, attempting to login")
+                await self.api.login()
+
+            devices = await self.api.get_devices(self._wanted_params())
+            if TRACER.enabled:
+                TRACER.event("coordinator_update", devices=len(devices))
+            now = monotonic()
+            previous = self.data or {}
+            data = {}
+            read = []
+            for device in devices:
+                device_id = device["endpointId"]
+                if "params" in device:
+                    device_state = _shared(
+                        DeviceState.from_payload(self._with_ambient(device, now)),
+                        previous.get(device_id),
+                    )
+                    read.append((device_id, device_state))
+                elif device_id in previous:
+                    # Failed or quarantined this poll: keep the cached state
+                    device_state = previous[device_id]
+                else:
+                    device_state = DeviceState.from_payload(device)
+                data[device_id] = device_state
+        except Exception as err:
+            _LOGGER.exception("Error fetching data")
+            error_msg = f"Error fetching data: {err}"
+            raise UpdateFailed(error_msg) from err
+
+        for device_id, device_state in read:
+            self._last_seen[device_id] = now
+            self._confirmed[device_id] = device_state
+        # Devices missing from this poll are served from cache while fresh
+        for device_id, device in (self.data or {}).items():
+            if device_id not in data and self.is_fresh(device_id, now):
+                data[device_id] = device
+        for device_id in self._last_seen.keys() - data.keys():
+            del self._last_seen[device_id]
+            del self._confirmed[device_id]
+        for device_id in self._ambient.keys() - data.keys():
+            del self._ambient[device_id]
+
+        await self._async_save_devices(data, now, complete=self.api.listing_complete)
+        return _shared(data, previous)
+
+    @callback
+    def async_require_params(
+        self, device_id: str, params: Iterable[str]
+    ) -> CALLBACK_TYPE:
+        """Read ``params`` of a device on every poll until the callback is called."""
+        params = tuple(params)
+        required = self._required.setdefault(device_id, Counter())
+        required.update(params)
+
+        @callback
+        def remove_params() -> None:
+            required.subtract(params)
+
+        return remove_params
+
+    def _wanted_params(self) -> dict[str, list[str]] | None:
+        """Return the params to read per device, or None to read them all."""
+        if not self._required:
+            return None
+        now = monotonic()
+        wanted = {}
+        for device_id in {*self._required, *(self.data or ())}:
+            params = +self._required.get(device_id, Counter())
+            if AMBIENT_PARAM in params and not self._ambient_due(device_id, now):
+                del params[AMBIENT_PARAM]
+            if params.keys() - {AMBIENT_PARAM}:
+                params.update(CONTROL_KEYS)
+            wanted[device_id] = sorted(params)
+        return wanted
+
+    def _ambient_due(self, device_id: str, now: float) -> bool:
+        """Return True if the room temperature of a device should be read."""
+        if (cached := self._ambient.get(device_id)) is None:
+            return True
+        return now - cached[0] >= self.ambient_interval
+
+    def _with_ambient(self, device: dict[str, Any], now: float) -> dict[str, Any]:
+        """Cache a freshly read room temperature, or fill in the cached one."""
+        params = device["params"]
+        if AMBIENT_PARAM in params:
+            self._ambient[device["endpointId"]] = (now, params[AMBIENT_PARAM])
+            return device
+        if (cached := self._ambient.get(device["endpointId"])) is None:
+            return device
+        return {**device, "params": {**params, AMBIENT_PARAM: cached[1]}}
+
+    async def async_set_device_params(
+        self, device_id: str, params: dict[str, Any], *, force: bool = False
+    ) -> None:
+        """
+        Write params to a device, skipping values it already has.
+
+        Unless ``force`` is set, params whose value the last poll read
+        while fresh, and no write changed since, are dropped; nothing is
+        sent if none remain. Values only applied optimistically by earlier
+        writes are never trusted.
+        The params written are applied to the cached state.
+        """
+        if not self.data or (device := self.data.get(device_id)) is None:
+            msg = f"No known state for device {device_id}"
+            raise HomeAssistantError(msg)
+
+        if (
+            not force
+            and self.is_fresh(device_id)
+            and (confirmed := self._confirmed.get(device_id)) is not None
+        ):
+            params = {
+                key: value
+                for key, value in params.items()
+                if confirmed.get(key) != value or device.get(key) != value
+            }
+            if not params:
+                _LOGGER.debug("Device %s already has the requested params", device_id)
+                return
+
+        await self.api.set_device_params(device, params)
+        self.async_apply_params(device_id, params)
+
+    @callback
+    def async_apply_params(self, device_id: str, params: dict[str, Any]) -> None:
+        """Apply written params to the cached state for instant UI feedback."""
+        if not self.data or (device := self.data.get(device_id)) is None:
+            return
+        if (updated := device.with_params(params)) is not device:
+            self.async_set_updated_data({**self.data, device_id: updated})
+
+    async def async_bulk_set(
+        self, device_ids: Sequence[str], params: dict[str, Any]
+    ) -> list[str | None]:
+        """
+        Write the same params to several devices.
+
+        Returns the error of each device, in the order given, or None where
+        the write succeeded. Successful writes are applied to the cached
+        state with a single update.
+        """
+        data = self.data or {}
+        known = list(dict.fromkeys(d for d in device_ids if d in data))
+        results = dict(
+            zip(
+                known,
+                await self.api.bulk_set_device_params(
+                    [data[device_id] for device_id in known], params
+                ),
+                strict=True,
+            )
+        )
+
+        written = {
+            device_id: updated
+            for device_id, result in results.items()
+            if not isinstance(result, BaseException)
+            and (device := (self.data or {}).get(device_id)) is not None
+            and (updated := device.with_params(params)) is not device
+        }
+        if written:
+            self.async_set_updated_data({**self.data, **written})
+
+        errors: list[str | None] = []
+        for device_id in device_ids:
+            if device_id not in results:
+                errors.append("Unknown device")
+            elif isinstance(result := results[device_id], BaseException):
+                errors.append(str(result) or type(result).__name__)
+            else:
+                errors.append(None)
+        return errors
+
+    @property
+    def stale_after(self) -> float:
+        """Return the staleness budget in seconds."""
+        if self.config_entry is None:
+            return DEFAULT_STALE_AFTER
+        return self.config_entry.options.get(CONF_STALE_AFTER, DEFAULT_STALE_AFTER)
+
+    @property
+    def ambient_interval(self) -> float:
+        """Return the seconds between room temperature reads."""
+        if self.config_entry is None:
+            return DEFAULT_AMBIENT_INTERVAL
+        return self.config_entry.options.get(
+            CONF_AMBIENT_INTERVAL, DEFAULT_AMBIENT_INTERVAL
+        )
+
+    def is_fresh(self, device_id: str, now: float | None = None) -> bool:
+        """Return True if the device's cached state is within its budget."""
+        if not self.data or device_id not in self.data:
+            return False
+        if (last_seen := self._last_seen.get(device_id)) is None:
+            return False
+        return (monotonic() if now is None else now) - last_seen <= self.stale_after
+
+    def device_view(self, device_id: str) -> DeviceView | None:
+        """Return the decoded view of a device, decoding each state once."""
+        if not self.data or (state := self.data.get(device_id)) is None:
+            return None
+        view = self._views.get(device_id)
+        if view is None or view.source is not state:
+            view = self._views[device_id] = DeviceView(state)
+        return view
+
+    @callback
+    def _async_changed_devices(self) -> set[str]:
+        """Return the devices whose state or freshness changed since last run."""
+        data = self.data or {}
+        previous, self._notified = self._notified, data
+
+        changed = (
+            set()
+            if data is previous
+            else {
+                device_id
+                for device_id, device in data.items()
+                if previous.get(device_id) is not device
+            }
+        )
+        now = monotonic()
+        fresh = {device_id for device_id in data if self.is_fresh(device_id, now)}
+        changed.update(fresh ^ self._notified_fresh)
+        self._notified_fresh = fresh
+
+        removed = previous.keys() - data.keys()
+        for device_id in removed:
+            self._views.pop(device_id, None)
+        changed.update(removed)
+        return changed
+
+    @callback
+    def _async_schedule_expiry(self) -> None:
+        """Update the listeners again when the next fresh device goes stale."""
+        if self._unsub_expiry is not None:
+            self._unsub_expiry()
+            self._unsub_expiry = None
+        expiries = [
+            last_seen
+            for device_id in self._notified_fresh
+            if (last_seen := self._last_seen.get(device_id)) is not None
+        ]
+        if expiries:
+            delay = min(expiries) + self.stale_after - monotonic()
+            self._unsub_expiry = async_call_later(
+                self.hass, max(delay, 0), self._async_handle_expiry
+            )
+
+    @callback
+    def _async_handle_expiry(self, _now: Any) -> None:
+        """Notify the listeners of devices whose budget ran out."""
+        self._unsub_expiry = None
+        self.async_update_listeners()
+
+    async def async_shutdown(self) -> None:
+        """Cancel the expiry timer and shut down."""
+        if self._unsub_expiry is not None:
+            self._unsub_expiry()
+            self._unsub_expiry = None
+        await super().async_shutdown()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update only the listeners of changed devices."""
+        changed = self._async_changed_devices()
+        self._async_schedule_expiry()
+        if TRACER.enabled:
+            TRACER.event(
+                "listeners",
+                changed=len(changed),
+                listeners=len(self._listeners),
+            )
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in changed:
+                update_callback()
@@ -0,0 +1,185 @@
+"""Decoded, Home Assistant facing view of a Tornado AC device."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.components.climate import HVACAction, HVACMode
+
+if TYPE_CHECKING:
+    from .aux_cloud.device_state import DeviceState
+
+# Map Tornado modes to Home Assistant modes (updated to match remote)
+HVAC_MODE_MAP = {
+    0: HVACMode.COOL,
+    1: HVACMode.HEAT,
+    2: HVACMode.DRY,
+    3: HVACMode.FAN_ONLY,
+    4: HVACMode.AUTO,
+}
+
+# Reverse mapping for setting device params
+HVAC_MODE_MAP_REVERSE = {v: k for k, v in HVAC_MODE_MAP.items()}
+
+# Action reported while the unit is powered in a given mode
+HVAC_ACTION_MAP = {
+    HVACMode.COOL: HVACAction.COOLING,
+    HVACMode.HEAT: HVACAction.HEATING,
+    HVACMode.DRY: HVACAction.DRYING,
+    HVACMode.FAN_ONLY: HVACAction.FAN,
+    HVACMode.AUTO: HVACAction.IDLE,
+}
+
+# Options of the HVAC mode select entity, which falls back to cool
+HVAC_OPTION_MAP = {0: "cool", 1: "heat", 2: "dry", 3: "fan_only", 4: "auto"}
+
+# Map Tornado fan modes to Home Assistant fan modes
+FAN_MODE_MAP = {
+    0: "auto",
+    1: "low",
+    2: "medium",
+    3: "high",
+    4: "turbo",
+    5: "silent",
+}
+
+FAN_MODE_MAP_REVERSE = {v: k for k, v in FAN_MODE_MAP.items()}
+
+# Available swing modes, keyed by (vertical, horizontal) direction
+SWING_MODES = ["off", "vertical", "horizontal", "both"]
+SWING_MODE_MAP = {
+    (0, 0): "off",
+    (1, 0): "vertical",
+    (0, 1): "horizontal",
+    (1, 1): "both",
+}
+
+# Power-saving preset modes (power limit feature)
+# Expanded to cover 30-90% range in 10% increments
+PRESET_MODE_NORMAL = "normal"
+PRESET_MODE_ECO_30 = "eco_30"
+PRESET_MODE_ECO_40 = "eco_40"
+PRESET_MODE_ECO_50 = "eco_50"
+PRESET_MODE_ECO_60 = "eco_60"
+PRESET_MODE_ECO_70 = "eco_70"
+PRESET_MODE_ECO_80 = "eco_80"
+PRESET_MODE_ECO_90 = "eco_90"
+
+PRESET_MODES = [
+    PRESET_MODE_NORMAL,
+    PRESET_MODE_ECO_30,
+    PRESET_MODE_ECO_40,
+    PRESET_MODE_ECO_50,
+    PRESET_MODE_ECO_60,
+    PRESET_MODE_ECO_70,
+    PRESET_MODE_ECO_80,
+    PRESET_MODE_ECO_90,
+]
+
+# Map preset modes to power limit parameters
+PRESET_MODE_PARAMS = {
+    PRESET_MODE_NORMAL: {"pwrlimitswitch": 0},
+    PRESET_MODE_ECO_30: {"pwrlimitswitch": 1, "pwrlimit": 30},
+    PRESET_MODE_ECO_40: {"pwrlimitswitch": 1, "pwrlimit": 40},
+    PRESET_MODE_ECO_50: {"pwrlimitswitch": 1, "pwrlimit": 50},
+    PRESET_MODE_ECO_60: {"pwrlimitswitch": 1, "pwrlimit": 60},
+    PRESET_MODE_ECO_70: {"pwrlimitswitch": 1, "pwrlimit": 70},
+    PRESET_MODE_ECO_80: {"pwrlimitswitch": 1, "pwrlimit": 80},
+    PRESET_MODE_ECO_90: {"pwrlimitswitch": 1, "pwrlimit": 90},
+}
+
+# Power limit range (inclusive) selecting each eco preset:
+# 30-35 -> eco_30, 36-45 -> eco_40, ..., 86-100 -> eco_90
+_PRESET_RANGES = (
+    (30, 35, PRESET_MODE_ECO_30),
+    (36, 45, PRESET_MODE_ECO_40),
+    (46, 55, PRESET_MODE_ECO_50),
+    (56, 65, PRESET_MODE_ECO_60),
+    (66, 75, PRESET_MODE_ECO_70),
+    (76, 85, PRESET_MODE_ECO_80),
+    (86, 100, PRESET_MODE_ECO_90),
+)
+
+# Preset for every power limit value 0-100; anything else is normal
+PRESET_BY_POWER_LIMIT: tuple[str, ...] = tuple(
+    next(
+        (preset for low, high, preset in _PRESET_RANGES if low <= limit <= high),
+        PRESET_MODE_NORMAL,
+    )
+    for limit in range(101)
+)
+
+POWER_LIMIT_OFF = 100
+
+
+# Params each decoded attribute is derived from, for selective polling
+HVAC_PARAMS = ("pwr", "ac_mode")
+FAN_PARAMS = ("ac_mark",)
+SWING_PARAMS = ("ac_vdir", "ac_hdir")
+TARGET_TEMPERATURE_PARAMS = ("temp",)
+CURRENT_TEMPERATURE_PARAMS = ("envtemp",)
+POWER_LIMIT_PARAMS = ("pwrlimitswitch", "pwrlimit")
+
+
+def get_preset_mode_from_power_limit(pwrlimitswitch: int, pwrlimit: int) -> str:
+    """
+    Determine preset mode based on power limit value.
+
+    If slider value is within ±5 of a preset value, that preset is selected.
+    """
+    if not pwrlimitswitch or not 0 <= pwrlimit <= POWER_LIMIT_OFF:
+        return PRESET_MODE_NORMAL
+    return PRESET_BY_POWER_LIMIT[pwrlimit]
+
+
+class DeviceView:
+    """
+    Attributes of one device as the entities present them.
+
+    The coordinator builds one view per device state and every entity of
+    that device reads from it, so params are decoded once per poll.
+    """
+
+    __slots__ = (
+        "current_temperature",
+        "fan_mode",
+        "hvac_action",
+        "hvac_mode",
+        "hvac_option",
+        "power_limit",
+        "preset_mode",
+        "source",
+        "swing_mode",
+        "target_temperature",
+    )
+
+    def __init__(self, state: DeviceState) -> None:
+        """Decode the device state."""
+        self.source = state
+        get = state.get
+
+        if not get("pwr", 0):
+            self.hvac_mode = HVACMode.OFF
+            self.hvac_action = HVACAction.OFF
+            self.hvac_option = "off"
+        else:
+            ac_mode = get("ac_mode", 0)
+            self.hvac_mode = HVAC_MODE_MAP.get(ac_mode, HVACMode.OFF)
+            self.hvac_action = HVAC_ACTION_MAP.get(self.hvac_mode, HVACAction.IDLE)
+            self.hvac_option = HVAC_OPTION_MAP.get(ac_mode, "cool")
+
+        self.fan_mode = FAN_MODE_MAP.get(get("ac_mark", 0), "auto")
+        self.swing_mode = SWING_MODE_MAP.get(
+            (get("ac_vdir", 0), get("ac_hdir", 0)), "off"
+        )
+        self.target_temperature = get("temp", 0) / 10
+        self.current_temperature = get("envtemp", 0) / 10
+
+        pwrlimitswitch = get("pwrlimitswitch", 0)
+        self.preset_mode = get_preset_mode_from_power_limit(
+            pwrlimitswitch, get("pwrlimit", 0)
+        )
+        # The slider shows 100% (no limit) while the power limit is off
+        self.power_limit = (
+            get("pwrlimit", POWER_LIMIT_OFF) if pwrlimitswitch else POWER_LIMIT_OFF
+        )
@@ -0,0 +1,117 @@
+"""Base entity for the Tornado AC integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import ATTR_RESTORED, DOMAIN
+from .coordinator import AuxCloudDataUpdateCoordinator
+
+if TYPE_CHECKING:
+    from .aux_cloud.device_state import DeviceState
+    from .device_view import DeviceView
+
+
+class TornadoEntity(CoordinatorEntity[AuxCloudDataUpdateCoordinator], RestoreEntity):
+    """
+    Entity bound to a single Tornado AC device.
+
+    Until the coordinator completes its first poll the entity shows the
+    state restored from before the restart, marked with the ``restored``
+    attribute. The first poll replaces it with fresh data; if no poll
+    succeeds within the staleness budget, the restored state expires and
+    the entity becomes unavailable.
+
+    While added, the entity asks the coordinator to poll the params listed
+    in ``_required_params``.
+    """
+
+    _required_params: tuple[str, ...] = ()
+
+    def __init__(
+        self,
+        coordinator: AuxCloudDataUpdateCoordinator,
+        device: dict,
+    ) -> None:
+        """Initialize the entity and subscribe to its device only."""
+        super().__init__(coordinator, context=device["endpointId"])
+        self._device_id = device["endpointId"]
+        self._last_fingerprint: tuple[Any, ...] | None = None
+        self._has_restored_state = False
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, device["endpointId"])},
+            "name": f"Tornado AC {device.get('friendlyName')}",
+            "manufacturer": "Tornado",
+            "model": "AUX Cloud",
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the coordinator and load the current device state."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_require_params(
+                self._device_id, self._required_params
+            )
+        )
+        if self.coordinator.data is None:
+            self._has_restored_state = await self._async_restore_state()
+            if self._has_restored_state:
+                self.async_on_remove(
+                    async_call_later(
+                        self.hass,
+                        self.coordinator.stale_after,
+                        self._async_expire_restored_state,
+                    )
+                )
+        self._handle_coordinator_update()
+
+    @callback
+    def _async_expire_restored_state(self, _now: Any) -> None:
+        """Stop showing the restored state once it is older than the budget."""
+        self._has_restored_state = False
+        self._handle_coordinator_update()
+
+    async def _async_restore_state(self) -> bool:
+        """Restore the attributes saved before the restart, if any."""
+        return False
+
+    @property
+    def _restored(self) -> bool:
+        """Return True while restored state is shown instead of polled data."""
+        return self._has_restored_state and self.coordinator.data is None
+
+    @property
+    def _device(self) -> DeviceState | None:
+        """Get current device data from coordinator."""
+        if not self.coordinator.data:
+            return None
+        return self.coordinator.data.get(self._device_id)
+
+    @property
+    def _view(self) -> DeviceView | None:
+        """Get the decoded view of the device shared by all its entities."""
+        return self.coordinator.device_view(self._device_id)
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self._restored or self.coordinator.is_fresh(self._device_id)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Mark restored state as stale."""
+        return {ATTR_RESTORED: True} if self._restored else None
+
+    @callback
+    def _async_write_ha_state_if_changed(self, *fingerprint: Any) -> None:
+        """Write state only if availability or the derived attributes changed."""
+        fingerprint = (self.available, self._restored, *fingerprint)
+        if fingerprint == self._last_fingerprint:
+            return
+        self._last_fingerprint = fingerprint
+        self.async_write_ha_state()
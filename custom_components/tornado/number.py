@@ -5,17 +5,18 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
-from homeassistant.components.number import NumberEntity, NumberMode
+from homeassistant.components.number import NumberMode, RestoreNumber
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .device_view import POWER_LIMIT_PARAMS
+from .entity import TornadoEntity
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-    from .climate import AuxCloudDataUpdateCoordinator
+    from .coordinator import AuxCloudDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,41 +29,39 @@ async def async_setup_entry(
     """Set up Tornado number platform."""
     entry_data = hass.data[DOMAIN][config_entry.entry_id]
     client = entry_data["client"]
-    
-    # Import here to avoid circular dependency
-    from .climate import AuxCloudDataUpdateCoordinator
-    
-    # Get or create coordinator
-    if "coordinator" not in entry_data:
-        coordinator = AuxCloudDataUpdateCoordinator(hass, client)
-        await coordinator.async_config_entry_first_refresh()
-        entry_data["coordinator"] = coordinator
-    else:
-        coordinator = entry_data["coordinator"]
-
-    try:
-        devices = await client.get_devices()
-        entities = []
-
-        for device in devices:
-            # Power limit slider
-            entities.append(
-                TornadoPowerLimitNumber(
-                    coordinator,
-                    device,
-                    client,
+    coordinator = entry_data["coordinator"]
+
+    @callback
+    def async_add_devices(devices: list[dict[str, Any]]) -> None:
+        """Add the entities of ``devices``."""
+        try:
+            entities = []
+
+            for device in devices:
+                # Power limit slider
+                entities.append(
+                    TornadoPowerLimitNumber(
+                        coordinator,
+                        device,
+                        client,
+                    )
                 )
-            )
 
-        async_add_entities(entities)
+            async_add_entities(entities)
+
+        except Exception:
+            _LOGGER.exception("Error setting up Tornado number platform")
 
-    except Exception:
-        _LOGGER.exception("Error setting up Tornado number platform")
+    config_entry.async_on_unload(
+        coordinator.async_add_device_callback(async_add_devices)
+    )
 
 
-class TornadoPowerLimitNumber(CoordinatorEntity, NumberEntity):
+class TornadoPowerLimitNumber(TornadoEntity, RestoreNumber):
     """Representation of a Tornado AC power limit number entity."""
 
+    _required_params = POWER_LIMIT_PARAMS
+
     def __init__(
         self,
         coordinator: AuxCloudDataUpdateCoordinator,
@@ -70,8 +69,7 @@ class TornadoPowerLimitNumber(CoordinatorEntity, NumberEntity):
         client: Any,
     ) -> None:
         """Initialize the power limit number."""
-        super().__init__(coordinator)
-        self._device_id = device["endpointId"]
+        super().__init__(coordinator, device)
         self._client = client
         self._attr_name = f"Tornado AC {device.get('friendlyName')} Power Limit"
         self._attr_unique_id = f"{device['endpointId']}_power_limit"
@@ -81,41 +79,26 @@ class TornadoPowerLimitNumber(CoordinatorEntity, NumberEntity):
         self._attr_mode = NumberMode.SLIDER
         self._attr_native_unit_of_measurement = "%"
         self._attr_icon = "mdi:speedometer"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device["endpointId"])},
-            "name": f"Tornado AC {device.get('friendlyName')}",
-            "manufacturer": "Tornado",
-            "model": "AUX Cloud",
-        }
-
-    @property
-    def _device(self) -> dict | None:
-        """Get current device data from coordinator."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get(self._device_id)
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.last_update_success and self._device is not None
+
+    async def _async_restore_state(self) -> bool:
+        """Restore the last power limit."""
+        last_data = await self.async_get_last_number_data()
+        if last_data is None or last_data.native_value is None:
+            return False
+        self._attr_native_value = last_data.native_value
+        return True
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if not self._device:
+        if (view := self._view) is None:
+            self._async_write_ha_state_if_changed()
             return
 
-        device_params = self._device.get("params", {})
-        
-        # If power limit switch is off, show 100% (no limit)
-        if not device_params.get("pwrlimitswitch", 0):
-            self._attr_native_value = 100
-        else:
-            # Otherwise show the actual limit value from device
-            self._attr_native_value = device_params.get("pwrlimit", 100)
-        
-        self.async_write_ha_state()
+        # 100% (no limit) while the power limit switch is off
+        self._attr_native_value = view.power_limit
+
+        self._async_write_ha_state_if_changed(self._attr_native_value)
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new power limit value.
@@ -137,15 +120,7 @@ class TornadoPowerLimitNumber(CoordinatorEntity, NumberEntity):
                 params = {"pwrlimitswitch": 1, "pwrlimit": int(value)}
             
             # Send to device
-            await self._client.set_device_params(self._device, params)
-            
-            # Immediately update coordinator data for instant UI feedback
-            if self.coordinator.data and self._device_id in self.coordinator.data:
-                device_data = self.coordinator.data[self._device_id]
-                if "params" in device_data:
-                    device_data["params"].update(params)
-                    # Trigger coordinator update to notify all entities
-                    self.coordinator.async_set_updated_data(self.coordinator.data)
+            await self.coordinator.async_set_device_params(self._device_id, params)
             
         except Exception:
             _LOGGER.exception(
@@ -6,21 +6,22 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
+    RestoreSensor,
     SensorDeviceClass,
-    SensorEntity,
     SensorStateClass,
 )
 from homeassistant.const import UnitOfTemperature
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .device_view import CURRENT_TEMPERATURE_PARAMS, TARGET_TEMPERATURE_PARAMS
+from .entity import TornadoEntity
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-    from .climate import AuxCloudDataUpdateCoordinator
+    from .coordinator import AuxCloudDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,48 +33,43 @@ async def async_setup_entry(
 ) -> None:
     """Set up Tornado sensor platform."""
     entry_data = hass.data[DOMAIN][config_entry.entry_id]
-    client = entry_data["client"]
-    
-    # Import here to avoid circular dependency
-    from .climate import AuxCloudDataUpdateCoordinator
-    
-    # Get or create coordinator
-    if "coordinator" not in entry_data:
-        coordinator = AuxCloudDataUpdateCoordinator(hass, client)
-        await coordinator.async_config_entry_first_refresh()
-        entry_data["coordinator"] = coordinator
-    else:
-        coordinator = entry_data["coordinator"]
-
-    try:
-        devices = await client.get_devices()
-        entities = []
-
-        for device in devices:
-            # Room temperature sensor
-            entities.append(
-                TornadoTemperatureSensor(
-                    coordinator,
-                    device,
-                    "current",
+    coordinator = entry_data["coordinator"]
+
+    @callback
+    def async_add_devices(devices: list[dict[str, Any]]) -> None:
+        """Add the entities of ``devices``."""
+        try:
+            entities = []
+
+            for device in devices:
+                # Room temperature sensor
+                entities.append(
+                    TornadoTemperatureSensor(
+                        coordinator,
+                        device,
+                        "current",
+                    )
                 )
-            )
-            # Target temperature sensor
-            entities.append(
-                TornadoTemperatureSensor(
-                    coordinator,
-                    device,
-                    "target",
+                # Target temperature sensor
+                entities.append(
+                    TornadoTemperatureSensor(
+                        coordinator,
+                        device,
+                        "target",
+                    )
                 )
-            )
 
-        async_add_entities(entities)
+            async_add_entities(entities)
 
-    except Exception:
-        _LOGGER.exception("Error setting up Tornado sensor platform")
+        except Exception:
+            _LOGGER.exception("Error setting up Tornado sensor platform")
 
+    config_entry.async_on_unload(
+        coordinator.async_add_device_callback(async_add_devices)
+    )
 
-class TornadoTemperatureSensor(CoordinatorEntity, SensorEntity):
+
+class TornadoTemperatureSensor(TornadoEntity, RestoreSensor):
     """Representation of a Tornado AC temperature sensor."""
 
     def __init__(
@@ -83,52 +79,42 @@ class TornadoTemperatureSensor(CoordinatorEntity, SensorEntity):
         sensor_type: str,
     ) -> None:
         """Initialize the temperature sensor."""
-        super().__init__(coordinator)
-        self._device_id = device["endpointId"]
+        super().__init__(coordinator, device)
         self._sensor_type = sensor_type
         
         if sensor_type == "current":
             self._attr_name = f"Tornado AC {device.get('friendlyName')} Room Temperature"
             self._attr_unique_id = f"{device['endpointId']}_current_temperature"
+            self._required_params = CURRENT_TEMPERATURE_PARAMS
         else:
             self._attr_name = f"Tornado AC {device.get('friendlyName')} Target Temperature"
             self._attr_unique_id = f"{device['endpointId']}_target_temperature"
+            self._required_params = TARGET_TEMPERATURE_PARAMS
         
         self._attr_device_class = SensorDeviceClass.TEMPERATURE
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device["endpointId"])},
-            "name": f"Tornado AC {device.get('friendlyName')}",
-            "manufacturer": "Tornado",
-            "model": "AUX Cloud",
-        }
-
-    @property
-    def _device(self) -> dict | None:
-        """Get current device data from coordinator."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get(self._device_id)
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.last_update_success and self._device is not None
+
+    async def _async_restore_state(self) -> bool:
+        """Restore the last temperature."""
+        last_data = await self.async_get_last_sensor_data()
+        if last_data is None or last_data.native_value is None:
+            return False
+        self._attr_native_value = last_data.native_value
+        return True
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if not self._device:
+        if (view := self._view) is None:
+            self._async_write_ha_state_if_changed()
             return
 
-        device_params = self._device.get("params", {})
-        
         if self._sensor_type == "current":
             # Room temperature (envtemp)
-            self._attr_native_value = device_params.get("envtemp", 0) / 10
+            self._attr_native_value = view.current_temperature
         else:
             # Target temperature (temp)
-            self._attr_native_value = device_params.get("temp", 0) / 10
-        
-        self.async_write_ha_state()
+            self._attr_native_value = view.target_temperature
+
+        self._async_write_ha_state_if_changed(self._attr_native_value)
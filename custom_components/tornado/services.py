@@ -0,0 +1,222 @@
+"""Services for the Tornado AC integration."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.const import ATTR_DEVICE_ID, ATTR_NAME
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+
+from .aux_cloud.device_state import CONTROL_KEYS
+from .climate import validate_params
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import AuxCloudDataUpdateCoordinator
+
+SERVICE_BULK_SET = "bulk_set"
+SERVICE_SNAPSHOT = "snapshot"
+SERVICE_RESTORE = "restore"
+ATTR_PARAMS = "params"
+ATTR_FORCE = "force"
+DEFAULT_SNAPSHOT = "default"
+
+# Snapshot name -> endpoint id -> controllable params
+DATA_SNAPSHOTS = f"{DOMAIN}_snapshots"
+
+_DEVICE_IDS = vol.All(cv.ensure_list, [cv.string])
+
+BULK_SET_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DEVICE_ID): _DEVICE_IDS,
+        vol.Required(ATTR_PARAMS): vol.All(
+            {cv.string: vol.Coerce(int)}, vol.Length(min=1)
+        ),
+    }
+)
+SNAPSHOT_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DEVICE_ID): _DEVICE_IDS,
+        vol.Optional(ATTR_NAME, default=DEFAULT_SNAPSHOT): cv.string,
+    }
+)
+RESTORE_SCHEMA = SNAPSHOT_SCHEMA.extend(
+    {vol.Optional(ATTR_FORCE, default=False): cv.boolean}
+)
+
+
+def _coordinators(hass: HomeAssistant) -> list[AuxCloudDataUpdateCoordinator]:
+    """Return the coordinators of all loaded config entries."""
+    return [
+        entry_data["coordinator"]
+        for entry_data in hass.data.get(DOMAIN, {}).values()
+        if "coordinator" in entry_data
+    ]
+
+
+def _endpoint_ids(hass: HomeAssistant, device_ids: list[str]) -> list[str]:
+    """Map Home Assistant device ids to AuxCloud endpoint ids."""
+    registry = dr.async_get(hass)
+    endpoint_ids = []
+    for device_id in device_ids:
+        device = registry.async_get(device_id)
+        identifiers = [
+            identifier
+            for domain, identifier in (device.identifiers if device else ())
+            if domain == DOMAIN
+        ]
+        if not identifiers:
+            msg = f"Device {device_id} is not a Tornado AC"
+            raise ServiceValidationError(msg)
+        endpoint_ids.extend(identifiers)
+    return endpoint_ids
+
+
+def _selected_endpoint_ids(
+    hass: HomeAssistant,
+    call: ServiceCall,
+    coordinators: list[AuxCloudDataUpdateCoordinator],
+) -> list[str]:
+    """Return the endpoints a call targets, all known ones by default."""
+    if ATTR_DEVICE_ID in call.data:
+        return _endpoint_ids(hass, call.data[ATTR_DEVICE_ID])
+    return [
+        device_id
+        for coordinator in coordinators
+        for device_id in coordinator.data or ()
+    ]
+
+
+def _owner(
+    coordinators: list[AuxCloudDataUpdateCoordinator], endpoint_id: str
+) -> AuxCloudDataUpdateCoordinator | None:
+    """Return the first coordinator polling an endpoint."""
+    return next(
+        (
+            coordinator
+            for coordinator in coordinators
+            if endpoint_id in (coordinator.data or ())
+        ),
+        None,
+    )
+
+
+def _results(errors: dict[str, str | None]) -> ServiceResponse:
+    """Build the per-device service response."""
+    results: list[dict[str, Any]] = []
+    for endpoint_id, error in errors.items():
+        result: dict[str, Any] = {"endpoint_id": endpoint_id, "success": True}
+        if error is not None:
+            result.update(success=False, error=error)
+        results.append(result)
+    return {"results": results}
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Tornado AC services."""
+    snapshots: dict[str, dict[str, dict[str, Any]]] = hass.data.setdefault(
+        DATA_SNAPSHOTS, {}
+    )
+
+    async def async_bulk_set(call: ServiceCall) -> ServiceResponse:
+        """Write the same params to many devices at once."""
+        validate_params(call.data[ATTR_PARAMS])
+        coordinators = _coordinators(hass)
+        endpoint_ids = _selected_endpoint_ids(hass, call, coordinators)
+
+        # Each endpoint is written once, through the first entry polling it
+        batches: dict[AuxCloudDataUpdateCoordinator, list[str]] = {}
+        for endpoint_id in dict.fromkeys(endpoint_ids):
+            if (coordinator := _owner(coordinators, endpoint_id)) is not None:
+                batches.setdefault(coordinator, []).append(endpoint_id)
+        errors: dict[str, str | None] = dict.fromkeys(endpoint_ids, "Unknown device")
+        for owned, batch_errors in zip(
+            batches.values(),
+            await asyncio.gather(
+                *(
+                    coordinator.async_bulk_set(owned, call.data[ATTR_PARAMS])
+                    for coordinator, owned in batches.items()
+                )
+            ),
+            strict=True,
+        ):
+            errors.update(zip(owned, batch_errors, strict=True))
+        return _results(errors)
+
+    async def async_snapshot(call: ServiceCall) -> ServiceResponse:
+        """Save the cached controllable params of the selected devices."""
+        coordinators = _coordinators(hass)
+        snapshot = {}
+        missing = {}
+        for endpoint_id in _selected_endpoint_ids(hass, call, coordinators):
+            if (coordinator := _owner(coordinators, endpoint_id)) is not None:
+                params = coordinator.data[endpoint_id].controllable_params
+                snapshot[endpoint_id] = params
+                # Devices whose params are not polled have nothing cached
+                if gaps := [key for key in CONTROL_KEYS if key not in params]:
+                    missing[endpoint_id] = gaps
+        snapshots[call.data[ATTR_NAME]] = snapshot
+        return {"devices": snapshot, "missing": missing}
+
+    async def async_restore(call: ServiceCall) -> ServiceResponse:
+        """Write a snapshot back with one request per device."""
+        if (snapshot := snapshots.get(call.data[ATTR_NAME])) is None:
+            msg = f"No snapshot named {call.data[ATTR_NAME]}"
+            raise ServiceValidationError(msg)
+        coordinators = _coordinators(hass)
+        if ATTR_DEVICE_ID in call.data:
+            endpoint_ids = [
+                endpoint_id
+                for endpoint_id in _endpoint_ids(hass, call.data[ATTR_DEVICE_ID])
+                if endpoint_id in snapshot
+            ]
+        else:
+            endpoint_ids = list(snapshot)
+
+        async def restore(endpoint_id: str) -> str | None:
+            if (coordinator := _owner(coordinators, endpoint_id)) is None:
+                return "Unknown device"
+            try:
+                await coordinator.async_set_device_params(
+                    endpoint_id, snapshot[endpoint_id], force=call.data[ATTR_FORCE]
+                )
+            except Exception as err:  # noqa: BLE001 - reported per device
+                return str(err) or type(err).__name__
+            return None
+
+        errors = await asyncio.gather(*(restore(e) for e in endpoint_ids))
+        return _results(dict(zip(endpoint_ids, errors, strict=True)))
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BULK_SET,
+        async_bulk_set,
+        schema=BULK_SET_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SNAPSHOT,
+        async_snapshot,
+        schema=SNAPSHOT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RESTORE,
+        async_restore,
+        schema=RESTORE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -13,7 +13,9 @@ import pytest
 import tenacity
 
 from custom_components.tornado.aux_cloud import (
+    LISTING_KEYS,
     AuxCloudAPI,
+    AuxCloudApiError,
     AuxCloudAuthError,
 )
 
@@ -38,6 +40,11 @@ def mock_response() -> MagicMock:
     response.__aenter__ = AsyncMock(return_value=response)
     response.__aexit__ = AsyncMock()
     response.text = AsyncMock()
+
+    async def read() -> bytes:
+        return (await response.text()).encode()
+
+    response.read = read
     return response
 
 
@@ -108,11 +115,8 @@ async def test_login_success(mock_session: MagicMock, mock_response: MagicMock)
 
 
 @pytest.mark.asyncio
-async def test_login_error_handling(
-    mock_session: MagicMock, mock_response: MagicMock
-) -> None:
-    """Test failed login using a fake client session that simulates a failed login."""
-    mock_session.post.return_value = mock_response
+async def test_login_error_handling(mock_session: MagicMock) -> None:
+    """Test failed login using a fake response that simulates a failed login."""
     api = AuxCloudAPI(
         "test@example.com", "wrongpassword", session=mock_session, region="eu"
     )
@@ -129,32 +133,12 @@ async def test_login_error_handling(
         ) -> None:
             pass
 
-        async def text(self) -> str:
-            return json.dumps({"status": 1, "msg": "Invalid credentials"})
-
-    class FakeClientSession:
-        def __init__(self, **kwargs: Any) -> None:
-            pass
-
-        async def __aenter__(self) -> "FakeClientSession":
-            return self
-
-        async def __aexit__(
-            self,
-            exc_type: type[BaseException] | None,
-            exc: BaseException | None,
-            tb: TracebackType | None,
-        ) -> None:
-            pass
+        async def read(self) -> bytes:
+            return json.dumps({"status": 1, "msg": "Invalid credentials"}).encode()
 
-        def post(self, url: str, **kwargs: Any) -> FakeResponse:
-            _ = url, kwargs
-            return FakeResponse()
+    mock_session.post.return_value = FakeResponse()
 
-    with (
-        patch("aiohttp.ClientSession", FakeClientSession),
-        pytest.raises(AuxCloudAuthError, match="Login failed: Invalid credentials"),
-    ):
+    with pytest.raises(AuxCloudAuthError, match="Login failed: Invalid credentials"):
         await api.login()
 
 
@@ -912,6 +896,11 @@ async def test_shared_devices_caching_complete(
             "get_device_params",
             AsyncMock(side_effect=[params_response, ambient_response] * 4),
         ),
+        patch.object(
+            api,
+            "query_device_temperature",
+            AsyncMock(side_effect=AuxCloudApiError("Unsupported")),
+        ),
     ):
         regular_devices = await api.list_devices("family1", shared=False)
         assert len(regular_devices) == 1
@@ -928,11 +917,14 @@ async def test_shared_devices_caching_complete(
         assert "device1" in device_ids
         assert "shared1" in device_ids
 
-        for device in cached_devices:
+        for device in (*regular_devices, *shared_devices):
             assert "state" in device
             assert "params" in device
             assert device["params"]["temp"] == TEST_TEMPERATURE
             assert device["params"]["envtemp"] == TEST_AMBIENT_TEMP
+        # Only the listing fields the client needs are cached
+        for device in cached_devices:
+            assert set(device) <= set(LISTING_KEYS)
 
 
 @pytest.mark.asyncio
@@ -1005,11 +997,12 @@ async def test_shared_devices_caching_no_shared_devices(
                 assert len(cached_devices) == 1
                 assert cached_devices[0]["endpointId"] == "device1"
 
-                device = cached_devices[0]
+                device = regular_devices[0]
                 assert "state" in device
                 assert "params" in device
                 assert device["params"]["temp"] == TEST_TEMPERATURE
                 assert device["params"]["envtemp"] == TEST_AMBIENT_TEMP
+                assert "params" not in cached_devices[0]
 
                 has_shared = await api._has_shared_devices("family1")
                 assert not has_shared
@@ -1133,3 +1126,468 @@ async def test_get_shared_session() -> None:
         await session1.connector.close()
     AuxCloudAPI._shared_session = None
     AuxCloudAPI._shared_connector = None
+
+
+@pytest.mark.asyncio
+async def test_unresponsive_device_is_bounded_and_quarantined(
+    api: AuxCloudAPI, mock_session: MagicMock, mock_response: MagicMock
+) -> None:
+    """Test that a hanging device costs one deadline and is then skipped."""
+    endpoints = [
+        {"endpointId": endpoint_id, "devSession": "session"}
+        for endpoint_id in ("fast", "hung")
+    ]
+    mock_response.text = AsyncMock(
+        side_effect=lambda: json.dumps(
+            {"status": 0, "data": {"endpoints": [dict(e) for e in endpoints]}}
+        )
+    )
+    mock_session.post.return_value = mock_response
+    api.device_deadline = 0.05
+    never = asyncio.Event()
+
+    async def query_state(device_id: str, _dev_session: str) -> dict[str, Any]:
+        if device_id == "hung":
+            await never.wait()
+        return {"status": 0, "data": [{"state": 1}]}
+
+    async def get_params(
+        _dev: dict[str, Any], params: list[str] | None = None
+    ) -> dict[str, Any]:
+        return {"envtemp": TEST_AMBIENT_TEMP} if params else {"temp": TEST_TEMPERATURE}
+
+    with (
+        patch.object(api, "query_device_state", side_effect=query_state) as state,
+        patch.object(api, "get_device_params", side_effect=get_params),
+    ):
+        async with asyncio.timeout(1):
+            devices = await api.list_devices("family1")
+
+        fast, hung = devices
+        assert fast["params"] == {
+            "temp": TEST_TEMPERATURE,
+            "envtemp": TEST_AMBIENT_TEMP,
+        }
+        assert "params" not in hung
+        assert api.health.status == {"fast": "ok", "hung": "timeout"}
+
+        state.reset_mock()
+        devices = await api.list_devices("family1")
+
+        assert "params" in devices[0]
+        assert "params" not in devices[1]
+        assert api.health.status["hung"] == "quarantined"
+        state.assert_called_once_with("fast", "session")
+
+
+@pytest.mark.asyncio
+async def test_list_devices_reads_only_wanted_params(
+    api: AuxCloudAPI, mock_session: MagicMock, mock_response: MagicMock
+) -> None:
+    """Test that only the wanted params are requested from each device."""
+    endpoints = [
+        {"endpointId": endpoint_id, "devSession": "session"}
+        for endpoint_id in ("room", "target", "unused")
+    ]
+    mock_response.text = AsyncMock(
+        return_value=json.dumps({"status": 0, "data": {"endpoints": endpoints}})
+    )
+    mock_session.post.return_value = mock_response
+
+    async def get_params(
+        _dev: dict[str, Any], params: list[str] | None = None
+    ) -> dict[str, Any]:
+        if params == ["mode"]:
+            return {"envtemp": TEST_AMBIENT_TEMP}
+        return dict.fromkeys(params, 1)
+
+    with (
+        patch.object(
+            api,
+            "query_device_state",
+            AsyncMock(return_value={"status": 0, "data": [{"state": 1}]}),
+        ),
+        patch.object(api, "get_device_params", side_effect=get_params) as params,
+    ):
+        room, target, unused = await api.list_devices(
+            "family1",
+            wanted_params={
+                "room": ["pwr", "envtemp"],
+                "target": ["temp"],
+                "unused": [],
+            },
+        )
+
+    assert room["params"] == {"pwr": 1, "envtemp": TEST_AMBIENT_TEMP}
+    assert target["params"] == {"temp": 1}
+    assert unused["params"] == {}
+    assert sorted(
+        (call.args[0]["endpointId"], call.args[1]) for call in params.call_args_list
+    ) == [("room", ["mode"]), ("room", ["pwr"]), ("target", ["temp"])]
+    assert set(api.health.status.values()) == {"ok"}
+
+
+@pytest.mark.asyncio
+async def test_ambient_route_is_probed_once_per_product(api: AuxCloudAPI) -> None:
+    """Test that the first route to answer is cached for the product."""
+    dev = {"endpointId": "dev1", "devSession": "sess1", "productId": "prod1"}
+    slow = asyncio.Event()
+
+    async def sdkcontrol(*_: Any) -> dict[str, Any]:
+        await slow.wait()
+        return {"envtemp": 0}
+
+    with (
+        patch.object(
+            api,
+            "query_device_temperature",
+            AsyncMock(return_value={"status": 0, "temperature": 23.5}),
+        ) as sensor,
+        patch.object(api, "get_device_params", side_effect=sdkcontrol) as params,
+    ):
+        assert await api.query_ambient_temperature(dev) == {"envtemp": 235}
+        assert api.ambient_routes == {"prod1": "temperaturesensor"}
+
+        params.reset_mock()
+        sensor.return_value = {"status": 0, "temperature": 24}
+        assert await api.query_ambient_temperature(dev) == {"envtemp": 240}
+        params.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_failing_ambient_route_is_probed_again(api: AuxCloudAPI) -> None:
+    """Test that a route that stops working is forgotten and replaced."""
+    dev = {"endpointId": "dev1", "devSession": "sess1", "productId": "prod1"}
+    api.ambient_routes["prod1"] = "temperaturesensor"
+
+    with (
+        patch.object(
+            api,
+            "query_device_temperature",
+            AsyncMock(side_effect=AuxCloudApiError("Unsupported")),
+        ),
+        patch.object(
+            api,
+            "get_device_params",
+            AsyncMock(return_value={"envtemp": TEST_AMBIENT_TEMP}),
+        ),
+    ):
+        with pytest.raises(AuxCloudApiError):
+            await api.query_ambient_temperature(dev)
+        assert api.ambient_routes == {}
+
+        assert await api.query_ambient_temperature(dev) == {
+            "envtemp": TEST_AMBIENT_TEMP
+        }
+        assert api.ambient_routes == {"prod1": "sdkcontrol"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("temperature", [None, "23.5", 3276.7, float("nan")])
+async def test_implausible_ambient_reading_falls_back(
+    api: AuxCloudAPI, temperature: Any
+) -> None:
+    """Test that a bad sensor reading is replaced by the state query route."""
+    dev = {"endpointId": "dev1", "devSession": "sess1", "productId": "prod1"}
+    api.ambient_routes["prod1"] = "temperaturesensor"
+
+    with (
+        patch.object(
+            api,
+            "query_device_temperature",
+            AsyncMock(return_value={"status": 0, "temperature": temperature}),
+        ),
+        patch.object(
+            api,
+            "get_device_params",
+            AsyncMock(return_value={"envtemp": TEST_AMBIENT_TEMP}),
+        ) as params,
+    ):
+        assert await api.query_ambient_temperature(dev) == {
+            "envtemp": TEST_AMBIENT_TEMP
+        }
+    params.assert_awaited_once_with(dev, ["mode"])
+    assert api.ambient_routes == {"prod1": "sdkcontrol"}
+
+
+@pytest.mark.asyncio
+async def test_bulk_set_device_params_bounds_concurrency(api: AuxCloudAPI) -> None:
+    """Test that bulk writes are bounded and report results in order."""
+    in_flight = 0
+    peak = 0
+
+    async def act(
+        device: dict[str, Any],
+        _act: str,
+        params: list[str],
+        vals: list[list[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        if device["endpointId"] == "dev3":
+            msg = "Device offline"
+            raise AuxCloudApiError(msg)
+        return {params[0]: vals[0][0]["val"]}
+
+    devices = [{"endpointId": f"dev{i}"} for i in range(10)]
+    with patch.object(api, "_act_device_params", side_effect=act):
+        results = await api.bulk_set_device_params(devices, {"pwr": 0}, concurrency=3)
+
+    assert peak == 3  # noqa: PLR2004
+    assert isinstance(results[3], AuxCloudApiError)
+    assert results[:3] == [{"pwr": 0}] * 3
+    assert results[4:] == [{"pwr": 0}] * 6
+
+
+@pytest.mark.asyncio
+async def test_request_bodies_are_templated_per_device(
+    api: AuxCloudAPI, mock_session: MagicMock, mock_response: MagicMock
+) -> None:
+    """Test that each device's bodies are built once and only the slots vary."""
+    device = {
+        "endpointId": "dev1",
+        "productId": "prod1",
+        "mac": "00:11:22:33:44:55",
+        "devicetypeFlag": 0,
+        "devSession": "sess1",
+        "cookie": ("eyJ0ZXJtaW5hbGlkIjogInRlcm0xIiwgImFlc2tleSI6ICJrZXkxIn0="),
+    }
+    mock_response.text.return_value = json.dumps(
+        {
+            "event": {
+                "payload": {
+                    "status": 0,
+                    "data": json.dumps({"params": ["pwr"], "vals": [[{"val": 1}]]}),
+                }
+            }
+        }
+    )
+    mock_session.post.return_value = mock_response
+
+    with patch("time.time", return_value=1000):
+        await api.get_device_params(device, ["pwr"])
+        await api.set_device_params(device, {"temp": 240})
+        await api.query_device_state("dev1", "sess1")
+    template = api._templates["sdkcontrol", "dev1"]
+    with patch("time.time", return_value=1001):
+        await api.set_device_params(device, {"pwr": 0})
+        await api.query_device_state("dev1", "sess1")
+    assert api._templates["sdkcontrol", "dev1"] is template
+    assert len(api._templates) == 2  # noqa: PLR2004
+
+    bodies = [
+        json.loads(call.kwargs["data"]) for call in mock_session.post.call_args_list
+    ]
+    get, first_set, first_state, second_set, second_state = bodies
+    assert get["directive"]["payload"] == {
+        "act": "get",
+        "params": ["pwr"],
+        "vals": [],
+    }
+    assert first_set["directive"]["header"]["messageId"] == "dev1-1000"
+    assert second_set["directive"]["header"]["messageId"] == "dev1-1001"
+    assert second_set["directive"]["payload"] == {
+        "act": "set",
+        "params": ["pwr"],
+        "vals": [[{"val": 0, "idx": 1}]],
+    }
+    assert second_set["directive"]["endpoint"] == first_set["directive"]["endpoint"]
+    assert first_state["directive"]["header"]["timestamp"] == "1000"
+    assert second_state["directive"]["header"]["messageId"] == "test_user-1001"
+    assert second_state["directive"]["payload"]["studata"] == [
+        {"did": "dev1", "devSession": "sess1"}
+    ]
+
+    # A new device session rebuilds the template
+    await api.set_device_params({**device, "devSession": "sess2"}, {"pwr": 1})
+    assert api._templates["sdkcontrol", "dev1"] is not template
+
+
+@pytest.mark.asyncio
+async def test_discovery_cache_is_per_account(
+    mock_session: MagicMock, mock_response: MagicMock
+) -> None:
+    """Test that two accounts keep their family lists cached side by side."""
+    mock_response.text.side_effect = lambda: json.dumps(
+        {
+            "status": 0,
+            "data": {
+                "familyList": [
+                    {
+                        "familyid": mock_session.post.call_args.kwargs["headers"][
+                            "userid"
+                        ]
+                    }
+                    | {"name": "Home"}
+                ]
+            },
+        }
+    )
+    mock_session.post.return_value = mock_response
+    accounts = []
+    for user in ("user_a", "user_b"):
+        api = AuxCloudAPI(f"{user}@example.com", "pw", session=mock_session)
+        api.loginsession = "session"
+        api.userid = user
+        accounts.append(api)
+
+    with patch.object(
+        AuxCloudAPI, "get_shared_session", AsyncMock(return_value=mock_session)
+    ):
+        for _ in range(3):
+            for api in accounts:
+                families = await api.list_families()
+                assert families[0]["familyid"] == api.userid
+
+    assert mock_session.post.call_count == len(accounts)
+    for api in accounts:
+        assert api.list_families.cache_info() == (2, 1, 1)
+
+    # Logging in as another user drops the cached discovery
+    accounts[0].invalidate_discovery()
+    assert accounts[0].list_families.cache_info().size == 0
+    assert accounts[1].list_families.cache_info().size == 1
+
+
+@pytest.mark.asyncio
+async def test_topology_change_refreshes_discovery(api: AuxCloudAPI) -> None:
+    """Test that discovery is only refetched when the devices listed change."""
+    device = {"endpointId": "dev1", "devSession": "sess1", "cookie": "c"}
+    listings = [[device], [device], [device, {**device, "endpointId": "dev2"}]]
+    families = AsyncMock(return_value=[{"familyid": "fam"}])
+    shared = AsyncMock(return_value=False)
+
+    with (
+        patch.object(api, "list_families", families),
+        patch.object(api, "_has_shared_devices", shared),
+        patch.object(api, "list_devices", AsyncMock(side_effect=listings)),
+        patch.object(api, "invalidate_discovery") as invalidate_discovery,
+    ):
+        await api.get_devices()
+        topology = api.topology
+        await api.get_devices()
+        invalidate_discovery.assert_not_called()
+        assert api.topology == topology
+
+        await api.get_devices()
+        invalidate_discovery.assert_called_once()
+        assert api.topology != topology
+
+
+@pytest.mark.asyncio
+async def test_get_devices_returns_each_endpoint_once(
+    api: AuxCloudAPI, mock_session: MagicMock, mock_response: MagicMock
+) -> None:
+    """Test that a unit both owned and shared is polled and returned once."""
+    owned = {"endpointId": "dev1", "devSession": "owned"}
+    shared = {"endpointId": "dev1", "devSession": "shared"}
+    other = {"endpointId": "dev2", "devSession": "shared"}
+    mock_response.text = AsyncMock(
+        side_effect=[
+            json.dumps({"status": 0, "data": {"endpoints": [owned]}}),
+            json.dumps(
+                {
+                    "status": 0,
+                    "data": {
+                        "shareFromOther": [{"devinfo": shared}, {"devinfo": other}]
+                    },
+                }
+            ),
+        ]
+    )
+    mock_session.post.return_value = mock_response
+
+    with (
+        patch.object(
+            api, "list_families", AsyncMock(return_value=[{"familyid": "fam"}])
+        ),
+        patch.object(api, "_has_shared_devices", AsyncMock(return_value=True)),
+        patch.object(
+            api, "_poll_device", AsyncMock(side_effect=lambda dev, _: dev)
+        ) as poll_device,
+    ):
+        devices = await api.get_devices()
+
+    assert devices == [owned, other]
+    assert [call.args[0] for call in poll_device.await_args_list] == [owned, other]
+    assert api.endpoints.get("dev2").shared
+    assert api.data["fam"]["devices"] == [owned, other]
+
+
+@pytest.mark.asyncio
+async def test_listing_keeps_only_identity_fields(
+    api: AuxCloudAPI, mock_session: MagicMock, mock_response: MagicMock
+) -> None:
+    """Test that the index drops cloud fields and never sees polled params."""
+    device = {
+        "endpointId": "dev1",
+        "devSession": "sess1",
+        "friendlyName": "Living Room",
+        "roomId": "room1",
+        "icon": "https://example.com/icon.png",
+    }
+    mock_response.text = AsyncMock(
+        return_value=json.dumps({"status": 0, "data": {"endpoints": [device]}})
+    )
+    mock_session.post.return_value = mock_response
+
+    with (
+        patch.object(api, "query_device_state", AsyncMock(side_effect=TimeoutError)),
+        patch.object(api, "get_device_params", AsyncMock(return_value={"pwr": 1})),
+    ):
+        (polled,) = await api.list_devices("fam", wanted_params={"dev1": ["pwr"]})
+
+    assert polled["params"] == {"pwr": 1}
+    assert "roomId" not in polled
+    assert api.endpoints.get("dev1").device == {
+        "endpointId": "dev1",
+        "devSession": "sess1",
+        "friendlyName": "Living Room",
+    }
+
+
+@pytest.mark.asyncio
+async def test_failed_shared_check_keeps_shared_listing(api: AuxCloudAPI) -> None:
+    """Test that a failing shared-device check marks the listing incomplete."""
+    owned = {"endpointId": "dev1", "devSession": "sess1"}
+    share = {"endpointId": "dev2", "devSession": "sess2"}
+    api.endpoints.update("fam", [share], shared=True)
+    shared = AsyncMock(side_effect=aiohttp.ClientError("offline"))
+
+    with (
+        patch.object(
+            api, "list_families", AsyncMock(return_value=[{"familyid": "fam"}])
+        ),
+        patch.object(api, "_has_shared_devices", shared),
+        patch.object(api, "list_devices", AsyncMock(return_value=[owned])),
+    ):
+        assert await api.get_devices() == [owned]
+        assert not api.listing_complete
+        assert api.topology is None
+        assert "dev2" in api.endpoints
+
+        shared.side_effect = None
+        shared.return_value = False
+        await api.get_devices()
+        assert api.listing_complete
+        assert "dev2" not in api.endpoints
+
+
+@pytest.mark.asyncio
+async def test_failed_listing_refreshes_discovery(api: AuxCloudAPI) -> None:
+    """Test that a failing family listing drops the cached families."""
+    with (
+        patch.object(
+            api, "list_families", AsyncMock(return_value=[{"familyid": "gone"}])
+        ),
+        patch.object(
+            api, "list_devices", AsyncMock(side_effect=AuxCloudApiError("No family"))
+        ),
+        patch.object(api, "invalidate_discovery") as invalidate_discovery,
+        pytest.raises(AuxCloudApiError),
+    ):
+        await api.get_devices()
+    invalidate_discovery.assert_called_once()
@@ -0,0 +1,61 @@
+"""Tests for the per-instance TTL caches."""
+
+from unittest.mock import patch
+
+from custom_components.tornado.aux_cloud.cache import (
+    CacheInfo,
+    TTLCache,
+    cached_method,
+)
+
+
+class Client:
+    """Client with a cached method counting its real calls."""
+
+    def __init__(self) -> None:
+        """Initialize the call counter."""
+        self.calls = 0
+
+    @cached_method(ttl=10, maxsize=2)
+    async def fetch(self, key: str) -> str:
+        """Return a value per key."""
+        self.calls += 1
+        return f"{key}-{self.calls}"
+
+
+def test_ttl_cache_expiry_and_eviction() -> None:
+    """Test that entries expire after the TTL and the oldest is evicted."""
+    cache = TTLCache(ttl=10, maxsize=2)
+    cache.set("a", 1, now=0)
+    cache.set("b", 2, now=1)
+    assert cache.get("a", now=9) == (True, 1)
+    assert cache.get("a", now=10) == (False, None)
+
+    cache.set("a", 1, now=10)
+    cache.set("c", 3, now=10)
+    assert cache.get("b", now=10) == (False, None)
+    assert cache.info() == CacheInfo(hits=1, misses=2, size=2)
+
+
+async def test_cached_method_is_per_instance() -> None:
+    """Test that each instance keeps its own results and counters."""
+    first, second = Client(), Client()
+
+    with patch("time.monotonic", return_value=0):
+        assert await first.fetch("a") == "a-1"
+        assert await second.fetch("a") == "a-1"
+        assert await first.fetch("a") == "a-1"
+        assert await first.fetch("b") == "b-2"
+        assert first.calls == 2  # noqa: PLR2004
+
+    assert first.fetch.cache_info() == CacheInfo(hits=1, misses=2, size=2)
+    assert second.fetch.cache_info() == CacheInfo(hits=0, misses=1, size=1)
+
+    with patch("time.monotonic", return_value=10):
+        assert await first.fetch("a") == "a-3"
+
+    first.fetch.cache_invalidate("a")
+    assert first.fetch.cache_info().size == 1
+    first.fetch.cache_clear()
+    assert first.fetch.cache_info().size == 0
+    assert second.fetch.cache_info().size == 1
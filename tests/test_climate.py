@@ -1,7 +1,9 @@
 """Tests for the Tornado AC climate component."""
 
 import contextlib
-from unittest.mock import AsyncMock, MagicMock
+import gc
+import tracemalloc
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.components.climate import (
@@ -14,18 +16,24 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.tornado.aux_cloud.device_state import DeviceState
 from custom_components.tornado.climate import (
     DOMAIN,
     AuxCloudDataUpdateCoordinator,
     TornadoClimateEntity,
 )
+from custom_components.tornado.entity import TornadoEntity
 
 # Constants for temperature values
 MIN_TEMP = 16
 MAX_TEMP = 32
 CURRENT_TEMP = 27.0
 TARGET_TEMP = 25.0
+RELOAD_CYCLES = 200
+MAX_BYTES_PER_RELOAD = 1024
 
 MOCK_DEVICE = {
     "endpointId": "test_device_id",
@@ -40,6 +48,7 @@ MOCK_DEVICE = {
         "ac_hdir": 0,
     },
 }
+MOCK_STATE = DeviceState.from_payload(MOCK_DEVICE)
 
 
 @pytest.fixture
@@ -109,21 +118,35 @@ async def test_set_temperature(
 ) -> None:
     """Test setting temperature."""
     await entity.async_set_temperature(**{ATTR_TEMPERATURE: 24.0})
-    mock_api.set_device_params.assert_called_once_with(MOCK_DEVICE, {"temp": 240})
+    mock_api.set_device_params.assert_called_once_with(MOCK_STATE, {"temp": 240})
 
 
 async def test_set_hvac_mode(entity: TornadoClimateEntity, mock_api: MagicMock) -> None:
-    """Test setting HVAC mode."""
+    """Test setting HVAC mode; the unit is already on, so pwr is not resent."""
     await entity.async_set_hvac_mode(HVACMode.HEAT)
-    mock_api.set_device_params.assert_called_once_with(
-        MOCK_DEVICE, {"pwr": 1, "ac_mode": 1}
-    )
+    mock_api.set_device_params.assert_called_once_with(MOCK_STATE, {"ac_mode": 1})
 
 
 async def test_turn_off(entity: TornadoClimateEntity, mock_api: MagicMock) -> None:
     """Test turning device off."""
     await entity.async_turn_off()
-    mock_api.set_device_params.assert_called_once_with(MOCK_DEVICE, {"pwr": 0})
+    mock_api.set_device_params.assert_called_once_with(MOCK_STATE, {"pwr": 0})
+
+
+async def test_set_params_force(
+    entity: TornadoClimateEntity, mock_api: MagicMock
+) -> None:
+    """Test that the set_params service resends polled values only when forced."""
+    await entity.async_set_params({"pwr": 1, "temp": 250})
+    mock_api.set_device_params.assert_not_called()
+
+    await entity.async_set_params({"pwr": 1, "temp": 250}, force=True)
+    mock_api.set_device_params.assert_called_once_with(
+        MOCK_STATE, {"pwr": 1, "temp": 250}
+    )
+
+    with pytest.raises(ServiceValidationError):
+        await entity.async_set_params({"temp": 2500}, force=True)
 
 
 async def test_coordinator_update_error(
@@ -171,7 +194,7 @@ async def cleanup_timers(hass: HomeAssistant) -> None:
 async def test_set_fan_mode(entity: TornadoClimateEntity, mock_api: MagicMock) -> None:
     """Test setting fan mode."""
     await entity.async_set_fan_mode("high")
-    mock_api.set_device_params.assert_called_once_with(MOCK_DEVICE, {"ac_mark": 3})
+    mock_api.set_device_params.assert_called_once_with(MOCK_STATE, {"ac_mark": 3})
 
 
 async def test_set_turbo_fan_mode(
@@ -180,7 +203,7 @@ async def test_set_turbo_fan_mode(
 ) -> None:
     """Test setting turbo fan mode."""
     await entity.async_set_fan_mode("turbo")
-    mock_api.set_device_params.assert_called_once_with(MOCK_DEVICE, {"ac_mark": 4})
+    mock_api.set_device_params.assert_called_once_with(MOCK_STATE, {"ac_mark": 4})
 
 
 async def test_set_silent_fan_mode(
@@ -189,40 +212,42 @@ async def test_set_silent_fan_mode(
 ) -> None:
     """Test setting silent fan mode."""
     await entity.async_set_fan_mode("silent")
-    mock_api.set_device_params.assert_called_once_with(MOCK_DEVICE, {"ac_mark": 5})
+    mock_api.set_device_params.assert_called_once_with(MOCK_STATE, {"ac_mark": 5})
 
 
 async def test_set_swing_mode(
     entity: TornadoClimateEntity, mock_api: MagicMock
 ) -> None:
     """Test setting swing mode."""
-    # Test vertical mode
+    # Test vertical mode, which the unit already has
     await entity.async_set_swing_mode("vertical")
-    mock_api.set_device_params.assert_called_once_with(
-        MOCK_DEVICE, {"ac_vdir": 1, "ac_hdir": 0}
-    )
-
-    mock_api.set_device_params.reset_mock()
+    mock_api.set_device_params.assert_not_called()
 
     # Test horizontal mode
     await entity.async_set_swing_mode("horizontal")
     mock_api.set_device_params.assert_called_once_with(
-        MOCK_DEVICE, {"ac_vdir": 0, "ac_hdir": 1}
+        MOCK_STATE, {"ac_vdir": 0, "ac_hdir": 1}
     )
 
     mock_api.set_device_params.reset_mock()
 
-    # Test both mode
+    # Test both mode; the unpolled swing state is not trusted, so both are sent
     await entity.async_set_swing_mode("both")
     mock_api.set_device_params.assert_called_once_with(
-        MOCK_DEVICE, {"ac_vdir": 1, "ac_hdir": 1}
+        ANY, {"ac_vdir": 1, "ac_hdir": 1}
     )
+    assert entity.swing_mode == "both"
 
 
 async def test_turn_on(entity: TornadoClimateEntity, mock_api: MagicMock) -> None:
     """Test turning device on."""
     await entity.async_turn_on()
-    mock_api.set_device_params.assert_called_once_with(MOCK_DEVICE, {"pwr": 1})
+    mock_api.set_device_params.assert_not_called()
+
+    await entity.async_turn_off()
+    await entity.async_turn_on()
+    mock_api.set_device_params.assert_called_with(ANY, {"pwr": 1})
+    assert entity.hvac_mode == HVACMode.COOL
 
 
 async def test_device_properties(entity: TornadoClimateEntity) -> None:
@@ -571,7 +596,7 @@ async def test_set_preset_mode_normal(
     """Test setting preset mode to normal."""
     await entity.async_set_preset_mode("normal")
     mock_api.set_device_params.assert_called_once_with(
-        MOCK_DEVICE, {"pwrlimitswitch": 0}
+        MOCK_STATE, {"pwrlimitswitch": 0}
     )
 
 
@@ -581,7 +606,7 @@ async def test_set_preset_mode_eco_30(
     """Test setting preset mode to eco_30."""
     await entity.async_set_preset_mode("eco_30")
     mock_api.set_device_params.assert_called_once_with(
-        MOCK_DEVICE, {"pwrlimitswitch": 1, "pwrlimit": 30}
+        MOCK_STATE, {"pwrlimitswitch": 1, "pwrlimit": 30}
     )
 
 
@@ -591,7 +616,7 @@ async def test_set_preset_mode_eco_40(
     """Test setting preset mode to eco_40."""
     await entity.async_set_preset_mode("eco_40")
     mock_api.set_device_params.assert_called_once_with(
-        MOCK_DEVICE, {"pwrlimitswitch": 1, "pwrlimit": 40}
+        MOCK_STATE, {"pwrlimitswitch": 1, "pwrlimit": 40}
     )
 
 
@@ -601,7 +626,7 @@ async def test_set_preset_mode_eco_50(
     """Test setting preset mode to eco_50."""
     await entity.async_set_preset_mode("eco_50")
     mock_api.set_device_params.assert_called_once_with(
-        MOCK_DEVICE, {"pwrlimitswitch": 1, "pwrlimit": 50}
+        MOCK_STATE, {"pwrlimitswitch": 1, "pwrlimit": 50}
     )
 
 
@@ -611,7 +636,7 @@ async def test_set_preset_mode_eco_60(
     """Test setting preset mode to eco_60."""
     await entity.async_set_preset_mode("eco_60")
     mock_api.set_device_params.assert_called_once_with(
-        MOCK_DEVICE, {"pwrlimitswitch": 1, "pwrlimit": 60}
+        MOCK_STATE, {"pwrlimitswitch": 1, "pwrlimit": 60}
     )
 
 
@@ -621,7 +646,7 @@ async def test_set_preset_mode_eco_70(
     """Test setting preset mode to eco_70."""
     await entity.async_set_preset_mode("eco_70")
     mock_api.set_device_params.assert_called_once_with(
-        MOCK_DEVICE, {"pwrlimitswitch": 1, "pwrlimit": 70}
+        MOCK_STATE, {"pwrlimitswitch": 1, "pwrlimit": 70}
     )
 
 
@@ -631,7 +656,7 @@ async def test_set_preset_mode_eco_80(
     """Test setting preset mode to eco_80."""
     await entity.async_set_preset_mode("eco_80")
     mock_api.set_device_params.assert_called_once_with(
-        MOCK_DEVICE, {"pwrlimitswitch": 1, "pwrlimit": 80}
+        MOCK_STATE, {"pwrlimitswitch": 1, "pwrlimit": 80}
     )
 
 
@@ -641,7 +666,7 @@ async def test_set_preset_mode_eco_90(
     """Test setting preset mode to eco_90."""
     await entity.async_set_preset_mode("eco_90")
     mock_api.set_device_params.assert_called_once_with(
-        MOCK_DEVICE, {"pwrlimitswitch": 1, "pwrlimit": 90}
+        MOCK_STATE, {"pwrlimitswitch": 1, "pwrlimit": 90}
     )
 
 
@@ -672,3 +697,97 @@ async def test_preset_mode_fallback_on_missing_params(
     mock_api.get_devices.return_value = [updated_device]
     await coordinator.async_refresh()
     assert entity.preset_mode == "normal"
+
+
+async def test_unchanged_update_skips_state_write(
+    coordinator: AuxCloudDataUpdateCoordinator,
+    entity: TornadoClimateEntity,
+) -> None:
+    """Test that a repeat update with identical attributes is not written."""
+    with patch.object(entity, "async_write_ha_state") as write:
+        entity._handle_coordinator_update()
+        write.assert_not_called()
+
+        coordinator.data = {
+            MOCK_DEVICE["endpointId"]: MOCK_STATE.with_params({"temp": 230})
+        }
+        entity._handle_coordinator_update()
+        write.assert_called_once()
+        assert entity.target_temperature == 23.0  # noqa: PLR2004
+
+
+def _integration_memory() -> int:
+    """
+    Return the traced memory allocated directly by integration code.
+
+    The test harness keeps every entity platform it creates alive, so the
+    total traced memory grows with each reload regardless.
+    """
+    gc.collect()
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(inclusive=True, filename_pattern="*/tornado/*")]
+    )
+    return sum(stat.size for stat in snapshot.statistics("filename"))
+
+
+async def test_reload_does_not_leak_listeners(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,  # noqa: ARG001
+    mock_api: MagicMock,
+) -> None:
+    """Stress config entry reloads and check listeners and memory stay flat."""
+    mock_api.loginsession = "session"
+    mock_api.login = AsyncMock()
+    mock_api.refresh = AsyncMock()
+    mock_api.cleanup = AsyncMock()
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"email": "user@example.com", "password": "secret", "region": "eu"},
+    )
+    entry.add_to_hass(hass)
+
+    stale_listeners = []
+
+    async def reload() -> None:
+        previous = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+        await hass.config_entries.async_reload(entry.entry_id)
+        await hass.async_block_till_done()
+        stale_listeners.append(len(previous._listeners))
+        # Recorded mock calls would otherwise dominate the memory measurement
+        mock_api.reset_mock()
+
+    def live_objects() -> tuple[int, int]:
+        gc.collect()
+        objects = gc.get_objects()
+        return (
+            sum(isinstance(obj, TornadoEntity) for obj in objects),
+            sum(isinstance(obj, AuxCloudDataUpdateCoordinator) for obj in objects),
+        )
+
+    with patch("custom_components.tornado.AuxCloudAPI", new=lambda **_: mock_api):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        listeners = len(hass.data[DOMAIN][entry.entry_id]["coordinator"]._listeners)
+        initial = live_objects()
+        assert listeners > 0
+
+        tracemalloc.start()
+        try:
+            for _ in range(20):
+                await reload()
+            baseline = _integration_memory()
+            for _ in range(RELOAD_CYCLES):
+                await reload()
+            current = _integration_memory()
+        finally:
+            tracemalloc.stop()
+
+        coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+        assert len(coordinator._listeners) == listeners
+        assert not any(stale_listeners)
+        assert live_objects() == initial
+        # Mock call records and captured logs still reference a few hundred
+        # bytes per reload; leaked entities would cost several KiB each time.
+        assert (current - baseline) / RELOAD_CYCLES < MAX_BYTES_PER_RELOAD
+
+        assert await hass.config_entries.async_unload(entry.entry_id)
@@ -9,6 +9,8 @@ from unittest.mock import MagicMock, patch
 
 import aiohttp
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 
 from custom_components.tornado.aux_cloud import AuxCloudAPI
 
@@ -22,6 +24,7 @@ async def cleanup_shared_resources() -> None:
     # Reset before test
     AuxCloudAPI._shared_connector = None
     AuxCloudAPI._shared_session = None
+    AuxCloudAPI._shared_users = 0
 
     # Clear any shared locks
     AuxCloudAPI._shared_connector_lock = asyncio.Lock()
@@ -216,6 +219,67 @@ async def test_session_reuse() -> None:
     await api.cleanup()
 
 
+@pytest.mark.asyncio
+async def test_given_session_is_used() -> None:
+    """Test that a session passed in is the one requests go through."""
+    async with aiohttp.ClientSession() as session:
+        api = AuxCloudAPI("test@example.com", "password", session=session)
+
+        assert await api._get_session() is session
+        assert AuxCloudAPI._shared_session is None
+
+
+@pytest.mark.asyncio
+async def test_entries_share_session_until_last_cleanup() -> None:
+    """Test that the shared session stays open while a retaining client remains."""
+    api1 = AuxCloudAPI("test1@example.com", "password1")
+    api2 = AuxCloudAPI("test2@example.com", "password2")
+    api1.retain_shared_resources()
+    api2.retain_shared_resources()
+
+    session = await api1._get_session()
+    assert await api2._get_session() is session
+
+    await api1.cleanup()
+    assert not session.closed
+
+    await api2.cleanup()
+    assert session.closed
+    assert AuxCloudAPI._shared_session is None
+
+
+@pytest.mark.asyncio
+async def test_connections_are_reused_across_polls(
+    socket_enabled: None,  # noqa: ARG001
+) -> None:
+    """Test that each client's pool metrics count only its own requests."""
+
+    async def handler(_: web.Request) -> web.Response:
+        return web.json_response({"status": 0})
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    api1 = AuxCloudAPI("test1@example.com", "password1")
+    api2 = AuxCloudAPI("test2@example.com", "password2")
+
+    async with TestServer(app, host="127.0.0.1") as server:
+        session = await api1._get_session()
+        assert await api2._get_session() is session
+        for api in (api1, api1, api1, api2):
+            async with session.get(
+                server.make_url("/"), trace_request_ctx=api.pool_stats
+            ) as response:
+                await response.read()
+        # Requests not sent by a client are not counted
+        async with session.get(server.make_url("/")) as response:
+            await response.read()
+
+    assert api1.pool_stats.info() == (3, 1, 2)
+    assert api2.pool_stats.info() == (1, 0, 1)
+    await api1.cleanup()
+    await api2.cleanup()
+
+
 @pytest.mark.asyncio
 async def test_dns_cache() -> None:
     """Test that DNS cache is working."""
@@ -0,0 +1,369 @@
+"""Tests for the Tornado AC data update coordinator."""
+
+from datetime import timedelta
+from time import monotonic
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.components.climate import HVACMode
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.tornado.aux_cloud.device_state import CONTROL_KEYS
+from custom_components.tornado.const import (
+    DEFAULT_AMBIENT_INTERVAL,
+    DEFAULT_STALE_AFTER,
+)
+from custom_components.tornado.coordinator import AuxCloudDataUpdateCoordinator
+from custom_components.tornado.device_view import get_preset_mode_from_power_limit
+
+DEVICE_A = {"endpointId": "dev_a", "params": {"pwr": 1, "temp": 240}}
+DEVICE_B = {"endpointId": "dev_b", "params": {"pwr": 0, "temp": 220}}
+CONTROLLED = sorted(CONTROL_KEYS)
+WITH_AMBIENT = sorted([*CONTROL_KEYS, "envtemp"])
+
+
+@pytest.fixture
+def mock_api() -> MagicMock:
+    """Create a mock AuxCloud API."""
+    api = MagicMock()
+    api.loginsession = "session"
+    api.get_devices = AsyncMock(return_value=[DEVICE_A, DEVICE_B])
+    return api
+
+
+@pytest.fixture
+async def coordinator(
+    hass: HomeAssistant, mock_api: MagicMock
+) -> AuxCloudDataUpdateCoordinator:
+    """Create a coordinator with one completed refresh."""
+    coordinator = AuxCloudDataUpdateCoordinator(hass, mock_api)
+    await coordinator.async_refresh()
+    yield coordinator
+    await coordinator.async_shutdown()
+
+
+def _listen(
+    coordinator: AuxCloudDataUpdateCoordinator, context: str | None
+) -> MagicMock:
+    """Register a mock listener with the given context."""
+    listener = MagicMock()
+    coordinator.async_add_listener(listener, context)
+    return listener
+
+
+async def test_only_changed_device_listeners_run(
+    coordinator: AuxCloudDataUpdateCoordinator, mock_api: MagicMock
+) -> None:
+    """Test that a poll wakes only the listeners of changed devices."""
+    listener_a = _listen(coordinator, "dev_a")
+    listener_b = _listen(coordinator, "dev_b")
+
+    mock_api.get_devices.return_value = [
+        {**DEVICE_A, "params": {**DEVICE_A["params"], "temp": 250}},
+        DEVICE_B,
+    ]
+    await coordinator.async_refresh()
+
+    listener_a.assert_called_once()
+    listener_b.assert_not_called()
+
+
+async def test_unchanged_poll_wakes_nobody(
+    coordinator: AuxCloudDataUpdateCoordinator,
+) -> None:
+    """Test that an identical poll does not call device listeners."""
+    listener_a = _listen(coordinator, "dev_a")
+
+    await coordinator.async_refresh()
+
+    listener_a.assert_not_called()
+
+
+async def test_unchanged_devices_keep_their_state(
+    coordinator: AuxCloudDataUpdateCoordinator, mock_api: MagicMock
+) -> None:
+    """Test that polls share unchanged states and data with the previous one."""
+    data = coordinator.data
+
+    await coordinator.async_refresh()
+    assert coordinator.data is data
+
+    mock_api.get_devices.return_value = [
+        {**DEVICE_A, "params": {**DEVICE_A["params"], "temp": 250}},
+        DEVICE_B,
+    ]
+    await coordinator.async_refresh()
+    assert coordinator.data is not data
+    assert coordinator.data["dev_a"] is not data["dev_a"]
+    assert coordinator.data["dev_b"] is data["dev_b"]
+
+
+async def test_contextless_listener_always_runs(
+    coordinator: AuxCloudDataUpdateCoordinator,
+) -> None:
+    """Test that listeners without a device context keep broadcast semantics."""
+    listener = _listen(coordinator, None)
+
+    await coordinator.async_refresh()
+
+    listener.assert_called_once()
+
+
+async def test_failed_poll_keeps_fresh_devices(
+    coordinator: AuxCloudDataUpdateCoordinator, mock_api: MagicMock
+) -> None:
+    """Test that a failed poll within the budget wakes nobody."""
+    listener_a = _listen(coordinator, "dev_a")
+
+    mock_api.get_devices.side_effect = Exception("API Error")
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success is False
+    assert coordinator.is_fresh("dev_a")
+    listener_a.assert_not_called()
+
+
+async def test_failing_devices_go_stale_after_budget(
+    coordinator: AuxCloudDataUpdateCoordinator, mock_api: MagicMock
+) -> None:
+    """Test that devices become unavailable once their budget is spent."""
+    listener_a = _listen(coordinator, "dev_a")
+    listener_b = _listen(coordinator, "dev_b")
+
+    mock_api.get_devices.side_effect = Exception("API Error")
+    with patch(
+        "custom_components.tornado.coordinator.monotonic",
+        return_value=monotonic() + DEFAULT_STALE_AFTER + 1,
+    ):
+        await coordinator.async_refresh()
+
+        assert not coordinator.is_fresh("dev_a")
+    listener_a.assert_called_once()
+    listener_b.assert_called_once()
+
+
+async def test_devices_go_stale_during_sustained_outage(
+    hass: HomeAssistant,
+    coordinator: AuxCloudDataUpdateCoordinator,
+    mock_api: MagicMock,
+) -> None:
+    """Test that listeners run when the budget expires after repeated failures."""
+    listener_a = _listen(coordinator, "dev_a")
+    mock_api.get_devices.side_effect = Exception("API Error")
+
+    await coordinator.async_refresh()
+    assert coordinator.is_fresh("dev_a")
+
+    later = monotonic() + DEFAULT_STALE_AFTER + 1
+    with patch("custom_components.tornado.coordinator.monotonic", return_value=later):
+        # Home Assistant does not update listeners after a second failure
+        await coordinator.async_refresh()
+        listener_a.assert_not_called()
+
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=DEFAULT_STALE_AFTER + 1)
+        )
+        await hass.async_block_till_done()
+
+        listener_a.assert_called_once()
+        assert not coordinator.is_fresh("dev_a")
+
+
+async def test_missing_device_is_served_from_cache(
+    coordinator: AuxCloudDataUpdateCoordinator, mock_api: MagicMock
+) -> None:
+    """Test that a device absent from one poll keeps its state while fresh."""
+    listener_b = _listen(coordinator, "dev_b")
+
+    mock_api.get_devices.return_value = [DEVICE_A]
+    await coordinator.async_refresh()
+
+    assert coordinator.data["dev_b"].temp == 220  # noqa: PLR2004
+    listener_b.assert_not_called()
+
+    with patch(
+        "custom_components.tornado.coordinator.monotonic",
+        return_value=monotonic() + DEFAULT_STALE_AFTER + 1,
+    ):
+        await coordinator.async_refresh()
+
+    assert "dev_b" not in coordinator.data
+    listener_b.assert_called_once()
+
+
+async def test_unread_device_keeps_cached_state(
+    coordinator: AuxCloudDataUpdateCoordinator, mock_api: MagicMock
+) -> None:
+    """Test that a device listed without params keeps its state while fresh."""
+    listener_b = _listen(coordinator, "dev_b")
+
+    mock_api.get_devices.return_value = [DEVICE_A, {"endpointId": "dev_b"}]
+    await coordinator.async_refresh()
+
+    assert coordinator.data["dev_b"].temp == 220  # noqa: PLR2004
+    listener_b.assert_not_called()
+
+    with patch(
+        "custom_components.tornado.coordinator.monotonic",
+        return_value=monotonic() + DEFAULT_STALE_AFTER + 1,
+    ):
+        await coordinator.async_refresh()
+        assert not coordinator.is_fresh("dev_b")
+
+    assert coordinator.data["dev_b"].temp == 220  # noqa: PLR2004
+    listener_b.assert_called_once()
+
+
+async def test_poll_reads_only_required_params(
+    coordinator: AuxCloudDataUpdateCoordinator, mock_api: MagicMock
+) -> None:
+    """Test that devices with entities are polled for every writable param."""
+    mock_api.get_devices.assert_awaited_once_with(None)
+
+    remove_temp = coordinator.async_require_params("dev_a", ["temp", "envtemp"])
+    remove_pwr = coordinator.async_require_params("dev_a", ["pwr", "temp"])
+    await coordinator.async_refresh()
+    mock_api.get_devices.assert_awaited_with({"dev_a": WITH_AMBIENT, "dev_b": []})
+
+    remove_temp()
+    await coordinator.async_refresh()
+    mock_api.get_devices.assert_awaited_with({"dev_a": CONTROLLED, "dev_b": []})
+
+    # The room temperature alone needs no params request
+    coordinator.async_require_params("dev_b", ["envtemp"])
+    remove_pwr()
+    await coordinator.async_refresh()
+    mock_api.get_devices.assert_awaited_with({"dev_a": [], "dev_b": ["envtemp"]})
+
+
+async def test_room_temperature_is_read_on_its_own_cadence(
+    coordinator: AuxCloudDataUpdateCoordinator, mock_api: MagicMock
+) -> None:
+    """Test that envtemp is read once per ambient interval and cached between."""
+    coordinator.async_require_params("dev_a", ["temp", "envtemp"])
+    mock_api.get_devices.return_value = [
+        {**DEVICE_A, "params": {**DEVICE_A["params"], "envtemp": 270}}
+    ]
+    await coordinator.async_refresh()
+    mock_api.get_devices.assert_awaited_with({"dev_a": WITH_AMBIENT, "dev_b": []})
+
+    mock_api.get_devices.return_value = [DEVICE_A]
+    await coordinator.async_refresh()
+    mock_api.get_devices.assert_awaited_with({"dev_a": CONTROLLED, "dev_b": []})
+    assert coordinator.data["dev_a"].envtemp == 270  # noqa: PLR2004
+
+    with patch(
+        "custom_components.tornado.coordinator.monotonic",
+        return_value=monotonic() + DEFAULT_AMBIENT_INTERVAL,
+    ):
+        await coordinator.async_refresh()
+    mock_api.get_devices.assert_awaited_with({"dev_a": WITH_AMBIENT, "dev_b": []})
+
+
+async def test_set_device_params_skips_confirmed_values(
+    coordinator: AuxCloudDataUpdateCoordinator, mock_api: MagicMock
+) -> None:
+    """Test that only params differing from the last polled state are written."""
+    mock_api.set_device_params = AsyncMock()
+    device = coordinator.data["dev_a"]
+
+    await coordinator.async_set_device_params("dev_a", {"pwr": 1, "temp": 240})
+    mock_api.set_device_params.assert_not_awaited()
+
+    await coordinator.async_set_device_params("dev_a", {"pwr": 1, "temp": 260})
+    mock_api.set_device_params.assert_awaited_once_with(device, {"temp": 260})
+    assert coordinator.data["dev_a"].temp == 260  # noqa: PLR2004
+
+    # 260 was only applied optimistically: it is written again until a poll
+    # reads it back
+    mock_api.set_device_params.reset_mock()
+    await coordinator.async_set_device_params("dev_a", {"temp": 260})
+    mock_api.set_device_params.assert_awaited_once_with(ANY, {"temp": 260})
+
+    mock_api.set_device_params.reset_mock()
+    await coordinator.async_set_device_params("dev_a", {"pwr": 1}, force=True)
+    mock_api.set_device_params.assert_awaited_once_with(ANY, {"pwr": 1})
+
+
+async def test_set_device_params_writes_all_when_stale(
+    coordinator: AuxCloudDataUpdateCoordinator, mock_api: MagicMock
+) -> None:
+    """Test that a stale cached state does not suppress any param."""
+    mock_api.set_device_params = AsyncMock()
+
+    with patch(
+        "custom_components.tornado.coordinator.monotonic",
+        return_value=monotonic() + DEFAULT_STALE_AFTER + 1,
+    ):
+        await coordinator.async_set_device_params("dev_a", {"pwr": 1, "temp": 240})
+
+    mock_api.set_device_params.assert_awaited_once_with(ANY, {"pwr": 1, "temp": 240})
+
+
+async def test_device_list_is_rebuilt_only_on_topology_change(
+    coordinator: AuxCloudDataUpdateCoordinator, mock_api: MagicMock
+) -> None:
+    """Test that the persisted device list is only rebuilt when devices change."""
+    mock_api.topology = "first"
+    await coordinator.async_refresh()
+    devices = coordinator.devices
+
+    mock_api.get_devices.return_value = [
+        {**DEVICE_A, "friendlyName": "Renamed"},
+        DEVICE_B,
+    ]
+    await coordinator.async_refresh()
+    assert coordinator.devices is devices
+
+    mock_api.topology = "second"
+    await coordinator.async_refresh()
+    assert coordinator.devices[0] == {"endpointId": "dev_a", "friendlyName": "Renamed"}
+
+
+async def test_apply_params_wakes_only_that_device(
+    coordinator: AuxCloudDataUpdateCoordinator,
+) -> None:
+    """Test that an optimistic update is routed to the written device."""
+    listener_a = _listen(coordinator, "dev_a")
+    listener_b = _listen(coordinator, "dev_b")
+
+    coordinator.async_apply_params("dev_b", {"pwr": 1})
+
+    listener_a.assert_not_called()
+    listener_b.assert_called_once()
+    assert coordinator.data["dev_b"].pwr == 1
+
+
+async def test_device_view_is_decoded_once_per_state(
+    coordinator: AuxCloudDataUpdateCoordinator,
+) -> None:
+    """Test that entities of a device share one view until its state changes."""
+    view = coordinator.device_view("dev_a")
+
+    assert view is coordinator.device_view("dev_a")
+    assert view.hvac_mode == HVACMode.COOL
+    assert view.target_temperature == 24.0  # noqa: PLR2004
+
+    coordinator.async_apply_params("dev_a", {"temp": 250})
+
+    assert coordinator.device_view("dev_a") is not view
+    assert coordinator.device_view("missing") is None
+
+
+@pytest.mark.parametrize(
+    ("switch", "limit", "expected"),
+    [
+        (0, 50, "normal"),
+        (1, 29, "normal"),
+        (1, 30, "eco_30"),
+        (1, 45, "eco_40"),
+        (1, 46, "eco_50"),
+        (1, 100, "eco_90"),
+        (1, 120, "normal"),
+    ],
+)
+def test_preset_mode_from_power_limit(switch: int, limit: int, expected: str) -> None:
+    """Test the precomputed preset table boundaries."""
+    assert get_preset_mode_from_power_limit(switch, limit) == expected
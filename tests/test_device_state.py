@@ -0,0 +1,122 @@
+"""Tests for the compact DeviceState model."""
+
+import sys
+
+import pytest
+
+from custom_components.tornado.aux_cloud.device_state import DeviceState
+
+TARGET_TEMP = 240
+ENV_TEMP = 265
+POWER_LIMIT = 60
+
+PAYLOAD = {
+    "endpointId": "dev1",
+    "friendlyName": "Bedroom",
+    "productId": "prod1",
+    "mac": "00:11:22:33:44:55",
+    "devicetypeFlag": 1,
+    "devSession": "sess1",
+    "cookie": "Y29va2ll",
+    "icon": "/staticfilesys/openlimit/queryfile?mtag=appmanage",
+    "createTime": "2024-01-01 00:00:00",
+    "state": 1,
+    "params": {
+        "pwr": 1,
+        "ac_mode": 0,
+        "temp": TARGET_TEMP,
+        "envtemp": ENV_TEMP,
+        "pwrlimitswitch": 1,
+        "pwrlimit": POWER_LIMIT,
+        "childlock": 0,
+    },
+}
+
+
+def test_from_payload_keeps_only_used_fields() -> None:
+    """Test parsing slots known params and drops the rest of the payload."""
+    state = DeviceState.from_payload(PAYLOAD)
+
+    assert state.endpoint_id == "dev1"
+    assert state.friendly_name == "Bedroom"
+    assert state.pwr == 1
+    assert state.temp == TARGET_TEMP
+    assert state.envtemp == ENV_TEMP
+    assert state.pwrlimit == POWER_LIMIT
+    assert state.ac_mark is None
+    assert state.extra == {"childlock": 0}
+    assert not hasattr(state, "__dict__")
+    assert not hasattr(state, "icon")
+
+
+def test_unknown_param_keys_are_interned() -> None:
+    """Test that unknown parameter keys share one string per name."""
+    key = "".join(["child", "lock"])  # noqa: FLY002 - build a non-interned copy
+    state = DeviceState.from_payload({"endpointId": "dev1", "params": {key: 1}})
+
+    (stored_key,) = state.extra
+    assert stored_key is sys.intern("childlock")
+
+
+def test_get_uses_default_for_missing_params() -> None:
+    """Test dict-style access with defaults."""
+    state = DeviceState.from_payload(PAYLOAD)
+
+    assert state.get("temp", 0) == TARGET_TEMP
+    assert state.get("ac_vdir", 0) == 0
+    assert state.get("childlock") == 0
+    assert state.get("unknown", "x") == "x"
+
+
+def test_identity_lookup_by_raw_key() -> None:
+    """Test that the client can address a state like the raw device dict."""
+    state = DeviceState.from_payload(PAYLOAD)
+
+    assert state["endpointId"] == "dev1"
+    assert state["devSession"] == "sess1"
+    assert state["devicetypeFlag"] == 1
+    with pytest.raises(KeyError):
+        state["params"]
+
+
+def test_with_params_returns_updated_copy() -> None:
+    """Test that applying params leaves the original untouched."""
+    state = DeviceState.from_payload(PAYLOAD)
+    updated = state.with_params({"pwr": 0, "childlock": 1})
+
+    assert updated is not state
+    assert updated.pwr == 0
+    assert updated.extra == {"childlock": 1}
+    assert state.pwr == 1
+    assert state.extra == {"childlock": 0}
+    assert updated != state
+    assert updated.with_params({"pwr": 1, "childlock": 0}) == state
+
+
+def test_state_is_immutable() -> None:
+    """Test that a state cannot be changed in place."""
+    state = DeviceState.from_payload(PAYLOAD)
+
+    with pytest.raises(AttributeError):
+        state.pwr = 0
+    with pytest.raises(TypeError):
+        state.extra["childlock"] = 1  # type: ignore[index]
+    assert state.with_params({"pwr": 1, "childlock": 0}) is state
+
+
+def test_params_round_trip() -> None:
+    """Test that params reproduces every parsed value."""
+    state = DeviceState.from_payload(PAYLOAD)
+    assert state.params == PAYLOAD["params"]
+
+
+def test_controllable_params_skip_read_only_and_unknown() -> None:
+    """Test that a snapshot holds only known, writable values."""
+    state = DeviceState.from_payload(PAYLOAD)
+    assert state.controllable_params == {
+        "pwr": 1,
+        "ac_mode": 0,
+        "temp": TARGET_TEMP,
+        "pwrlimitswitch": 1,
+        "pwrlimit": POWER_LIMIT,
+    }
@@ -0,0 +1,41 @@
+"""Tests for the cross-family endpoint index."""
+
+from custom_components.tornado.aux_cloud.endpoints import Endpoint, EndpointIndex
+
+
+def _device(endpoint_id: str, origin: str) -> dict[str, str]:
+    return {"endpointId": endpoint_id, "origin": origin}
+
+
+def test_owned_listing_wins_over_shared() -> None:
+    """Test that a unit both shared and owned is indexed once, as owned."""
+    index = EndpointIndex()
+    shared = _device("dev1", "shared")
+    owned = _device("dev1", "owned")
+
+    index.update("fam", [shared, _device("dev2", "shared")], shared=True)
+    index.update("other", [owned])
+    index.update("fam", [shared], shared=True)
+
+    assert len(index) == 1
+    assert "dev2" not in index
+    assert index.get("dev1") == Endpoint(owned, "other", shared=False)
+    assert index.family_devices("fam") == []
+    assert index.family_devices("other") == [owned]
+
+
+def test_dropped_device_is_handed_over() -> None:
+    """Test that another listing takes over a device its listing dropped."""
+    index = EndpointIndex()
+    owned = _device("dev1", "owned")
+    shared = _device("dev1", "shared")
+    index.update("fam", [owned])
+    index.update("fam", [shared], shared=True)
+
+    index.update("fam", [])
+    assert index.get("dev1") == Endpoint(shared, "fam", shared=True)
+
+    index.update("fam", [owned])
+    index.retain_families(["other"])
+    assert len(index) == 0
+    assert index.get("dev1") is None
@@ -0,0 +1,158 @@
+"""Tests for the shared Tornado AC entity behaviour."""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant, State
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    async_fire_time_changed,
+    mock_restore_cache,
+    mock_restore_cache_with_extra_data,
+)
+
+from custom_components.tornado.coordinator import AuxCloudDataUpdateCoordinator
+from custom_components.tornado.select import TornadoHVACModeSelect
+from custom_components.tornado.sensor import TornadoTemperatureSensor
+
+MOCK_DEVICE = {
+    "endpointId": "test_device_id",
+    "friendlyName": "Test AC",
+    "params": {"pwr": 1, "temp": 250, "envtemp": 270},
+}
+ROOM_TEMP = 27.0
+
+
+@pytest.fixture
+def mock_api() -> MagicMock:
+    """Create a mock AuxCloud API."""
+    api = MagicMock()
+    api.loginsession = "session"
+    api.get_devices = AsyncMock(return_value=[MOCK_DEVICE])
+    return api
+
+
+@pytest.fixture
+async def coordinator(
+    hass: HomeAssistant, mock_api: MagicMock
+) -> AuxCloudDataUpdateCoordinator:
+    """Create a coordinator with one completed refresh."""
+    coordinator = AuxCloudDataUpdateCoordinator(hass, mock_api)
+    await coordinator.async_refresh()
+    yield coordinator
+    await coordinator.async_shutdown()
+
+
+@pytest.fixture
+async def unpolled_coordinator(
+    hass: HomeAssistant, mock_api: MagicMock
+) -> AuxCloudDataUpdateCoordinator:
+    """Create a coordinator that has not polled yet."""
+    coordinator = AuxCloudDataUpdateCoordinator(hass, mock_api)
+    yield coordinator
+    await coordinator.async_shutdown()
+
+
+async def test_unchanged_state_is_not_rewritten(
+    hass: HomeAssistant, coordinator: AuxCloudDataUpdateCoordinator
+) -> None:
+    """Test that identical derived attributes skip async_write_ha_state."""
+    sensor = TornadoTemperatureSensor(coordinator, MOCK_DEVICE, "current")
+    sensor.hass = hass
+
+    with patch.object(sensor, "async_write_ha_state") as write:
+        sensor._handle_coordinator_update()
+        sensor._handle_coordinator_update()
+        assert write.call_count == 1
+        assert sensor.native_value == ROOM_TEMP
+
+        # A change to an unrelated parameter keeps the same fingerprint
+        coordinator.data = {
+            "test_device_id": coordinator.data["test_device_id"].with_params(
+                {"temp": 260}
+            )
+        }
+        sensor._handle_coordinator_update()
+        assert write.call_count == 1
+
+        coordinator.data = {
+            "test_device_id": coordinator.data["test_device_id"].with_params(
+                {"envtemp": 280}
+            )
+        }
+        sensor._handle_coordinator_update()
+        assert write.call_count == 2  # noqa: PLR2004
+
+
+async def test_availability_change_is_written(
+    hass: HomeAssistant, coordinator: AuxCloudDataUpdateCoordinator
+) -> None:
+    """Test that losing the device writes an unavailable state once."""
+    sensor = TornadoTemperatureSensor(coordinator, MOCK_DEVICE, "current")
+    sensor.hass = hass
+
+    with patch.object(sensor, "async_write_ha_state") as write:
+        sensor._handle_coordinator_update()
+        coordinator.data = {}
+        sensor._handle_coordinator_update()
+        sensor._handle_coordinator_update()
+
+        assert write.call_count == 2  # noqa: PLR2004
+        assert sensor.available is False
+
+
+async def test_restored_state_until_first_poll(
+    hass: HomeAssistant, unpolled_coordinator: AuxCloudDataUpdateCoordinator
+) -> None:
+    """Test that the last state is shown, marked stale, until data arrives."""
+    mock_restore_cache_with_extra_data(
+        hass,
+        [
+            (
+                State("sensor.room", "21.5"),
+                {"native_value": 21.5, "native_unit_of_measurement": "°C"},
+            )
+        ],
+    )
+    coordinator = unpolled_coordinator
+    sensor = TornadoTemperatureSensor(coordinator, MOCK_DEVICE, "current")
+    sensor.hass = hass
+    sensor.entity_id = "sensor.room"
+
+    with patch.object(sensor, "async_write_ha_state"):
+        await sensor.async_added_to_hass()
+
+        assert sensor.available is True
+        assert sensor.native_value == 21.5  # noqa: PLR2004
+        assert sensor.extra_state_attributes == {"restored": True}
+
+        await coordinator.async_refresh()
+
+        # The restored state's expiry does not affect polled data
+        async_fire_time_changed(
+            hass,
+            dt_util.utcnow() + timedelta(seconds=coordinator.stale_after + 1),
+        )
+        await hass.async_block_till_done()
+
+    assert sensor.native_value == ROOM_TEMP
+    assert sensor.extra_state_attributes is None
+
+
+async def test_unknown_restored_option_is_ignored(
+    hass: HomeAssistant,
+    unpolled_coordinator: AuxCloudDataUpdateCoordinator,
+    mock_api: MagicMock,
+) -> None:
+    """Test that a restored state which is not a valid option is dropped."""
+    mock_restore_cache(hass, [State("select.mode", "unavailable")])
+    select = TornadoHVACModeSelect(unpolled_coordinator, MOCK_DEVICE, mock_api)
+    select.hass = hass
+    select.entity_id = "select.mode"
+
+    with patch.object(select, "async_write_ha_state"):
+        await select.async_added_to_hass()
+
+    assert select.available is False
+    assert select.current_option is None
@@ -0,0 +1,55 @@
+"""Tests for the per-device poll health tracking."""
+
+from custom_components.tornado.aux_cloud.health import (
+    DEVICE_ERROR,
+    DEVICE_OK,
+    DEVICE_QUARANTINED,
+    DEVICE_TIMEOUT,
+    DeviceHealth,
+)
+
+
+def test_failed_device_is_quarantined_with_backoff() -> None:
+    """Test that the re-probe delay doubles per failure up to the cap."""
+    health = DeviceHealth(base_delay=10, max_delay=30)
+
+    health.record("dev", DEVICE_TIMEOUT, now=0)
+    assert not health.should_poll("dev", 9)
+    assert health.status["dev"] == DEVICE_QUARANTINED
+    assert health.should_poll("dev", 10)
+
+    health.record("dev", DEVICE_ERROR, now=10)
+    assert not health.should_poll("dev", 29)
+    assert health.should_poll("dev", 30)
+
+    health.record("dev", DEVICE_TIMEOUT, now=30)
+    assert not health.should_poll("dev", 59)
+    assert health.should_poll("dev", 60)
+
+
+def test_successful_read_releases_device() -> None:
+    """Test that one good read resets the quarantine."""
+    health = DeviceHealth(base_delay=10, max_delay=30)
+    health.record("dev", DEVICE_TIMEOUT, now=0)
+    health.record("dev", DEVICE_TIMEOUT, now=10)
+
+    health.record("dev", DEVICE_OK, now=30)
+    assert health.should_poll("dev", 30)
+    assert health.status["dev"] == DEVICE_OK
+
+    health.record("dev", DEVICE_TIMEOUT, now=31)
+    assert health.should_poll("dev", 41)
+    assert health.should_poll("other", 0)
+
+
+def test_retain_forgets_removed_devices() -> None:
+    """Test that devices no longer listed are forgotten."""
+    health = DeviceHealth(base_delay=10, max_delay=30)
+    health.record("gone", DEVICE_TIMEOUT, now=0)
+    health.record("kept", DEVICE_TIMEOUT, now=0)
+
+    health.retain({"kept"})
+
+    assert health.status == {"kept": DEVICE_TIMEOUT}
+    assert health.should_poll("gone", 1)
+    assert not health.should_poll("kept", 1)
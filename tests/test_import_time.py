@@ -0,0 +1,57 @@
+"""Import-time budget of the integration."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+# Home Assistant modules the integration uses, loaded first so that only the
+# integration's own import cost is measured
+PRELOAD = (
+    "aiohttp",
+    "voluptuous",
+    "homeassistant.config_entries",
+    "homeassistant.components.climate",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.restore_state",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.update_coordinator",
+)
+# Only needed once the client talks to the cloud
+DEFERRED_MODULES = ("Cryptodome", "tenacity")
+# Cumulative import time of the integration, in microseconds; measured at
+# about 30 ms on a desktop, leaving room for slow single-board computers
+IMPORT_BUDGET_US = 250_000
+
+
+def _import_times(module: str) -> dict[str, tuple[int, int]]:
+    """Import ``module`` in a fresh interpreter and return its import times."""
+    result = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"import {', '.join(PRELOAD)}; import {module}",
+        ],
+        capture_output=True,
+        check=True,
+        cwd=Path(__file__).parents[1],
+        text=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if self_us.strip().isdigit():
+            times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def test_integration_import_time() -> None:
+    """Test that loading the integration stays cheap and defers heavy modules."""
+    times = _import_times("custom_components.tornado")
+
+    loaded = [name for name in times if name.partition(".")[0] in DEFERRED_MODULES]
+    assert not loaded
+    assert times["custom_components.tornado"][1] < IMPORT_BUDGET_US
@@ -0,0 +1,342 @@
+"""Tests for setting up the Tornado AC integration."""
+
+import asyncio
+from datetime import timedelta
+from time import monotonic
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+    mock_restore_cache,
+)
+
+from custom_components.tornado.aux_cloud import AuxCloudApiError
+from custom_components.tornado.aux_cloud.device_state import CONTROL_KEYS
+from custom_components.tornado.const import (
+    DEFAULT_STALE_AFTER,
+    DOMAIN,
+    RETIRE_AFTER,
+)
+
+MOCK_DEVICE = {
+    "endpointId": "test_device_id",
+    "friendlyName": "Test AC",
+    "params": {"pwr": 1, "ac_mode": 1, "temp": 250, "envtemp": 270},
+}
+STORED_DEVICES = [{"endpointId": "test_device_id", "friendlyName": "Test AC"}]
+CLIMATE_ENTITY_ID = "climate.tornado_ac_test_ac"
+NEW_DEVICE = {
+    "endpointId": "new_device_id",
+    "friendlyName": "New AC",
+    "params": {"pwr": 0, "ac_mode": 0, "temp": 240, "envtemp": 260},
+}
+NEW_CLIMATE_ENTITY_ID = "climate.tornado_ac_new_ac"
+
+
+@pytest.fixture
+def mock_api() -> MagicMock:
+    """Create a mock AuxCloud API."""
+    api = MagicMock()
+    api.loginsession = "session"
+    api.login = AsyncMock()
+    api.refresh = AsyncMock()
+    api.cleanup = AsyncMock()
+    api.get_devices = AsyncMock(return_value=[MOCK_DEVICE])
+    return api
+
+
+@pytest.fixture
+def entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Add a config entry to hass."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"email": "user@example.com", "password": "secret", "region": "eu"},
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+async def _setup(hass: HomeAssistant, entry: MockConfigEntry, api: MagicMock) -> None:
+    """Set up the entry with the mocked API."""
+    with patch("custom_components.tornado.AuxCloudAPI", return_value=api):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+
+
+def _store_devices(hass_storage: dict[str, Any], entry: MockConfigEntry) -> None:
+    """Persist the device list as a previous run would have."""
+    key = f"{DOMAIN}.{entry.entry_id}"
+    hass_storage[key] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": key,
+        "data": {"devices": STORED_DEVICES},
+    }
+
+
+async def test_first_setup_stores_devices(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,  # noqa: ARG001
+    hass_storage: dict[str, Any],
+    entry: MockConfigEntry,
+    mock_api: MagicMock,
+) -> None:
+    """Test that the devices found on the first poll are persisted."""
+    await _setup(hass, entry, mock_api)
+    await hass.async_block_till_done()
+
+    mock_api.login.assert_awaited_once()
+    assert hass_storage[f"{DOMAIN}.{entry.entry_id}"]["data"] == {
+        "devices": STORED_DEVICES
+    }
+    assert hass.states.get(CLIMATE_ENTITY_ID).state == "heat"
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_setup_with_stored_devices_does_not_wait_for_cloud(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,  # noqa: ARG001
+    hass_storage: dict[str, Any],
+    entry: MockConfigEntry,
+    mock_api: MagicMock,
+) -> None:
+    """Test that entities restore their state while the cloud is slow."""
+    _store_devices(hass_storage, entry)
+    mock_restore_cache(hass, [State(CLIMATE_ENTITY_ID, "cool", {"temperature": 22.0})])
+    cloud = asyncio.Event()
+
+    async def slow_get_devices(*_: Any) -> list[dict[str, Any]]:
+        await cloud.wait()
+        return [MOCK_DEVICE]
+
+    mock_api.get_devices.side_effect = slow_get_devices
+
+    await _setup(hass, entry, mock_api)
+
+    state = hass.states.get(CLIMATE_ENTITY_ID)
+    assert state.state == "cool"
+    assert state.attributes["temperature"] == 22.0  # noqa: PLR2004
+    assert state.attributes["restored"] is True
+    mock_api.login.assert_not_awaited()
+
+    cloud.set()
+    await hass.async_block_till_done()
+
+    state = hass.states.get(CLIMATE_ENTITY_ID)
+    assert state.state == "heat"
+    assert "restored" not in state.attributes
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_restored_state_expires_after_budget(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,  # noqa: ARG001
+    hass_storage: dict[str, Any],
+    entry: MockConfigEntry,
+    mock_api: MagicMock,
+) -> None:
+    """Test that restored state is not shown past the budget without a poll."""
+    _store_devices(hass_storage, entry)
+    mock_restore_cache(hass, [State(CLIMATE_ENTITY_ID, "cool", {"temperature": 22.0})])
+    mock_api.get_devices.side_effect = AuxCloudApiError("offline")
+
+    await _setup(hass, entry, mock_api)
+    await hass.async_block_till_done()
+    assert hass.states.get(CLIMATE_ENTITY_ID).state == "cool"
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=DEFAULT_STALE_AFTER + 1)
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get(CLIMATE_ENTITY_ID).state == STATE_UNAVAILABLE
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_entity_without_restored_state_is_unavailable(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,  # noqa: ARG001
+    hass_storage: dict[str, Any],
+    entry: MockConfigEntry,
+    mock_api: MagicMock,
+) -> None:
+    """Test that entities with nothing to restore wait for the first poll."""
+    _store_devices(hass_storage, entry)
+    cloud = asyncio.Event()
+
+    async def slow_get_devices(*_: Any) -> list[dict[str, Any]]:
+        await cloud.wait()
+        return [MOCK_DEVICE]
+
+    mock_api.get_devices.side_effect = slow_get_devices
+
+    await _setup(hass, entry, mock_api)
+
+    assert hass.states.get(CLIMATE_ENTITY_ID).state == STATE_UNAVAILABLE
+
+    cloud.set()
+    await hass.async_block_till_done()
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_disabled_entities_are_not_polled(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,  # noqa: ARG001
+    entry: MockConfigEntry,
+    mock_api: MagicMock,
+) -> None:
+    """Test that polls skip the params only disabled entities would read."""
+    registry = er.async_get(hass)
+    for domain, suffix in (("climate", "climate"), ("sensor", "current_temperature")):
+        registry.async_get_or_create(
+            domain,
+            DOMAIN,
+            f"test_device_id_{suffix}",
+            config_entry=entry,
+            disabled_by=er.RegistryEntryDisabler.USER,
+        )
+
+    await _setup(hass, entry, mock_api)
+    await hass.async_block_till_done()
+    mock_api.get_devices.assert_awaited_once_with(None)
+
+    await hass.data[DOMAIN][entry.entry_id]["coordinator"].async_refresh()
+    mock_api.get_devices.assert_awaited_with({"test_device_id": sorted(CONTROL_KEYS)})
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_devices_are_added_and_removed_without_reload(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,  # noqa: ARG001
+    entry: MockConfigEntry,
+    mock_api: MagicMock,
+) -> None:
+    """Test that devices found or gone on a poll add or retire their entities."""
+    await _setup(hass, entry, mock_api)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    assert hass.states.get(NEW_CLIMATE_ENTITY_ID) is None
+
+    mock_api.get_devices.return_value = [MOCK_DEVICE, NEW_DEVICE]
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert hass.states.get(NEW_CLIMATE_ENTITY_ID).state == "off"
+    assert mock_api.login.await_count == 1
+
+    # A device missing from a listing is kept while its state is fresh
+    mock_api.get_devices.return_value = [NEW_DEVICE]
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert hass.states.get(CLIMATE_ENTITY_ID).state == "heat"
+
+    # Once stale it is only unavailable; removal takes far longer
+    now = monotonic() + DEFAULT_STALE_AFTER + 1
+    for offset in (0, RETIRE_AFTER + 1):
+        with patch(
+            "custom_components.tornado.coordinator.monotonic",
+            return_value=now + offset,
+        ):
+            await coordinator.async_refresh()
+        await hass.async_block_till_done()
+        if not offset:
+            assert hass.states.get(CLIMATE_ENTITY_ID).state == STATE_UNAVAILABLE
+
+    assert hass.states.get(CLIMATE_ENTITY_ID) is None
+    assert er.async_get(hass).async_get(CLIMATE_ENTITY_ID) is None
+    assert (
+        dr.async_get(hass).async_get_device(identifiers={(DOMAIN, "test_device_id")})
+        is None
+    )
+    assert hass.states.get(NEW_CLIMATE_ENTITY_ID).state == "off"
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_stored_device_is_removed_only_after_retire_threshold(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,  # noqa: ARG001
+    hass_storage: dict[str, Any],
+    entry: MockConfigEntry,
+    mock_api: MagicMock,
+) -> None:
+    """Test that a stored device missing after a restart is not removed at once."""
+    _store_devices(hass_storage, entry)
+    mock_api.get_devices.return_value = [NEW_DEVICE]
+
+    await _setup(hass, entry, mock_api)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+
+    assert er.async_get(hass).async_get(CLIMATE_ENTITY_ID) is not None
+    assert hass.states.get(NEW_CLIMATE_ENTITY_ID).state == "off"
+    assert [d["endpointId"] for d in coordinator.devices] == [
+        "new_device_id",
+        "test_device_id",
+    ]
+
+    # Listings the client could not complete never retire a device
+    now = monotonic()
+    for offset, complete in (
+        (RETIRE_AFTER / 2, True),
+        (RETIRE_AFTER + 1, False),
+        (RETIRE_AFTER + 2, True),
+    ):
+        mock_api.listing_complete = complete
+        with patch(
+            "custom_components.tornado.coordinator.monotonic",
+            return_value=now + offset,
+        ):
+            await coordinator.async_refresh()
+        await hass.async_block_till_done()
+        if offset < RETIRE_AFTER + 2:
+            assert er.async_get(hass).async_get(CLIMATE_ENTITY_ID) is not None
+
+    assert er.async_get(hass).async_get(CLIMATE_ENTITY_ID) is None
+    assert hass_storage[f"{DOMAIN}.{entry.entry_id}"]["data"] == {
+        "devices": [{"endpointId": "new_device_id", "friendlyName": "New AC"}]
+    }
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.mark.parametrize("fail", ["first_refresh", "platforms"])
+async def test_failed_setup_releases_shared_session(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,  # noqa: ARG001
+    entry: MockConfigEntry,
+    mock_api: MagicMock,
+    fail: str,
+) -> None:
+    """Test that a setup failing after login releases the shared session."""
+    if fail == "first_refresh":
+        mock_api.get_devices.side_effect = AuxCloudApiError("offline")
+    with (
+        patch("custom_components.tornado.AuxCloudAPI", return_value=mock_api),
+        patch.object(
+            hass.config_entries,
+            "async_forward_entry_setups",
+            side_effect=RuntimeError("boom") if fail == "platforms" else None,
+        ),
+    ):
+        assert not await hass.config_entries.async_setup(entry.entry_id)
+    assert entry.state is (
+        ConfigEntryState.SETUP_RETRY
+        if fail == "first_refresh"
+        else ConfigEntryState.SETUP_ERROR
+    )
+
+    mock_api.retain_shared_resources.assert_called_once_with()
+    mock_api.cleanup.assert_awaited_once_with()
+    assert entry.entry_id not in hass.data[DOMAIN]
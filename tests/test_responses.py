@@ -0,0 +1,156 @@
+"""Tests for the typed AuxCloud response decoding."""
+
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.tornado.aux_cloud import responses
+from custom_components.tornado.aux_cloud.responses import (
+    ControlResponse,
+    DeviceListResponse,
+    EventResponse,
+    FamilyListResponse,
+    LoginResponse,
+)
+
+
+def _raw(body: object) -> bytes:
+    return json.dumps(body).encode()
+
+
+def test_login_and_family_list() -> None:
+    """Test that the fields are read off the raw body."""
+    login = LoginResponse.decode(
+        _raw({"status": 0, "loginsession": "s", "userid": "u"})
+    )
+    assert login.ok
+    assert (login.loginsession, login.userid) == ("s", "u")
+
+    failed = LoginResponse.decode(_raw({"status": 1, "msg": "Bad password"}))
+    assert not failed.ok
+    assert failed.msg == "Bad password"
+
+    families = FamilyListResponse.decode(
+        _raw({"status": 0, "data": {"familyList": [{"familyid": "f"}]}})
+    )
+    assert families.families == [{"familyid": "f"}]
+
+
+def test_device_list_own_and_shared() -> None:
+    """Test that own and shared device listings give the same endpoints."""
+    own = DeviceListResponse.decode(
+        _raw({"status": 0, "data": {"endpoints": [{"endpointId": "a"}]}})
+    )
+    shared = DeviceListResponse.decode(
+        _raw(
+            {
+                "status": 0,
+                "data": {"shareFromOther": [{"devinfo": {"endpointId": "a"}}]},
+            }
+        )
+    )
+    assert own.endpoints == shared.endpoints == [{"endpointId": "a"}]
+    assert DeviceListResponse.decode(_raw({"status": 0, "data": {}})).endpoints == []
+
+
+def test_event_status_comes_from_payload() -> None:
+    """Test that the payload status decides success."""
+    ok = EventResponse.decode(_raw({"event": {"payload": {"status": 0, "x": 1}}}))
+    assert ok.ok
+    assert ok.payload == {"status": 0, "x": 1}
+
+    failed = EventResponse.decode(_raw({"status": 0, "event": {}}))
+    assert not failed.ok
+    assert failed.text == '{"status": 0, "event": {}}'
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        EventResponse.decode(b"not json")
+
+
+def test_control_params_are_decoded_lazily() -> None:
+    """Test that the nested params string is only decoded when read."""
+    nested = json.dumps(
+        {"params": ["pwr", "temp"], "vals": [[{"val": 1}], [{"val": 240}]]}
+    )
+    raw = _raw({"event": {"payload": {"data": nested}}})
+
+    with patch.object(
+        responses, "json_loads", wraps=responses.json_loads
+    ) as json_loads:
+        response = ControlResponse.decode(raw)
+        assert response.ok
+        assert json_loads.call_count == 1
+
+        assert response == {"pwr": 1, "temp": 240}
+        assert dict(response) == {"pwr": 1, "temp": 240}
+        assert json_loads.call_count == 2  # noqa: PLR2004
+
+    assert not ControlResponse.decode(_raw({"event": {"payload": {}}})).ok
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        b'{"status": 0, "data": {"endpoints": [{"a": [1, {"b": null}]}, {}]}}',
+        b' { "data" : { "shareFromOther" : [ ] , "x" : "\\u00e9" } } \n',
+        b"[]",
+        b'"text"',
+    ],
+)
+async def test_incremental_decode_matches_json(raw: bytes) -> None:
+    """Test that the element-wise decoder gives the same result as json."""
+    assert await responses.loads_incremental(raw) == json.loads(raw)
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [b'{"a": 1,}', b'{"a" 1}', b"{1: 2}", b"[1 2]", b"[1] x", b'{"a": [1'],
+)
+async def test_incremental_decode_rejects_invalid_json(raw: bytes) -> None:
+    """Test that malformed bodies raise like json does."""
+    with pytest.raises(ValueError):  # noqa: PT011
+        await responses.loads_incremental(raw)
+
+
+async def test_large_device_list_does_not_stall_the_loop() -> None:
+    """Test that decoding a large device list leaves the event loop responsive."""
+    device = {
+        "friendlyName": "Living Room",
+        "productId": "0" * 32,
+        "cookie": "c" * 120,
+        "params": {f"param{i}": i for i in range(20)},
+    }
+    raw = _raw(
+        {
+            "status": 0,
+            "data": {
+                "endpoints": [{**device, "endpointId": str(i)} for i in range(5000)]
+            },
+        }
+    )
+    assert len(raw) >= responses.INCREMENTAL_MIN_SIZE
+
+    start = time.perf_counter()
+    expected = DeviceListResponse.decode(raw)
+    inline = time.perf_counter() - start
+
+    lags = []
+
+    async def tick() -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(0)
+            lags.append(time.perf_counter() - start)
+
+    ticker = asyncio.create_task(tick())
+    await asyncio.sleep(0)
+    listing = await DeviceListResponse.decode_async(raw)
+    ticker.cancel()
+
+    assert listing.endpoints == expected.endpoints
+    # Inline, the loop would have been blocked for the whole decode
+    assert len(lags) > 1
+    assert max(lags) < inline
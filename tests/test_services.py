@@ -0,0 +1,220 @@
+"""Tests for the Tornado AC services."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import device_registry as dr
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.tornado.aux_cloud import AuxCloudApiError
+from custom_components.tornado.aux_cloud.device_state import CONTROL_KEYS
+from custom_components.tornado.const import DOMAIN
+
+DEVICES = [
+    {
+        "endpointId": f"dev_{name}",
+        "friendlyName": name,
+        "params": {"pwr": 1, "ac_mode": 0, "temp": 240},
+    }
+    for name in ("a", "b", "c")
+]
+
+
+@pytest.fixture
+def mock_api() -> MagicMock:
+    """Create a mock AuxCloud API."""
+    api = MagicMock()
+    api.loginsession = "session"
+    api.login = AsyncMock()
+    api.refresh = AsyncMock()
+    api.cleanup = AsyncMock()
+    api.get_devices = AsyncMock(return_value=DEVICES)
+    api.bulk_set_device_params = AsyncMock(
+        side_effect=lambda devices, values: [values for _ in devices]
+    )
+    return api
+
+
+@pytest.fixture
+async def entry(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,  # noqa: ARG001
+    mock_api: MagicMock,
+) -> MockConfigEntry:
+    """Set up a config entry with three devices."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"email": "user@example.com", "password": "secret", "region": "eu"},
+    )
+    entry.add_to_hass(hass)
+    with patch("custom_components.tornado.AuxCloudAPI", return_value=mock_api):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    yield entry
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_bulk_set_writes_all_devices(
+    hass: HomeAssistant, entry: MockConfigEntry, mock_api: MagicMock
+) -> None:
+    """Test that one call writes every device and reports each result."""
+    mock_api.bulk_set_device_params.side_effect = lambda _devices, values: [
+        values,
+        AuxCloudApiError("Device offline"),
+        values,
+    ]
+
+    response = await hass.services.async_call(
+        DOMAIN, "bulk_set", {"params": {"pwr": 0}}, blocking=True, return_response=True
+    )
+
+    mock_api.bulk_set_device_params.assert_awaited_once()
+    devices, values = mock_api.bulk_set_device_params.await_args.args
+    assert [device.endpoint_id for device in devices] == ["dev_a", "dev_b", "dev_c"]
+    assert values == {"pwr": 0}
+    assert response == {
+        "results": [
+            {"endpoint_id": "dev_a", "success": True},
+            {"endpoint_id": "dev_b", "success": False, "error": "Device offline"},
+            {"endpoint_id": "dev_c", "success": True},
+        ]
+    }
+
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    assert [coordinator.data[d].pwr for d in ("dev_a", "dev_b", "dev_c")] == [0, 1, 0]
+    assert hass.states.get("climate.tornado_ac_a").state == "off"
+    assert hass.states.get("climate.tornado_ac_b").state == "cool"
+
+
+async def test_bulk_set_selected_devices(
+    hass: HomeAssistant,
+    entry: MockConfigEntry,  # noqa: ARG001
+    mock_api: MagicMock,
+) -> None:
+    """Test that only the selected devices are written, in the given order."""
+    registry = dr.async_get(hass)
+    device_ids = [
+        registry.async_get_device(identifiers={(DOMAIN, endpoint_id)}).id
+        for endpoint_id in ("dev_c", "dev_a")
+    ]
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "bulk_set",
+        {"device_id": device_ids, "params": {"temp": "220"}},
+        blocking=True,
+        return_response=True,
+    )
+
+    devices, values = mock_api.bulk_set_device_params.await_args.args
+    assert [device.endpoint_id for device in devices] == ["dev_c", "dev_a"]
+    assert values == {"temp": 220}
+    assert [result["endpoint_id"] for result in response["results"]] == [
+        "dev_c",
+        "dev_a",
+    ]
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            "bulk_set",
+            {"device_id": ["missing"], "params": {"pwr": 0}},
+            blocking=True,
+        )
+
+
+@pytest.mark.parametrize("params", [{"pwr": 2}, {"temp": 100}, {"pwr": 0, "turbo": 1}])
+async def test_bulk_set_rejects_invalid_params(
+    hass: HomeAssistant,
+    entry: MockConfigEntry,  # noqa: ARG001
+    mock_api: MagicMock,
+    params: dict[str, int],
+) -> None:
+    """Test that unknown or out-of-range params are rejected before writing."""
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN, "bulk_set", {"params": params}, blocking=True
+        )
+    mock_api.bulk_set_device_params.assert_not_awaited()
+
+
+async def test_snapshot_and_restore(
+    hass: HomeAssistant, entry: MockConfigEntry, mock_api: MagicMock
+) -> None:
+    """Test that a snapshot comes from the cache and restores in one write each."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    mock_api.get_devices.reset_mock()
+    mock_api.set_device_params = AsyncMock()
+
+    response = await hass.services.async_call(
+        DOMAIN, "snapshot", {"name": "peak"}, blocking=True, return_response=True
+    )
+
+    mock_api.get_devices.assert_not_awaited()
+    assert response == {
+        "devices": {
+            device["endpointId"]: {"pwr": 1, "ac_mode": 0, "temp": 240}
+            for device in DEVICES
+        },
+        "missing": {
+            device["endpointId"]: [
+                key for key in CONTROL_KEYS if key not in device["params"]
+            ]
+            for device in DEVICES
+        },
+    }
+
+    await hass.services.async_call(
+        DOMAIN, "bulk_set", {"params": {"pwr": 0, "temp": 260}}, blocking=True
+    )
+    mock_api.set_device_params.side_effect = [None, AuxCloudApiError("offline"), None]
+
+    response = await hass.services.async_call(
+        DOMAIN, "restore", {"name": "peak"}, blocking=True, return_response=True
+    )
+
+    assert [call.args[1] for call in mock_api.set_device_params.await_args_list] == [
+        {"pwr": 1, "temp": 240}
+    ] * len(DEVICES)
+    assert response["results"][1] == {
+        "endpoint_id": "dev_b",
+        "success": False,
+        "error": "offline",
+    }
+    assert [coordinator.data[d].temp for d in ("dev_a", "dev_b", "dev_c")] == [
+        240,
+        260,
+        240,
+    ]
+
+
+async def test_restore_selected_devices(
+    hass: HomeAssistant,
+    entry: MockConfigEntry,  # noqa: ARG001
+    mock_api: MagicMock,
+) -> None:
+    """Test restoring part of a snapshot, forced, and an unknown snapshot."""
+    mock_api.set_device_params = AsyncMock()
+    device_id = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, "dev_b")}).id
+    await hass.services.async_call(DOMAIN, "snapshot", {}, blocking=True)
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "restore",
+        {"device_id": [device_id], "force": True},
+        blocking=True,
+        return_response=True,
+    )
+
+    mock_api.set_device_params.assert_awaited_once()
+    device, params = mock_api.set_device_params.await_args.args
+    assert device.endpoint_id == "dev_b"
+    assert params == {"pwr": 1, "ac_mode": 0, "temp": 240}
+    assert response == {"results": [{"endpoint_id": "dev_b", "success": True}]}
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN, "restore", {"name": "missing"}, blocking=True
+        )
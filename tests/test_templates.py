@@ -0,0 +1,36 @@
+"""Tests for the pre-serialized request templates."""
+
+import json
+
+from custom_components.tornado.aux_cloud.templates import RequestTemplate, slot
+
+
+def test_render_matches_full_serialization() -> None:
+    """Test that a rendered template equals serializing the whole body."""
+    template = RequestTemplate(
+        {
+            "header": {"name": "KeyValueControl", "messageId": slot("messageId")},
+            "payload": {"act": slot("act"), "params": slot("params"), "did": "dé"},
+        },
+        key=("d",),
+    )
+    assert template.slots == ("messageId", "act", "params")
+
+    body = template.render(messageId='dev-1"', act="set", params=["pwr", "temp"])
+
+    assert (
+        body
+        == json.dumps(
+            {
+                "header": {"name": "KeyValueControl", "messageId": 'dev-1"'},
+                "payload": {"act": "set", "params": ["pwr", "temp"], "did": "dé"},
+            },
+            separators=(",", ":"),
+        ).encode()
+    )
+
+
+def test_template_without_slots() -> None:
+    """Test that a body without slots renders as is and ignores extra values."""
+    template = RequestTemplate({"payload": {}})
+    assert template.render(act="get") == b'{"payload":{}}'
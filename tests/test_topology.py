@@ -0,0 +1,36 @@
+"""Tests for the account topology fingerprint."""
+
+from custom_components.tornado.aux_cloud.topology import topology_fingerprint
+
+DEVICE = {
+    "endpointId": "dev1",
+    "devSession": "sess1",
+    "friendlyName": "Living Room",
+    "cookie": "cookie1",
+    "params": {"pwr": 1},
+}
+
+
+def test_fingerprint_ignores_order_and_params() -> None:
+    """Test that listing order and polled values do not change the fingerprint."""
+    other = {**DEVICE, "endpointId": "dev2"}
+    fingerprint = topology_fingerprint({"fam": [DEVICE, other], "empty": []})
+
+    assert fingerprint == topology_fingerprint(
+        {"empty": [], "fam": [other, {**DEVICE, "params": {"pwr": 0}}]}
+    )
+
+
+def test_fingerprint_tracks_identity_changes() -> None:
+    """Test that each identity field and the families change the fingerprint."""
+    fingerprints = {
+        topology_fingerprint({"fam": [DEVICE]}),
+        topology_fingerprint({"fam": [DEVICE], "new": []}),
+        topology_fingerprint({"other": [DEVICE]}),
+        topology_fingerprint({"fam": []}),
+        *(
+            topology_fingerprint({"fam": [{**DEVICE, key: "changed"}]})
+            for key in ("endpointId", "devSession", "friendlyName", "cookie")
+        ),
+    }
+    assert len(fingerprints) == 8  # noqa: PLR2004
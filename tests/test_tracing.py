@@ -0,0 +1,80 @@
+"""Tests for the AuxCloud tracing layer."""
+
+import logging
+
+import pytest
+
+from custom_components.tornado.aux_cloud import AuxCloudAPI
+from custom_components.tornado.aux_cloud.tracing import REDACTED, TRACER, Tracer
+
+RATE_LIMIT = 3
+
+
+@pytest.fixture
+def tracer() -> Tracer:
+    """Create a tracer on an isolated logger."""
+    logger = logging.getLogger("tests.trace")
+    logger.setLevel(logging.WARNING)
+    return Tracer(logger, max_events_per_second=RATE_LIMIT)
+
+
+def test_disabled_tracer_records_nothing(tracer: Tracer) -> None:
+    """Test that events are ignored while tracing is off."""
+    assert tracer.enabled is False
+    tracer.event("headers", loginsession="secret")
+    assert not tracer.events
+
+
+def test_events_are_compact_and_redacted(tracer: Tracer) -> None:
+    """Test that sensitive fields are masked and containers summarized."""
+    tracer.configure(enabled=True)
+    tracer.event(
+        "device",
+        endpoint="dev1",
+        cookie="c2VjcmV0",
+        devSession="sess",
+        params={"pwr": 1, "temp": 240},
+    )
+
+    _, name, fields = tracer.events[-1]
+    assert name == "device"
+    assert fields == {
+        "endpoint": "dev1",
+        "cookie": REDACTED,
+        "devSession": REDACTED,
+        "params": "<dict:2>",
+    }
+
+
+def test_rate_limit_per_event(tracer: Tracer) -> None:
+    """Test that a chatty event cannot flood the buffer."""
+    tracer.configure(enabled=True)
+    for _ in range(RATE_LIMIT * 4):
+        tracer.event("poll")
+    tracer.event("other")
+
+    names = [name for _, name, _ in tracer.events]
+    assert names.count("poll") == RATE_LIMIT
+    assert names.count("other") == 1
+    assert tracer.dropped == RATE_LIMIT * 3
+
+
+def test_sampling_drops_events(tracer: Tracer) -> None:
+    """Test that a zero sample rate records nothing."""
+    tracer.configure(enabled=True, sample_rate=0.0)
+    tracer.event("poll")
+    assert not tracer.events
+    assert tracer.dropped == 1
+
+
+def test_headers_trace_does_not_leak_session() -> None:
+    """Test that header tracing never records the login session."""
+    api = AuxCloudAPI("test@example.com", "password", region="eu")
+    api.loginsession = "super-secret-session"
+    TRACER.configure(enabled=True)
+    try:
+        api._get_headers(familyid="fam1")
+    finally:
+        TRACER.configure(enabled=False)
+
+    assert all("super-secret-session" not in repr(event) for event in TRACER.events)